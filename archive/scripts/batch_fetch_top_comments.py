@@ -2,14 +2,21 @@
 """
 Batch fetch comments from top posts across multiple subreddits.
 Identifies top posts by total engagement (upvotes + comments).
+
+Comments are fetched in-process over a small thread pool sharing one pooled
+client, so the batch pays for interpreter startup and TLS setup once.
 """
 
 import json
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import subprocess
-import time
+
+from fetch_reddit_comments import fetch_comments, require_client, save_comments
+
+DEFAULT_WORKERS = 4
+COMMENTS_PER_POST = 5
 
 def get_top_posts(data_file, top_n=5):
     """Get top N posts from a subreddit data file by total engagement."""
@@ -27,9 +34,44 @@ def get_top_posts(data_file, top_n=5):
 
     return posts[:top_n]
 
+def fetch_post_comments(post_info, client, amount=COMMENTS_PER_POST):
+    """Fetch and save trimmed comments for one post; returns fetch_comments' result plus 'filepath'."""
+    result = fetch_comments(post_info['url'], amount=amount, trim=True, client=client)
+    if result['success']:
+        result['filepath'] = save_comments(result['data'], post_info['url'], post_info['subreddit'])
+    return result
+
+def batch_fetch_comments(all_posts, workers=DEFAULT_WORKERS, amount=COMMENTS_PER_POST):
+    """
+    Fetch comments for every post with up to `workers` requests in flight.
+    Returns one result dict per post, in input order.
+    """
+    client = require_client()
+    results = [None] * len(all_posts)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_post_comments, post_info, client, amount): i
+                   for i, post_info in enumerate(all_posts)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            post_info = all_posts[i]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            results[i] = result
+
+            print(f"[{done}/{len(all_posts)}] r/{post_info['subreddit']}: {post_info['title'][:50]}...")
+            if result['success']:
+                print(f"  ✓ {result['count']} comments saved to {result['filepath']}")
+            else:
+                print(f"  ❌ Failed to fetch comments (status {result.get('status_code', 'unknown')}): {result.get('error')}")
+    return results
+
 def main():
     parser = argparse.ArgumentParser(description='Batch fetch comments from top Reddit posts')
     parser.add_argument('--yes', '-y', action='store_true', help='Skip confirmation prompt')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Posts to fetch comments for in parallel (default: {DEFAULT_WORKERS})')
     args = parser.parse_args()
 
     # Define data files for each subreddit
@@ -85,34 +127,15 @@ def main():
     else:
         print("Auto-proceeding (--yes flag set)...")
 
-    # Fetch comments for each post
-    success_count = 0
-    failed_posts = []
-
-    for i, post_info in enumerate(all_posts, 1):
-        print(f"\n[{i}/{len(all_posts)}] Processing r/{post_info['subreddit']}: {post_info['title'][:50]}...")
-
-        cmd = [
-            'python', 'scripts/fetch_reddit_comments.py',
-            '--url', post_info['url'],
-            '--amount', '5',
-            '--trim',
-            '--subreddit', post_info['subreddit']
-        ]
-
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            print(result.stdout)
-            success_count += 1
-
-            # Rate limiting - small delay between requests
-            if i < len(all_posts):
-                time.sleep(1)
-
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to fetch comments")
-            print(e.stderr)
-            failed_posts.append(post_info['subreddit'] + ": " + post_info['title'][:30])
+    # Fetch comments for all posts in parallel
+    print()
+    results = batch_fetch_comments(all_posts, workers=args.workers)
+    success_count = sum(1 for result in results if result['success'])
+    failed_posts = [
+        post_info['subreddit'] + ": " + post_info['title'][:30]
+        for post_info, result in zip(all_posts, results) if not result['success']
+    ]
+    credits_used = sum(result.get('cost', 0) for result in results if result['success'])
 
     # Final summary
     print(f"\n{'='*80}")
@@ -123,7 +146,7 @@ def main():
         print(f"✗ Failed: {len(failed_posts)}")
         for failed in failed_posts:
             print(f"  - {failed}")
-    print(f"Total credits used: ~{success_count}")
+    print(f"Total credits used: ~{credits_used}")
     print(f"{'='*80}\n")
 
     return 0 if len(failed_posts) == 0 else 1
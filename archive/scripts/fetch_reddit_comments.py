@@ -6,70 +6,65 @@ Usage:
     python fetch_reddit_comments.py --url <post_url> [--amount 5] [--trim]
 """
 
-import requests
 import json
 import argparse
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
-# API configuration
-API_KEY = os.getenv('SOCIAVAULT_API_KEY')
-if not API_KEY:
-    raise ValueError("SOCIAVAULT_API_KEY environment variable not set")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from sociavault_client import get_client
 
-BASE_URL = "https://api.sociavault.com"
-HEADERS = {
-    "X-API-Key": API_KEY,
-    "Content-Type": "application/json"
-}
+COMMENTS_ENDPOINT = "scrape/reddit/post/comments/simple"
+
+
+def require_client():
+    """Shared pooled client; raises if SOCIAVAULT_API_KEY is not set."""
+    api_key = os.getenv('SOCIAVAULT_API_KEY')
+    if not api_key:
+        raise ValueError("SOCIAVAULT_API_KEY environment variable not set")
+    return get_client(api_key)
 
 def check_credits():
     """Check available API credits."""
-    url = f"{BASE_URL}/v1/account/credits"
-    response = requests.get(url, headers=HEADERS)
-
-    if response.status_code == 200:
-        data = response.json()
-        credits = data.get('credits', 0)
+    credits = require_client().check_credits()
+    if credits is not None:
         print(f"Available credits: {credits}")
-        return credits
     else:
-        print(f"Warning: Could not check credits (status {response.status_code})")
-        return None
+        print("Warning: Could not check credits")
+    return credits
 
-def fetch_comments(post_url, amount=5, trim=False):
+def fetch_comments(post_url, amount=5, trim=False, client=None):
     """
     Fetch comments from a Reddit post.
 
+    Safe to call from several threads at once: requests go through the
+    shared client's pooled session, rate limiter and response cache.
+
     Args:
         post_url: Full URL to Reddit post
         amount: Number of comments to fetch (default: 5)
         trim: Use trimmed response format (default: False)
+        client: SociaVaultClient to use (default: the shared client)
 
     Returns:
         dict with 'success', 'data', 'cost'
     """
-    url = f"{BASE_URL}/v1/scrape/reddit/post/comments/simple"
-
     params = {
         "url": post_url,
         "amount": amount,
         "trim": str(trim).lower()
     }
 
-    print(f"\nFetching {amount} comments from post...")
-    print(f"URL: {post_url}")
-    print(f"Parameters: amount={amount}, trim={trim}")
-
-    response = requests.get(url, headers=HEADERS, params=params)
+    response = (client or require_client()).get(COMMENTS_ENDPOINT, params=params)
 
     if response.status_code == 200:
         comments = response.json()
 
         # Calculate cost (1 credit per 48 items, minimum 1)
         # For amounts <= 48, cost is 1 credit
-        cost = max(1, -(-amount // 48))  # Ceiling division
+        cost = 0 if response.from_cache else max(1, -(-amount // 48))  # Ceiling division
 
         return {
             'success': True,
@@ -144,6 +139,9 @@ def main():
     check_credits()
 
     # Fetch comments
+    print(f"\nFetching {args.amount} comments from post...")
+    print(f"URL: {args.url}")
+    print(f"Parameters: amount={args.amount}, trim={args.trim}")
     result = fetch_comments(args.url, amount=args.amount, trim=args.trim)
 
     if result['success']:
@@ -22,11 +22,13 @@ BASIC USAGE:
     python fetch_stock_social_data.py --ticker AAPL --days 7           # Last week
     python fetch_stock_social_data.py --tickers TSLA AAPL NVDA         # Multiple tickers
     python fetch_stock_social_data.py --ticker MSFT --min-score 100    # High engagement only
+    python fetch_stock_social_data.py --ticker NVDA --days 30 7 1      # Several windows, one fetch
 
 PARAMETERS:
     --ticker         Single stock ticker (e.g., TSLA, AAPL, NVDA)
     --tickers        Multiple stock tickers space-separated
-    --days           Number of days to look back (default: 14)
+    --days           Number of days to look back (default: 14); several
+                     values give one result per window
     --min-score      Minimum post score/upvotes (default: 50)
     --min-comments   Minimum number of comments (default: 10)
     --max-results    Maximum posts per ticker (default: 50)
@@ -39,14 +41,25 @@ FILTERING LOGIC:
 
     This ensures we capture both highly upvoted AND highly discussed posts.
 
+TIMEFRAME:
+    Each subreddit is listed with the narrowest Reddit timeframe covering
+    --days (hour, day, week, month, year, all) and filtered locally to the
+    exact window. A listing already fetched in this run for a wider
+    timeframe serves any narrower window from memory. That saves credits but
+    is lossy: a wider top listing is the top posts of the wider period, so
+    "--days 30 7 1" can give a smaller 1-day result than "--days 1" alone.
+    Each result records the listing timeframe that served it
+    (listing_timeframes).
+
 OUTPUT:
     - Terminal: Formatted display with post title, stats, URL, body preview
     - File: data/stocks/{TICKER}/reddit_{timestamp}.json
+      (reddit_{days}d_{timestamp}.json when several --days are given)
 
 API COST:
     - Credit check: 0 credits
-    - Per ticker: 3 credits (1 per subreddit)
-    - Example: 5 tickers = 15 credits = $0.072
+    - Per run: 3 credits (1 per subreddit), however many tickers and windows
+    - Each subreddit listing is fetched once and shared by all tickers
 
 EXAMPLE OUTPUT:
     data/stocks/TSLA/reddit_2026-02-01_15-30-45.json
@@ -54,7 +67,7 @@ EXAMPLE OUTPUT:
 FEATURES:
     - Smart engagement filtering (quality over quantity)
     - Date range filtering (get exactly N days of data)
-    - Ticker-to-company name mapping for better search results
+    - Ticker universe with company names and aliases (scripts/ticker_universe.py)
     - Rich terminal formatting with stats
     - Automatic data organization by ticker
     - Retry logic with exponential backoff
@@ -71,7 +84,7 @@ import sys
 import json
 import time
 import argparse
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -84,11 +97,18 @@ except ImportError:
     print("Error: requests not installed. Please run: pip install requests rich")
     sys.exit(1)
 
+# Shared client (rate limiting, ledger) lives in the top-level scripts/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from sociavault_client import get_client
+from ticker_matcher import TickerMatcher
+from ticker_universe import load_universe
+from filter_pipeline import COST_TEXT, COST_TIMESTAMP, FilterPipeline, describe, top_n
+from timestamps import cutoff_days, since, to_epoch
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
-SOCIAVAULT_BASE_URL = "https://api.sociavault.com/v1"
 DEFAULT_DAYS = 14  # 2 weeks
 DEFAULT_MIN_SCORE = 50  # Minimum upvotes to be considered
 DEFAULT_MIN_COMMENTS = 10  # Minimum comments to be considered
@@ -100,22 +120,14 @@ RETRY_DELAY = 2
 # Target subreddits for stock discussions
 TARGET_SUBREDDITS = ["stocks", "ValueInvesting", "options"]
 
-# Ticker to company name mapping for better search results
-TICKER_MAPPING = {
-    "TSLA": "Tesla",
-    "AAPL": "Apple",
-    "NVDA": "NVIDIA",
-    "MSFT": "Microsoft",
-    "AMZN": "Amazon",
-    "GOOGL": "Google",
-    "META": "Meta",
-    "AMD": "AMD",
-    "PLTR": "Palantir",
-    "GME": "GameStop",
-    "SPY": "S&P 500",
-    "QQQ": "NASDAQ",
-    "VOO": "Vanguard S&P 500",
-}
+# Reddit listing timeframes, narrowest first, with the days each one covers
+TIMEFRAMES = [("hour", 1 / 24), ("day", 1), ("week", 7), ("month", 30), ("year", 365), ("all", float("inf"))]
+TIMEFRAME_RANK = {name: rank for rank, (name, _) in enumerate(TIMEFRAMES)}
+
+
+def timeframe_for_days(days: float) -> str:
+    """Narrowest listing timeframe that covers the last `days` days."""
+    return next(name for name, span in TIMEFRAMES if span >= days)
 
 # ============================================================================
 # API CLIENT
@@ -127,18 +139,33 @@ class SociaVaultClient:
     def __init__(self, api_key: str):
         """Initialize client with API key."""
         self.api_key = api_key
-        self.headers = {
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        }
+        # Requests go through the shared client's host-wide rate limiter
+        self.client = get_client(api_key)
+        # (subreddit, sort) -> (timeframe, response): widest listing this run
+        self._listings = {}
+        self.listing_requests = 0
+
+    def cached_listing(self, subreddit: str, timeframe: str, sort: str = "top"):
+        """
+        Response of a listing already fetched this run whose timeframe covers
+        `timeframe` (the same or wider), else None.
+
+        A wider top listing holds the window's posts down to its own score
+        cut-off; callers filter it by date.
+        """
+        cached = self._listings.get((subreddit, sort))
+        if cached and TIMEFRAME_RANK.get(cached[0], -1) >= TIMEFRAME_RANK.get(timeframe, len(TIMEFRAMES)):
+            return cached[1]
+        return None
+
+    def listing_timeframes(self, subreddits, sort: str = "top") -> dict:
+        """{subreddit: timeframe} of the listings held this run, i.e. the ones serving the last window."""
+        return {subreddit: self._listings[(subreddit, sort)][0]
+                for subreddit in subreddits if (subreddit, sort) in self._listings}
 
     def check_credits(self):
         """Check available API credits (costs 0 credits)."""
-        response = requests.get(
-            f"{SOCIAVAULT_BASE_URL}/credits",
-            headers=self.headers,
-            timeout=REQUEST_TIMEOUT
-        )
+        response = self.client.get("credits", timeout=REQUEST_TIMEOUT, use_cache=False)
         response.raise_for_status()
         return response.json()
 
@@ -146,6 +173,9 @@ class SociaVaultClient:
         """
         Fetch posts from a specific subreddit with retry logic.
 
+        Served from memory when this run already fetched a listing of the
+        subreddit covering `timeframe` (see cached_listing).
+
         Args:
             subreddit: Subreddit name (without r/ prefix)
             timeframe: Time period (hour, day, week, month, year, all)
@@ -157,6 +187,10 @@ class SociaVaultClient:
         Raises:
             Exception: If the request fails after all retries
         """
+        cached = self.cached_listing(subreddit, timeframe, sort)
+        if cached is not None:
+            return cached
+
         params = {
             "subreddit": subreddit,
             "timeframe": timeframe,
@@ -167,27 +201,19 @@ class SociaVaultClient:
         # Retry logic with exponential backoff
         for attempt in range(MAX_RETRIES):
             try:
-                response = requests.get(
-                    f"{SOCIAVAULT_BASE_URL}/scrape/reddit/subreddit",
-                    headers=self.headers,
-                    params=params,
-                    timeout=REQUEST_TIMEOUT
-                )
+                response = self.client.get("scrape/reddit/subreddit", params=params, timeout=REQUEST_TIMEOUT)
 
-                # Handle rate limiting (429) with retry
+                # The shared client has already honoured Retry-After and retried
                 if response.status_code == 429:
-                    if attempt < MAX_RETRIES - 1:
-                        delay = RETRY_DELAY * (2 ** attempt)
-                        print(f"  ⚠️  Rate limit hit (attempt {attempt + 1}/{MAX_RETRIES})")
-                        print(f"  ⏳ Waiting {delay}s before retry...")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        raise Exception(f"API rate limit exceeded after {MAX_RETRIES} retries.")
+                    raise Exception("API rate limit exceeded after retries.")
 
                 # Raise for other HTTP errors
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                self.listing_requests += 1
+                if self.cached_listing(subreddit, timeframe, sort) is None:
+                    self._listings[(subreddit, sort)] = (timeframe, data)
+                return data
 
             except requests.exceptions.HTTPError as e:
                 if response.status_code == 401:
@@ -196,8 +222,6 @@ class SociaVaultClient:
                     raise Exception("Insufficient credits. Please check your SociaVault account.")
                 elif response.status_code == 403:
                     raise Exception("Access forbidden. Your API key may not have access to this endpoint.")
-                elif response.status_code == 429:
-                    continue
                 else:
                     raise Exception(f"API request failed with status {response.status_code}: {str(e)}")
             except requests.exceptions.Timeout:
@@ -220,6 +244,10 @@ class SociaVaultClient:
 
 
 
+def post_created_utc(post: dict):
+    return post.get('created_utc')
+
+
 def filter_posts_by_date(posts: list, days: int) -> list:
     """
     Filter posts to only include those from the last N days.
@@ -231,14 +259,7 @@ def filter_posts_by_date(posts: list, days: int) -> list:
     Returns:
         Filtered list of posts
     """
-    cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
-
-    filtered = [
-        post for post in posts
-        if post.get('created_utc', 0) >= cutoff_timestamp
-    ]
-
-    return filtered
+    return since(posts, cutoff_days(days), post_created_utc)
 
 
 def filter_posts_by_engagement(posts: list, min_score: int, min_comments: int) -> list:
@@ -257,45 +278,66 @@ def filter_posts_by_engagement(posts: list, min_score: int, min_comments: int) -
     Returns:
         Filtered list of posts
     """
-    filtered = [
-        post for post in posts
-        if post.get('score', 0) >= min_score or post.get('num_comments', 0) >= min_comments
-    ]
+    return [post for post in posts if is_engaging(post, min_score, min_comments)]
 
-    return filtered
+
+def is_engaging(post: dict, min_score: int, min_comments: int) -> bool:
+    return post.get('score', 0) >= min_score or post.get('num_comments', 0) >= min_comments
+
+
+def post_score(post: dict) -> int:
+    """Ranking key: highest score first."""
+    return post.get('score', 0)
+
+
+def build_post_filters(days: int, min_score: int, min_comments: int) -> FilterPipeline:
+    """
+    Date and engagement filters shared by every ticker.
+
+    Pushed down to the listing request: the ranking by score as sort=top,
+    and the window as the narrowest timeframe covering it, so each listing
+    holds the best-scored posts of as short a period as possible.
+    """
+    cutoff = cutoff_days(days)
+
+    def is_recent(post):
+        created = to_epoch(post_created_utc(post))
+        return created is not None and created >= cutoff
+
+    return (FilterPipeline(params={"sort": "top"})
+            .where("date", is_recent, cost=COST_TIMESTAMP, params={"timeframe": timeframe_for_days(days)})
+            .where("engagement", lambda post: is_engaging(post, min_score, min_comments)))
+
+
+def post_text(post: dict) -> str:
+    """Title and body of a post, the text searched for ticker mentions."""
+    return f"{post.get('title') or ''}\n{post.get('selftext') or ''}"
+
+
+def build_ticker_matcher(tickers: list) -> TickerMatcher:
+    """One matcher for all requested tickers and their company names and aliases."""
+    return load_universe().matcher_for(tickers)
 
 
 def filter_posts_by_ticker(posts: list, ticker: str, company_name: str = "") -> list:
     """
     Filter posts to only include those that mention the ticker or company.
 
+    Matches $TICKER in any case, the bare ticker in capitals, or the company
+    name, on word boundaries (see ticker_matcher.py).
+
     Args:
         posts: List of post dictionaries
         ticker: Stock ticker symbol
-        company_name: Optional company name
+        company_name: Optional company name (default: the names and aliases
+                      in the ticker universe)
 
     Returns:
         Filtered list of posts that mention the ticker or company
     """
-    ticker_upper = ticker.upper()
-    ticker_lower = ticker.lower()
-
-    search_terms = [ticker_upper, ticker_lower, f"${ticker_upper}"]
-    if company_name:
-        search_terms.append(company_name.lower())
-
-    filtered = []
-    for post in posts:
-        title = post.get('title', '').lower()
-        selftext = post.get('selftext', '').lower()
-
-        # Check if any search term appears in title or body
-        for term in search_terms:
-            if term.lower() in title or term.lower() in selftext:
-                filtered.append(post)
-                break
-
-    return filtered
+    names = [company_name] if company_name else load_universe().names.get(ticker.upper(), [])
+    matcher = TickerMatcher({ticker.upper(): names})
+    return matcher.group(posts, post_text).get(ticker.upper(), [])
 
 
 def extract_posts_from_response(data: dict) -> list:
@@ -318,68 +360,93 @@ def extract_posts_from_response(data: dict) -> list:
     return posts
 
 
-def fetch_ticker_data(client: SociaVaultClient, ticker: str, days: int,
-                     min_score: int, min_comments: int, max_results: int, console: Console) -> dict:
+def fetch_subreddit_listings(client: SociaVaultClient, console: Console, params: dict = None) -> list:
     """
-    Fetch and filter Reddit posts for a specific ticker.
+    Fetch every target subreddit listing once (1 credit per subreddit).
+
+    The listings don't depend on the ticker, so a multi-ticker run fetches
+    them up front and filters the same posts for each ticker in memory.
 
     Args:
         client: SociaVaultClient instance
-        ticker: Stock ticker symbol
-        days: Number of days to look back
-        min_score: Minimum post score
-        min_comments: Minimum number of comments
-        max_results: Maximum posts to return
         console: Rich console object
+        params: Listing params pushed down from the filters (sort, timeframe)
 
     Returns:
-        Dictionary with ticker data and filtered posts
+        Combined list of posts from all target subreddits
     """
-    try:
-        company_name = TICKER_MAPPING.get(ticker.upper(), "")
-        all_posts = []
+    all_posts = []
 
-        # Fetch from each target subreddit (1 credit per subreddit = 3 credits total)
-        for subreddit in TARGET_SUBREDDITS:
-            try:
-                console.print(f"[cyan]  Fetching r/{subreddit}...[/cyan]")
+    # Default to the timeframe covering DEFAULT_DAYS; posts are filtered
+    # locally to the exact window
+    listing = {"timeframe": timeframe_for_days(DEFAULT_DAYS), "sort": "top"}
+    listing.update(params or {})
 
-                # Use month timeframe and filter locally for precise date control
-                data = client.fetch_subreddit_posts(subreddit, timeframe="month", sort="top")
+    for subreddit in TARGET_SUBREDDITS:
+        try:
+            if client.cached_listing(subreddit, **listing) is not None:
+                reused = client.listing_timeframes([subreddit], listing["sort"])[subreddit]
+                console.print(f"[cyan]  r/{subreddit}: reusing the timeframe={reused} listing fetched this run[/cyan]")
+            else:
+                console.print(f"[cyan]  Fetching r/{subreddit} (timeframe={listing['timeframe']})...[/cyan]")
+            data = client.fetch_subreddit_posts(subreddit, **listing)
 
-                # Extract posts
-                posts = extract_posts_from_response(data)
-                console.print(f"[dim]    Found {len(posts)} posts in r/{subreddit}[/dim]")
+            # Extract posts
+            posts = extract_posts_from_response(data)
+            console.print(f"[dim]    Found {len(posts)} posts in r/{subreddit}[/dim]")
 
-                all_posts.extend(posts)
+            all_posts.extend(posts)
 
-                # Small delay between subreddit fetches
-                if subreddit != TARGET_SUBREDDITS[-1]:
-                    time.sleep(0.5)
+        except Exception as e:
+            console.print(f"[yellow]    ⚠ Error fetching r/{subreddit}: {str(e)}[/yellow]")
+            continue
 
-            except Exception as e:
-                console.print(f"[yellow]    ⚠ Error fetching r/{subreddit}: {str(e)}[/yellow]")
-                continue
+    console.print(f"[dim]  Total posts from all subreddits: {len(all_posts)}[/dim]")
+    return all_posts
 
-        console.print(f"[dim]  Total posts from all subreddits: {len(all_posts)}[/dim]")
 
-        # Filter by ticker mention
-        posts = filter_posts_by_ticker(all_posts, ticker, company_name)
-        console.print(f"[dim]  After ticker filter: {len(posts)} posts[/dim]")
-
-        # Filter by date
-        posts = filter_posts_by_date(posts, days)
-        console.print(f"[dim]  After date filter ({days} days): {len(posts)} posts[/dim]")
-
-        # Filter by engagement
-        posts = filter_posts_by_engagement(posts, min_score, min_comments)
-        console.print(f"[dim]  After engagement filter: {len(posts)} posts[/dim]")
+def fetch_ticker_data(client: SociaVaultClient, ticker: str, days: int,
+                     min_score: int, min_comments: int, max_results: int, console: Console,
+                     all_posts: list = None, mentions: dict = None) -> dict:
+    """
+    Fetch and filter Reddit posts for a specific ticker.
 
-        # Sort by score (highest engagement first)
-        posts.sort(key=lambda p: p.get('score', 0), reverse=True)
+    Args:
+        client: SociaVaultClient instance
+        ticker: Stock ticker symbol
+        days: Number of days to look back
+        min_score: Minimum post score
+        min_comments: Minimum number of comments
+        max_results: Maximum posts to return
+        console: Rich console object
+        all_posts: Posts already fetched by fetch_subreddit_listings
+                   (fetched here if None)
+        mentions: {ticker: posts} that already passed the date and
+                  engagement filters, from one matcher run over the
+                  survivors for every ticker at once (filtered here if None)
 
-        # Limit results
-        posts = posts[:max_results]
+    Returns:
+        Dictionary with ticker data and filtered posts
+    """
+    try:
+        company_name = load_universe().company_name(ticker)
+
+        if mentions is not None:
+            # Already filtered: keep the best-scored mentions
+            matching = mentions.get(ticker.upper(), [])
+            posts = top_n(matching, max_results, post_score)
+            console.print(f"[dim]  {len(matching)} posts mention ${ticker}, kept top {len(posts)}[/dim]")
+        else:
+            filters = build_post_filters(days, min_score, min_comments)
+            if all_posts is None:
+                all_posts = fetch_subreddit_listings(client, console, params=filters.params)
+
+            # Date, engagement and ticker filters in one pass, text matching last
+            matcher = TickerMatcher({ticker.upper(): load_universe().names.get(ticker.upper(), [])})
+            filters = filters.where("ticker", lambda post: ticker.upper() in matcher.find(post_text(post)),
+                                    cost=COST_TEXT)
+            posts, stats = filters.run(all_posts, top=max_results, key=post_score)
+            console.print(f"[dim]  {describe(stats, 'posts')}[/dim]")
 
         console.print(f"[green]✓ {ticker}: {len(posts)} posts found[/green]")
 
@@ -392,7 +459,10 @@ def fetch_ticker_data(client: SociaVaultClient, ticker: str, days: int,
             "posts_count": len(posts),
             "posts": posts,
             "fetched_at": datetime.now().isoformat(),
-            "subreddits": TARGET_SUBREDDITS
+            "subreddits": TARGET_SUBREDDITS,
+            "timeframe": timeframe_for_days(days),
+            # Listing actually filtered; wider than timeframe when reused from a wider window
+            "listing_timeframes": client.listing_timeframes(TARGET_SUBREDDITS)
         }
 
     except Exception as e:
@@ -498,13 +568,14 @@ def display_ticker_results(ticker_data: dict, console: Console):
     console.print("\n" + "═" * console.width + "\n")
 
 
-def save_ticker_data(ticker_data: dict, console: Console):
+def save_ticker_data(ticker_data: dict, console: Console, label: str = ""):
     """
     Save ticker data to JSON file.
 
     Args:
         ticker_data: Ticker data dictionary
         console: Rich console object
+        label: Optional filename tag (e.g. "7d" when saving several windows)
     """
     ticker = ticker_data.get('ticker', 'UNKNOWN')
 
@@ -514,7 +585,7 @@ def save_ticker_data(ticker_data: dict, console: Console):
 
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = output_dir / f"reddit_{timestamp}.json"
+    filename = output_dir / f"reddit_{label + '_' if label else ''}{timestamp}.json"
 
     # Save data
     with open(filename, 'w', encoding='utf-8') as f:
@@ -541,8 +612,10 @@ def main():
     ticker_group.add_argument('--tickers', nargs='+', help='Multiple tickers (e.g., TSLA AAPL NVDA)')
 
     # Filter arguments
-    parser.add_argument('--days', type=int, default=DEFAULT_DAYS,
-                       help=f'Number of days to look back (default: {DEFAULT_DAYS})')
+    parser.add_argument('--days', type=int, nargs='+', default=[DEFAULT_DAYS],
+                       help=f'Number of days to look back; several values give one result per window, narrower '
+                            f'windows filtered from the widest window\'s top listings (fewer credits, but possibly '
+                            f'fewer posts than a separate run) (default: {DEFAULT_DAYS})')
     parser.add_argument('--min-score', type=int, default=DEFAULT_MIN_SCORE,
                        help=f'Minimum post score (default: {DEFAULT_MIN_SCORE})')
     parser.add_argument('--min-comments', type=int, default=DEFAULT_MIN_COMMENTS,
@@ -582,49 +655,59 @@ def main():
         available_credits = credits_info.get('credits', 'unknown')
         console.print(f"[green]✓ Available credits: {available_credits}[/green]\n")
 
-        # Warn if low on credits (3 credits per ticker)
-        required_credits = len(tickers) * 3
+        # Warn if low on credits (1 credit per subreddit, shared by all tickers)
+        required_credits = len(TARGET_SUBREDDITS)
         if isinstance(available_credits, (int, float)) and available_credits < required_credits:
             console.print(f"[yellow]⚠ Warning: Low credits. This operation requires {required_credits} credits.[/yellow]\n")
 
         # Display search parameters
         console.print("[cyan]Search Parameters:[/cyan]")
         console.print(f"  Tickers: {', '.join(tickers)}")
-        console.print(f"  Days back: {args.days}")
+        console.print(f"  Days back: {', '.join(str(d) for d in args.days)}")
         console.print(f"  Min score: {args.min_score}")
         console.print(f"  Min comments: {args.min_comments}")
         console.print(f"  Max results per ticker: {args.max_results}")
         console.print(f"  Target subreddits: r/{', r/'.join(TARGET_SUBREDDITS)}")
         console.print()
 
-        # Fetch data for each ticker
-        all_results = []
-        for ticker in tickers:
-            console.print(f"\n[bold cyan]Fetching ${ticker}...[/bold cyan]")
-
-            ticker_data = fetch_ticker_data(
-                client, ticker, args.days,
-                args.min_score, args.min_comments, args.max_results,
-                console
-            )
+        # Widest window first: narrower windows reuse its listings from memory
+        windows = sorted(set(args.days), reverse=True)
 
-            all_results.append(ticker_data)
+        all_results = []
+        for days in windows:
+            # Fetch each subreddit once, then filter it for every ticker
+            filters = build_post_filters(days, args.min_score, args.min_comments)
+            console.print(f"[bold cyan]Fetching subreddit listings ({days} days)...[/bold cyan]")
+            all_posts = fetch_subreddit_listings(client, console, params=filters.params)
+
+            # Date and engagement filters once for all tickers, then tag the
+            # survivors with every ticker they mention in one matcher pass
+            candidates, stats = filters.run(all_posts)
+            console.print(f"[dim]  {describe(stats, 'posts')}[/dim]")
+            mentions = build_ticker_matcher(tickers).group(candidates, post_text)
+
+            for ticker in tickers:
+                console.print(f"\n[bold cyan]Filtering ${ticker} ({days} days)...[/bold cyan]")
+
+                ticker_data = fetch_ticker_data(
+                    client, ticker, days,
+                    args.min_score, args.min_comments, args.max_results,
+                    console, all_posts=all_posts, mentions=mentions
+                )
 
-            # Display results
-            display_ticker_results(ticker_data, console)
+                all_results.append(ticker_data)
 
-            # Save to file
-            if not args.no_save:
-                save_ticker_data(ticker_data, console)
+                # Display results
+                display_ticker_results(ticker_data, console)
 
-            # Add delay between tickers to avoid rate limiting
-            if len(tickers) > 1 and ticker != tickers[-1]:
-                time.sleep(1)
+                # Save to file
+                if not args.no_save:
+                    save_ticker_data(ticker_data, console, label=f"{days}d" if len(windows) > 1 else "")
 
         # Summary
         console.print("\n" + "═" * console.width)
         console.print(f"\n[green]✓ Completed! Processed {len(tickers)} ticker(s)[/green]")
-        console.print(f"[dim]Total API credits used: {len(tickers) * 3}[/dim]")
+        console.print(f"[dim]Total API credits used: {client.listing_requests}[/dim]")
 
         total_posts = sum(len(r.get('posts', [])) for r in all_results)
         console.print(f"[dim]Total posts found: {total_posts}[/dim]\n")
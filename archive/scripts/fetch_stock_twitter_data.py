@@ -36,6 +36,7 @@ PARAMETERS:
     --min-likes      Minimum tweet likes (default: 10)
     --min-retweets   Minimum retweets (default: 5)
     --max-results    Maximum tweets per ticker (default: 50)
+    --workers        Account timelines fetched in parallel (default: 8)
     --save           Save results to JSON file (default: True)
 
 FILTERING LOGIC:
@@ -50,8 +51,8 @@ OUTPUT:
 
 API COST:
     - Credit check: 0 credits
-    - Per ticker: 5-8 credits (fetches from 5-8 influential accounts)
-    - Example: 1 ticker = ~6 credits = $0.029
+    - 1 credit per account timeline, each fetched once per run
+    - Example: 1 ticker = ~10 credits; 3 tickers share the 8 news accounts = ~14
 
 EXAMPLE OUTPUT:
     data/stocks/TSLA/twitter_2026-02-01_15-30-45.json
@@ -77,7 +78,8 @@ import sys
 import json
 import time
 import argparse
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -90,15 +92,23 @@ except ImportError:
     print("Error: requests not installed. Please run: pip install requests rich")
     sys.exit(1)
 
+# Shared client (rate limiting, ledger) lives in the top-level scripts/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from sociavault_client import get_client
+from ticker_matcher import TickerMatcher
+from ticker_universe import load_universe
+from filter_pipeline import COST_TEXT, FilterPipeline, describe
+from timestamps import cutoff_days, field_getter, since, to_epoch
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
-SOCIAVAULT_BASE_URL = "https://api.sociavault.com/v1"
 DEFAULT_DAYS = 7  # 1 week (Twitter moves faster than Reddit)
 DEFAULT_MIN_LIKES = 10  # Minimum likes to be considered
 DEFAULT_MIN_RETWEETS = 5  # Minimum retweets to be considered
 DEFAULT_MAX_RESULTS = 50  # Max tweets to return per ticker
+DEFAULT_WORKERS = 8  # Account timelines fetched in parallel
 REQUEST_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
 RETRY_DELAY = 2
@@ -138,18 +148,12 @@ class SociaVaultClient:
     def __init__(self, api_key: str):
         """Initialize client with API key."""
         self.api_key = api_key
-        self.headers = {
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        }
+        # Requests go through the shared client's host-wide rate limiter
+        self.client = get_client(api_key)
 
     def check_credits(self):
         """Check available API credits (costs 0 credits)."""
-        response = requests.get(
-            f"{SOCIAVAULT_BASE_URL}/credits",
-            headers=self.headers,
-            timeout=REQUEST_TIMEOUT
-        )
+        response = self.client.get("credits", timeout=REQUEST_TIMEOUT, use_cache=False)
         response.raise_for_status()
         return response.json()
 
@@ -174,23 +178,11 @@ class SociaVaultClient:
         # Retry logic with exponential backoff
         for attempt in range(MAX_RETRIES):
             try:
-                response = requests.get(
-                    f"{SOCIAVAULT_BASE_URL}/scrape/twitter/user-tweets",
-                    headers=self.headers,
-                    params=params,
-                    timeout=REQUEST_TIMEOUT
-                )
-
-                # Handle rate limiting (429) with retry
+                response = self.client.get("scrape/twitter/user-tweets", params=params, timeout=REQUEST_TIMEOUT)
+
+                # The shared client has already honoured Retry-After and retried
                 if response.status_code == 429:
-                    if attempt < MAX_RETRIES - 1:
-                        delay = RETRY_DELAY * (2 ** attempt)
-                        print(f"  ⚠️  Rate limit hit (attempt {attempt + 1}/{MAX_RETRIES})")
-                        print(f"  ⏳ Waiting {delay}s before retry...")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        raise Exception(f"API rate limit exceeded after {MAX_RETRIES} retries.")
+                    raise Exception("API rate limit exceeded after retries.")
 
                 # Raise for other HTTP errors
                 response.raise_for_status()
@@ -203,8 +195,6 @@ class SociaVaultClient:
                     raise Exception("Insufficient credits. Please check your SociaVault account.")
                 elif response.status_code == 403:
                     raise Exception("Access forbidden. Your API key may not have access to this endpoint.")
-                elif response.status_code == 429:
-                    continue
                 else:
                     raise Exception(f"API request failed with status {response.status_code}: {str(e)}")
             except requests.exceptions.Timeout:
@@ -225,39 +215,25 @@ class SociaVaultClient:
 # DATA PROCESSING
 # ============================================================================
 
-def filter_tweets_by_date(tweets: list, days: int) -> list:
+# Tweets carry created_at under legacy (Twitter's own "Wed Oct 10 20:19:24
+# +0000 2018" format) or flattened at the top level (ISO 8601 or epoch)
+tweet_created_at = field_getter('legacy.created_at', 'created_at')
+
+
+def filter_tweets_by_date(tweets: list, days: int, newest_first: bool = False) -> list:
     """
     Filter tweets to only include those from the last N days.
 
     Args:
         tweets: List of tweet dictionaries
         days: Number of days to look back
+        newest_first: True for a single account timeline, which the API
+                      returns newest first: reading stops at the cutoff
 
     Returns:
         Filtered list of tweets
     """
-    cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
-
-    filtered = []
-    for tweet in tweets:
-        # Twitter API returns created_at as a timestamp or date string
-        created_at = tweet.get('created_at', 0)
-
-        # Handle different date formats
-        if isinstance(created_at, str):
-            try:
-                # Try parsing ISO format
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                tweet_timestamp = dt.timestamp()
-            except:
-                continue
-        else:
-            tweet_timestamp = created_at
-
-        if tweet_timestamp >= cutoff_timestamp:
-            filtered.append(tweet)
-
-    return filtered
+    return since(tweets, cutoff_days(days), tweet_created_at, newest_first=newest_first)
 
 
 def filter_tweets_by_engagement(tweets: list, min_likes: int, min_retweets: int) -> list:
@@ -276,17 +252,26 @@ def filter_tweets_by_engagement(tweets: list, min_likes: int, min_retweets: int)
     Returns:
         Filtered list of tweets
     """
-    filtered = []
-    for tweet in tweets:
-        # Get engagement metrics from the legacy field or top level
-        legacy = tweet.get('legacy', {})
-        likes = legacy.get('favorite_count', 0) or tweet.get('favorite_count', 0)
-        retweets = legacy.get('retweet_count', 0) or tweet.get('retweet_count', 0)
+    return [tweet for tweet in tweets if is_engaging(tweet, min_likes, min_retweets)]
 
-        if likes >= min_likes or retweets >= min_retweets:
-            filtered.append(tweet)
 
-    return filtered
+def tweet_counts(tweet: dict) -> tuple:
+    """(likes, retweets) from the legacy field or top level."""
+    legacy = tweet.get('legacy', {})
+    likes = legacy.get('favorite_count', 0) or tweet.get('favorite_count', 0)
+    retweets = legacy.get('retweet_count', 0) or tweet.get('retweet_count', 0)
+    return likes, retweets
+
+
+def is_engaging(tweet: dict, min_likes: int, min_retweets: int) -> bool:
+    likes, retweets = tweet_counts(tweet)
+    return likes >= min_likes or retweets >= min_retweets
+
+
+def tweet_engagement(tweet: dict) -> int:
+    """Ranking key: likes + retweets, retweets weighted higher."""
+    likes, retweets = tweet_counts(tweet)
+    return likes + (retweets * 2)
 
 
 def extract_tweets_from_response(data: dict) -> list:
@@ -310,10 +295,20 @@ def extract_tweets_from_response(data: dict) -> list:
     return tweets
 
 
+def tweet_text(tweet: dict) -> str:
+    """Full text of a tweet in either the legacy or flattened shape."""
+    legacy = tweet.get('legacy', {})
+    return legacy.get('full_text', '') or tweet.get('text', '') or tweet.get('full_text', '')
+
+
 def filter_tweets_by_ticker(tweets: list, ticker: str) -> list:
     """
     Filter tweets to only include those that mention the ticker.
 
+    Matches $TSLA or #TSLA in any case, bare TSLA in capitals, or the
+    company names and aliases from the ticker universe, on word boundaries
+    (see ticker_matcher.py).
+
     Args:
         tweets: List of tweet dictionaries
         ticker: Stock ticker symbol (e.g., TSLA)
@@ -321,36 +316,64 @@ def filter_tweets_by_ticker(tweets: list, ticker: str) -> list:
     Returns:
         Filtered list of tweets that mention the ticker
     """
-    ticker_upper = ticker.upper()
-    ticker_lower = ticker.lower()
-
-    # Search variations: TSLA, $TSLA, #TSLA, tsla
-    search_terms = [
-        ticker_upper,
-        ticker_lower,
-        f"${ticker_upper}",
-        f"#{ticker_upper}",
-        f"${ticker_lower}",
-        f"#{ticker_lower}",
-    ]
-
-    filtered = []
-    for tweet in tweets:
-        legacy = tweet.get('legacy', {})
-        text = legacy.get('full_text', '') or tweet.get('text', '') or tweet.get('full_text', '')
-        text_lower = text.lower()
+    mentions = ticker_predicate(ticker)
+    return [tweet for tweet in tweets if mentions(tweet)]
+
+
+def ticker_predicate(ticker: str):
+    """Predicate: does a tweet mention `ticker` (symbol, company name or alias)?"""
+    ticker = ticker.upper()
+    matcher = TickerMatcher({ticker: load_universe().names.get(ticker, [])})
+    return lambda tweet: ticker in matcher.find(tweet_text(tweet))
 
-        # Check if any search term appears in the tweet text
-        for term in search_terms:
-            if term.lower() in text_lower:
-                filtered.append(tweet)
-                break
 
-    return filtered
+def accounts_for_ticker(ticker: str) -> list:
+    """Financial news accounts plus the ticker's company/CEO accounts."""
+    return FINANCIAL_ACCOUNTS + TICKER_ACCOUNTS.get(ticker.upper(), [])
+
+
+def fetch_timelines(client: SociaVaultClient, handles: list, console: Console,
+                    workers: int = DEFAULT_WORKERS) -> dict:
+    """
+    Fetch each account's timeline once, up to `workers` at a time.
+
+    Handles are deduplicated case-insensitively, so accounts shared by
+    several tickers (all the news accounts, "Apple" vs "apple") cost one
+    request per run.
+
+    Args:
+        client: SociaVaultClient instance
+        handles: Twitter handles without @
+        console: Rich console object
+        workers: Timelines to fetch in parallel
+
+    Returns:
+        {handle.lower(): list of tweets, or None if the fetch failed}
+    """
+    unique = {}
+    for handle in handles:
+        unique.setdefault(handle.lower(), handle)
+
+    def fetch(handle):
+        try:
+            return extract_tweets_from_response(client.fetch_user_tweets(handle))
+        except Exception as e:
+            console.print(f"[yellow]    ⚠ Error fetching @{handle}: {str(e)}[/yellow]")
+            return None
+
+    console.print(f"[cyan]  Fetching {len(unique)} account timelines...[/cyan]")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = dict(zip(unique, pool.map(fetch, unique.values())))
+
+    for key, handle in unique.items():
+        if results[key] is not None:
+            console.print(f"[dim]    @{handle}: {len(results[key])} tweets[/dim]")
+    return results
 
 
 def fetch_ticker_data(client: SociaVaultClient, ticker: str, days: int,
-                     min_likes: int, min_retweets: int, max_results: int, console: Console) -> dict:
+                     min_likes: int, min_retweets: int, max_results: int, console: Console,
+                     timelines: dict = None) -> dict:
     """
     Fetch and filter Twitter posts for a specific ticker.
 
@@ -362,68 +385,41 @@ def fetch_ticker_data(client: SociaVaultClient, ticker: str, days: int,
         min_retweets: Minimum retweets
         max_results: Maximum tweets to return
         console: Rich console object
+        timelines: {handle.lower(): tweets} from fetch_timelines covering
+                   this ticker's accounts (fetched here if None)
 
     Returns:
         Dictionary with ticker data and filtered tweets
     """
     try:
         # Build list of accounts to check
-        accounts_to_check = FINANCIAL_ACCOUNTS.copy()
-
-        # Add ticker-specific accounts if available
-        ticker_accounts = TICKER_ACCOUNTS.get(ticker.upper(), [])
-        accounts_to_check.extend(ticker_accounts)
+        accounts_to_check = accounts_for_ticker(ticker)
 
         console.print(f"[cyan]  Checking {len(accounts_to_check)} accounts for ${ticker} mentions...[/cyan]")
 
+        if timelines is None:
+            timelines = fetch_timelines(client, accounts_to_check, console)
+
+        # Filter by date per timeline, while each one is still newest-first
         all_tweets = []
+        total_tweets = 0
         successful_fetches = 0
-
-        # Fetch from each account
-        for account in accounts_to_check:
-            try:
-                console.print(f"[dim]    Fetching @{account}...[/dim]", end=" ")
-
-                data = client.fetch_user_tweets(account)
-                tweets = extract_tweets_from_response(data)
-
-                console.print(f"[dim]{len(tweets)} tweets[/dim]")
-                all_tweets.extend(tweets)
+        for key in dict.fromkeys(account.lower() for account in accounts_to_check):
+            if timelines.get(key) is not None:
+                total_tweets += len(timelines[key])
+                all_tweets.extend(filter_tweets_by_date(timelines[key], days, newest_first=True))
                 successful_fetches += 1
 
-                # Small delay between accounts
-                if account != accounts_to_check[-1]:
-                    time.sleep(0.5)
-
-            except Exception as e:
-                console.print(f"[yellow]⚠ Error[/yellow]")
-                continue
-
-        console.print(f"[dim]  Total tweets from {successful_fetches} accounts: {len(all_tweets)}[/dim]")
-
-        # Filter by ticker mention
-        tweets = filter_tweets_by_ticker(all_tweets, ticker)
-        console.print(f"[dim]  After ticker filter: {len(tweets)} tweets mention ${ticker}[/dim]")
-
-        # Filter by date
-        tweets = filter_tweets_by_date(tweets, days)
-        console.print(f"[dim]  After date filter ({days} days): {len(tweets)} tweets[/dim]")
+        console.print(f"[dim]  Total tweets from {successful_fetches} accounts: {total_tweets}[/dim]")
+        console.print(f"[dim]  After date filter ({days} days): {len(all_tweets)} tweets[/dim]")
 
-        # Filter by engagement
-        tweets = filter_tweets_by_engagement(tweets, min_likes, min_retweets)
-        console.print(f"[dim]  After engagement filter: {len(tweets)} tweets[/dim]")
-
-        # Sort by engagement (likes + retweets)
-        def get_engagement_score(tweet):
-            legacy = tweet.get('legacy', {})
-            likes = legacy.get('favorite_count', 0) or tweet.get('favorite_count', 0)
-            retweets = legacy.get('retweet_count', 0) or tweet.get('retweet_count', 0)
-            return likes + (retweets * 2)  # Weight retweets higher
-
-        tweets.sort(key=get_engagement_score, reverse=True)
-
-        # Limit results
-        tweets = tweets[:max_results]
+        # Engagement and ticker filters in one pass, text matching last,
+        # keeping the most engaging tweets in a bounded heap
+        filters = (FilterPipeline()
+                   .where("engagement", lambda tweet: is_engaging(tweet, min_likes, min_retweets))
+                   .where("ticker", ticker_predicate(ticker), cost=COST_TEXT))
+        tweets, stats = filters.run(all_tweets, top=max_results, key=tweet_engagement)
+        console.print(f"[dim]  {describe(stats, 'tweets')}[/dim]")
 
         console.print(f"[green]✓ ${ticker}: {len(tweets)} tweets found[/green]")
 
@@ -509,18 +505,12 @@ def display_ticker_results(ticker_data: dict, console: Console):
         username = user_legacy.get('screen_name', '') or tweet.get('username', 'unknown')
 
         # Get timestamp
-        created_at = legacy.get('created_at', '') or tweet.get('created_at', '')
-        if created_at:
-            try:
-                if isinstance(created_at, str):
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                else:
-                    dt = datetime.fromtimestamp(created_at)
-                tweet_date = dt.strftime("%b %d, %Y %H:%M")
-            except:
-                tweet_date = str(created_at)
+        created_at = tweet_created_at(tweet)
+        epoch = to_epoch(created_at)
+        if epoch is not None:
+            tweet_date = datetime.fromtimestamp(epoch).strftime("%b %d, %Y %H:%M")
         else:
-            tweet_date = "unknown"
+            tweet_date = str(created_at) if created_at else "unknown"
 
         # Display tweet number and text
         console.print(f"[bold cyan]{i}.[/bold cyan]")
@@ -603,6 +593,8 @@ def main():
                        help=f'Minimum retweets (default: {DEFAULT_MIN_RETWEETS})')
     parser.add_argument('--max-results', type=int, default=DEFAULT_MAX_RESULTS,
                        help=f'Maximum tweets per ticker (default: {DEFAULT_MAX_RESULTS})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help=f'Account timelines fetched in parallel (default: {DEFAULT_WORKERS})')
 
     # Output arguments
     parser.add_argument('--no-save', action='store_true',
@@ -636,8 +628,9 @@ def main():
         available_credits = credits_info.get('credits', 'unknown')
         console.print(f"[green]✓ Available credits: {available_credits}[/green]\n")
 
-        # Warn if low on credits (estimate 8 accounts per ticker)
-        estimated_credits = len(tickers) * 8
+        # Every account is fetched once, however many tickers share it
+        handles = [account for ticker in tickers for account in accounts_for_ticker(ticker)]
+        estimated_credits = len({handle.lower() for handle in handles})
         if isinstance(available_credits, (int, float)) and available_credits < estimated_credits:
             console.print(f"[yellow]⚠ Warning: Low credits. This operation may require up to {estimated_credits} credits.[/yellow]\n")
 
@@ -650,15 +643,19 @@ def main():
         console.print(f"  Max results per ticker: {args.max_results}")
         console.print()
 
-        # Fetch data for each ticker
+        # Fetch every account timeline once, concurrently, then filter the
+        # shared set for each ticker in memory
+        console.print("[bold cyan]Fetching account timelines...[/bold cyan]")
+        timelines = fetch_timelines(client, handles, console, workers=args.workers)
+
         all_results = []
         for ticker in tickers:
-            console.print(f"\n[bold cyan]Fetching ${ticker}...[/bold cyan]")
+            console.print(f"\n[bold cyan]Filtering ${ticker}...[/bold cyan]")
 
             ticker_data = fetch_ticker_data(
                 client, ticker, args.days,
                 args.min_likes, args.min_retweets, args.max_results,
-                console
+                console, timelines=timelines
             )
 
             all_results.append(ticker_data)
@@ -670,15 +667,11 @@ def main():
             if not args.no_save:
                 save_ticker_data(ticker_data, console)
 
-            # Add delay between tickers to avoid rate limiting
-            if len(tickers) > 1 and ticker != tickers[-1]:
-                time.sleep(1)
-
         # Summary
         console.print("\n" + "═" * console.width)
         console.print(f"\n[green]✓ Completed! Processed {len(tickers)} ticker(s)[/green]")
 
-        total_credits = sum(r.get('successful_fetches', 0) for r in all_results)
+        total_credits = sum(1 for tweets in timelines.values() if tweets is not None)
         console.print(f"[dim]Total API credits used: {total_credits}[/dim]")
 
         total_tweets = sum(len(r.get('tweets', [])) for r in all_results)
@@ -5,10 +5,14 @@ Tests AMZN with different query formats
 """
 
 import os
+import sys
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from timestamps import TimeColumn, cutoff_days
+
 API_KEY = os.getenv('SOCIAVAULT_API_KEY')
 if not API_KEY:
     raise ValueError("SOCIAVAULT_API_KEY environment variable not set")
@@ -44,11 +48,13 @@ def search_threads(query, trim=False):
         print("No posts found for this query")
         return data
 
-    # Analyze the posts
+    # Analyze the posts: parse taken_at once for all of them
     now = datetime.now()
-    one_month_ago = now - timedelta(days=30)
+    one_month_ago = cutoff_days(30, now)
+    dated = TimeColumn(posts, key=lambda p: p.get('taken_at'))
+    recent_posts = dated.since(one_month_ago)
+    recent_ids = {id(p) for p in recent_posts}
 
-    recent_posts = []
     stock_related = []
 
     print(f"\n📝 Post Analysis:")
@@ -66,9 +72,7 @@ def search_threads(query, trim=False):
         like_count = post.get('like_count', 0)
 
         # Check if from last month
-        is_recent = taken_at > one_month_ago
-        if is_recent:
-            recent_posts.append(post)
+        is_recent = id(post) in recent_ids
 
         # Basic check for stock-related content
         stock_keywords = ['stock', 'share', 'trading', 'invest', 'earnings', 'bull', 'bear', 'buy', 'sell']
@@ -92,11 +96,10 @@ def search_threads(query, trim=False):
     print(f"   Stock-related keywords: {len(stock_related)}")
 
     if len(posts) > 0:
-        oldest_post = min(posts, key=lambda p: p['taken_at'])
-        newest_post = max(posts, key=lambda p: p['taken_at'])
-        oldest_date = datetime.fromtimestamp(oldest_post['taken_at'])
-        newest_date = datetime.fromtimestamp(newest_post['taken_at'])
-        print(f"   Date range: {oldest_date.strftime('%Y-%m-%d')} to {newest_date.strftime('%Y-%m-%d')}")
+        if dated.range():
+            oldest, newest = dated.range()
+            print(f"   Date range: {datetime.fromtimestamp(oldest).strftime('%Y-%m-%d')} "
+                  f"to {datetime.fromtimestamp(newest).strftime('%Y-%m-%d')}")
         print(f"   Avg likes: {sum(p.get('like_count', 0) for p in posts) / len(posts):.0f}")
 
     return data
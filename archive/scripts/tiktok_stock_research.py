@@ -17,24 +17,42 @@ Examples:
 import os
 import sys
 import argparse
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+# Shared modules live in the top-level scripts/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from filter_pipeline import top_n
+from sentiment import get_scorer
+from social_store import DEFAULT_DB_PATH, SocialStore
+from sociavault_client import get_client
+from ticker_universe import load_universe
+
 API_KEY = os.getenv('SOCIAVAULT_API_KEY')
 if not API_KEY:
     raise ValueError("SOCIAVAULT_API_KEY environment variable not set")
 
-BASE_URL = "https://api.sociavault.com/v1/scrape/tiktok"
+SEARCH_ENDPOINT = "scrape/tiktok/search/keyword"
+VIDEO_INFO_ENDPOINT = "scrape/tiktok/video-info"
+
+# Video detail requests in flight at once; the shared client's adaptive
+# concurrency limit may hold it lower
+DEFAULT_WORKERS = 8
 
 
 class TikTokStockResearch:
     """TikTok stock research tool"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, db_path: Optional[str] = None, workers: int = DEFAULT_WORKERS):
         self.api_key = api_key
-        self.headers = {'X-API-Key': api_key}
+        # Pooled session with timeouts, rate limiting and response cache
+        self.client = get_client(api_key)
+        self.workers = max(1, workers)
+        # With a store, searches are incremental: videos already seen for a
+        # query are skipped and new ones are recorded
+        self.store = SocialStore(db_path) if db_path else None
 
     def search_videos(
         self,
@@ -53,10 +71,27 @@ class TikTokStockResearch:
             max_videos: Maximum number of videos to fetch
 
         Returns:
-            List of video objects
+            List of video objects (only unseen ones when a store is set)
         """
-        url = f"{BASE_URL}/search/keyword"
+        result = []
+        for videos in self.iter_search_pages(query, date_posted, sort_by, max_videos):
+            result.extend(videos)
+        self._record_search(result, query)
+        return result
 
+    def iter_search_pages(
+        self,
+        query: str,
+        date_posted: Optional[str] = None,
+        sort_by: str = "relevance",
+        max_videos: int = 20
+    ):
+        """
+        Yield each page of search results as soon as it arrives, so callers
+        can start work on page 1 while page 2 downloads. Same arguments as
+        search_videos; stops after max_videos have been read, including
+        videos skipped as already stored.
+        """
         params = {
             'query': query,
             'sort_by': sort_by
@@ -65,20 +100,23 @@ class TikTokStockResearch:
         if date_posted:
             params['date_posted'] = date_posted
 
-        all_videos = []
+        found = scanned = 0
         cursor = None
+        known_ids = self.store.known_ids('tiktok', query) if self.store else None
 
         print(f"🔍 Searching TikTok for: '{query}'")
         if date_posted:
             print(f"📅 Time filter: {date_posted}")
         print(f"📊 Fetching up to {max_videos} videos...")
+        if known_ids is not None:
+            print(f"🗂️  {len(known_ids)} videos already stored for this query")
 
-        while len(all_videos) < max_videos:
+        while scanned < max_videos:
             if cursor:
                 params['cursor'] = cursor
 
             try:
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self.client.get(SEARCH_ENDPOINT, params=params)
                 response.raise_for_status()
                 result = response.json()
 
@@ -109,8 +147,20 @@ class TikTokStockResearch:
                 if not videos:
                     break
 
-                all_videos.extend(videos)
-                print(f"   Found {len(all_videos)} videos so far...")
+                # Known videos count toward max_videos too, so an incremental
+                # run never pages further than a plain one
+                videos = videos[:max_videos - scanned]
+                scanned += len(videos)
+                if known_ids is not None:
+                    videos = [v for v in videos if v.get('aweme_id') not in known_ids]
+                    # Newest first: a page with nothing new means the rest is older
+                    if not videos and sort_by == 'date-posted':
+                        print("   Page contains only known videos, stopping.")
+                        break
+
+                found += len(videos)
+                print(f"   Found {found} videos so far...")
+                yield videos
 
                 # Get cursor for next page
                 cursor = data.get('cursor')
@@ -121,9 +171,11 @@ class TikTokStockResearch:
                 print(f"❌ Error searching: {e}")
                 break
 
-        result = all_videos[:max_videos]
-        print(f"✅ Retrieved {len(result)} videos\n")
-        return result
+    def _record_search(self, videos: List[Dict[str, Any]], query: str):
+        """Store the search results (incremental mode) and report the count."""
+        if self.store:
+            self.store.upsert_tiktok_videos(videos, query)
+        print(f"✅ Retrieved {len(videos)} {'new ' if self.store else ''}videos\n")
 
     def get_video_details(self, video_id: str, author_unique_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -139,16 +191,17 @@ class TikTokStockResearch:
         # Construct TikTok URL
         video_url = f"https://www.tiktok.com/@{author_unique_id}/video/{video_id}"
 
-        url = f"{BASE_URL}/video-info"
         params = {
             'url': video_url,
             'get_transcript': 'true'
         }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.client.get(VIDEO_INFO_ENDPOINT, params=params)
             response.raise_for_status()
+            # Details come wrapped in a "data" object
             data = response.json()
+            data = data.get('data', data)
 
             aweme_detail = data.get('aweme_detail', {})
 
@@ -177,57 +230,52 @@ class TikTokStockResearch:
 
         return ' '.join(text_lines)
 
-    def analyze_video_sentiment(self, video: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_sentiment(self, videos: List[Dict[str, Any]]) -> None:
         """
-        Analyze sentiment in video description and transcript
+        Add 'sentiment_analysis' for each video's description and transcript,
+        scoring the whole list in one batch (see scripts/sentiment.py).
 
         Args:
-            video: Video details dictionary
-
-        Returns:
-            Sentiment analysis results
+            videos: Video details dictionaries, updated in place
         """
-        # Keywords for sentiment analysis
-        bullish_keywords = [
-            'buy', 'bull', 'bullish', 'long', 'growth', 'profit', 'gain',
-            'opportunity', 'breakout', 'rally', 'surge', 'moon', 'rocket',
-            'upgrade', 'beat', 'outperform', 'strong', 'positive'
-        ]
-
-        bearish_keywords = [
-            'sell', 'bear', 'bearish', 'short', 'decline', 'loss', 'crash',
-            'risk', 'warning', 'downgrade', 'miss', 'weak', 'negative',
-            'overvalued', 'bubble', 'correction', 'downturn'
-        ]
-
-        # Combine all text for analysis
-        desc = (video.get('desc') or '').lower()
-        transcript = (video.get('transcript_text') or '').lower()
-
-        all_text = f"{desc} {transcript}"
-
-        # Count sentiment keywords
-        bullish_count = sum(1 for keyword in bullish_keywords if keyword in all_text)
-        bearish_count = sum(1 for keyword in bearish_keywords if keyword in all_text)
-
-        # Determine sentiment
-        if bullish_count > bearish_count:
-            sentiment = "bullish"
-            confidence = bullish_count / (bullish_count + bearish_count) if (bullish_count + bearish_count) > 0 else 0
-        elif bearish_count > bullish_count:
-            sentiment = "bearish"
-            confidence = bearish_count / (bullish_count + bearish_count) if (bullish_count + bearish_count) > 0 else 0
-        else:
-            sentiment = "neutral"
-            confidence = 0.5
+        texts, has_transcript = [], []
+        for video in videos:
+            transcript = video.get('transcript_text') or ''
+            texts.append(f"{video.get('desc') or ''} {transcript}")
+            has_transcript.append(bool(transcript))
+        for video, sentiment in zip(videos, get_scorer().score_batch(texts, has_transcript)):
+            video['sentiment_analysis'] = sentiment
+
+    def _tag_tickers(self, videos: List[Dict[str, Any]], ticker: str) -> int:
+        """
+        Record the tickers each video mentions (ticker universe matcher) and
+        return how many mention `ticker` itself.
+        """
+        universe = load_universe()
+        count = 0
+        for video in videos:
+            video['mentioned_tickers'] = sorted(universe.find(f"{video.get('desc') or ''} {video.get('transcript_text') or ''}"))
+            count += ticker.upper() in video['mentioned_tickers']
+        return count
+
+    def _enrich_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search result merged with its details; the original video if it
+        can't be identified or the details fetch fails.
+        """
+        # Extract necessary info from basic video object
+        video_id = video.get('aweme_id')
+        author_unique_id = video.get('author', {}).get('unique_id', '')
+        if not video_id or not author_unique_id:
+            return video
 
-        return {
-            'sentiment': sentiment,
-            'confidence': round(confidence, 2),
-            'bullish_signals': bullish_count,
-            'bearish_signals': bearish_count,
-            'has_transcript': len(transcript) > 0
-        }
+        details = self.get_video_details(video_id, author_unique_id)
+        if not details:
+            # Keep original if details fetch failed
+            return video
+
+        # Merge search result with detailed info
+        return {**video, **details}
 
     def research_stock(
         self,
@@ -259,71 +307,58 @@ class TikTokStockResearch:
             # Try both ticker formats: "#TSLA stock" and "$TSLA"
             query = f"#{ticker} stock"
 
-        # Search for videos
-        videos = self.search_videos(
-            query=query,
-            date_posted=time_period if time_period != "all_time" else None,
-            sort_by=sort_by,
-            max_videos=max_videos
-        )
-
-        if not videos:
-            print(f"❌ No videos found for '{query}'")
-            return {
-                'ticker': ticker,
-                'query': query,
-                'time_period': time_period,
-                'timestamp': datetime.now().isoformat(),
-                'videos': [],
-                'summary': {'total_videos': 0}
-            }
-
-        # Enrich with video details if requested
-        enriched_videos = []
-
-        if include_details:
-            print(f"📹 Fetching details for {len(videos)} videos...")
-            for i, video in enumerate(videos, 1):
-                # Extract necessary info from basic video object
-                video_id = video.get('aweme_id')
-                author = video.get('author', {})
-                author_unique_id = author.get('unique_id', '')
-
-                if not video_id or not author_unique_id:
-                    enriched_videos.append(video)
-                    continue
-
-                desc = video.get('desc', 'Unknown')
-                print(f"   [{i}/{len(videos)}] {desc[:60]}...")
-
-                details = self.get_video_details(video_id, author_unique_id)
-
-                if details:
-                    # Merge search result with detailed info
-                    enriched = {**video, **details}
-
-                    # Add sentiment analysis
-                    sentiment = self.analyze_video_sentiment(enriched)
-                    enriched['sentiment_analysis'] = sentiment
-
-                    enriched_videos.append(enriched)
-                else:
-                    # Keep original if details fetch failed
-                    enriched_videos.append(video)
-        else:
-            enriched_videos = videos
+        # Search for videos, queueing detail fetches page by page so
+        # enrichment of page 1 overlaps the download of page 2
+        videos, futures = [], []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for page in self.iter_search_pages(
+                query=query,
+                date_posted=time_period if time_period != "all_time" else None,
+                sort_by=sort_by,
+                max_videos=max_videos
+            ):
+                videos.extend(page)
+                if include_details:
+                    futures.extend(pool.submit(self._enrich_video, video) for video in page)
+            self._record_search(videos, query)
+
+            if not videos:
+                print(f"❌ No videos found for '{query}'")
+                return {
+                    'ticker': ticker,
+                    'query': query,
+                    'time_period': time_period,
+                    'timestamp': datetime.now().isoformat(),
+                    'videos': [],
+                    'summary': {'total_videos': 0}
+                }
+
+            # Enrich with video details if requested; results keep search order
+            if include_details:
+                print(f"📹 Fetching details for {len(videos)} videos ({self.workers} in parallel)...")
+                enriched_videos = [future.result() for future in futures]
+                detailed = [enriched for video, enriched in zip(videos, enriched_videos) if enriched is not video]
+                if len(detailed) < len(videos):
+                    print(f"   ⚠️  {len(videos) - len(detailed)} videos kept without details")
+                # Score sentiment once for the whole list rather than per fetch
+                self.analyze_sentiment(detailed)
+            else:
+                enriched_videos = videos
 
         # Generate summary statistics
         summary = self._generate_summary(enriched_videos, include_details)
+        summary['videos_mentioning_ticker'] = self._tag_tickers(enriched_videos, ticker)
 
         print(f"\n✅ Research complete!")
         print(f"   Total videos: {summary['total_videos']}")
         print(f"   Total views: {summary['total_views']:,}")
+        print(f"   Mentioning ${ticker}: {summary['videos_mentioning_ticker']}")
         if include_details and 'sentiment_breakdown' in summary:
             print(f"   Sentiment: {summary['sentiment_breakdown']}")
 
         return {
             'ticker': ticker,
+            'company_name': load_universe().company_name(ticker),
             'query': query,
             'time_period': time_period,
             'timestamp': datetime.now().isoformat(),
@@ -404,12 +439,22 @@ Examples:
     )
     parser.add_argument('--max-videos', type=int, default=20, help='Maximum videos to fetch (default: 20)')
     parser.add_argument('--no-details', action='store_true', help='Skip fetching video details and transcripts')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Video details to fetch in parallel (default: {DEFAULT_WORKERS})')
     parser.add_argument('--output', help='Output file path (default: data/tiktok/{ticker}_{timestamp}.json)')
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help=f'Skip videos already seen for this query (tracked in {DEFAULT_DB_PATH}), '
+             'still counting them toward --max-videos; with --sort-by date-posted, '
+             'stop paging at the first fully known page'
+    )
 
     args = parser.parse_args()
 
     # Initialize researcher
-    researcher = TikTokStockResearch(API_KEY)
+    researcher = TikTokStockResearch(API_KEY, db_path=DEFAULT_DB_PATH if args.incremental else None,
+                                     workers=args.workers)
 
     # Run research
     results = researcher.research_stock(
@@ -440,13 +485,9 @@ Examples:
     print(f"\n📊 Top 5 Videos by Views:")
     print("─" * 100)
 
-    sorted_videos = sorted(
-        results['videos'],
-        key=lambda v: v.get('statistics', {}).get('play_count', 0),
-        reverse=True
-    )
+    top_videos = top_n(results['videos'], 5, key=lambda v: v.get('statistics', {}).get('play_count', 0))
 
-    for i, video in enumerate(sorted_videos[:5], 1):
+    for i, video in enumerate(top_videos, 1):
         desc = video.get('desc', 'No description')
         stats = video.get('statistics', {})
         views = stats.get('play_count', 0)
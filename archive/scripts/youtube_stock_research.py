@@ -17,24 +17,42 @@ Examples:
 import os
 import sys
 import argparse
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+# Shared modules live in the top-level scripts/ directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from filter_pipeline import top_n
+from sentiment import get_scorer
+from sociavault_client import DEFAULT_CONNECT_TIMEOUT, get_client
+from ticker_universe import load_universe
+
 API_KEY = os.getenv('SOCIAVAULT_API_KEY')
 if not API_KEY:
     raise ValueError("SOCIAVAULT_API_KEY environment variable not set")
 
-BASE_URL = "https://api.sociavault.com/v1/scrape/youtube"
+SEARCH_ENDPOINT = "scrape/youtube/search"
+VIDEO_ENDPOINT = "scrape/youtube/video"
+
+# Video detail requests in flight at once; the shared client's adaptive
+# concurrency limit may hold it lower
+DEFAULT_WORKERS = 8
+
+# Read timeout for one video's details: a video slower than this is kept
+# without details rather than holding up the run
+DETAIL_TIMEOUT = 30
 
 
 class YouTubeStockResearch:
     """YouTube stock research tool"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, workers: int = DEFAULT_WORKERS):
         self.api_key = api_key
-        self.headers = {'X-API-Key': api_key}
+        # Pooled session with timeouts, rate limiting and response cache
+        self.client = get_client(api_key)
+        self.workers = max(1, workers)
 
     def search_videos(
         self,
@@ -57,8 +75,43 @@ class YouTubeStockResearch:
         Returns:
             List of video objects
         """
-        url = f"{BASE_URL}/search"
+        result = []
+        for videos in self.iter_search_pages(query, upload_date, sort_by, max_videos, include_extras):
+            result.extend(videos)
+        print(f"✅ Retrieved {len(result)} videos\n")
+        return result
+
+    def _fetch_search_page(self, params: Dict[str, Any]):
+        """One search page: (videos, continuation token); raises on API errors."""
+        response = self.client.get(SEARCH_ENDPOINT, params=params)
+        response.raise_for_status()
+        result = response.json()
 
+        # Handle nested data structure
+        if not result.get('success'):
+            raise Exception(f"API returned error: {result.get('error', 'Unknown error')}")
+
+        data = result.get('data', {})
+        videos_dict = data.get('videos', {})
+
+        # Convert videos object to list
+        videos = list(videos_dict.values()) if isinstance(videos_dict, dict) else videos_dict
+        return videos or [], data.get('continuationToken')
+
+    def iter_search_pages(
+        self,
+        query: str,
+        upload_date: Optional[str] = None,
+        sort_by: str = "relevance",
+        max_videos: int = 20,
+        include_extras: bool = True
+    ):
+        """
+        Yield each page of search results, stopping after max_videos.
+
+        As soon as a page arrives the next continuation page is requested in
+        the background, so it downloads while the caller processes this one.
+        """
         params = {
             'query': query,
             'sortBy': sort_by,
@@ -68,51 +121,32 @@ class YouTubeStockResearch:
         if upload_date:
             params['uploadDate'] = upload_date
 
-        all_videos = []
-        continuation_token = None
+        found = 0
 
         print(f"🔍 Searching YouTube for: '{query}'")
         if upload_date:
             print(f"📅 Time filter: {upload_date}")
         print(f"📊 Fetching up to {max_videos} videos...")
 
-        while len(all_videos) < max_videos:
-            if continuation_token:
-                params['continuationToken'] = continuation_token
-
-            try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                result = response.json()
-
-                # Handle nested data structure
-                if not result.get('success'):
-                    print(f"❌ API returned error: {result.get('error', 'Unknown error')}")
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            pending = prefetch.submit(self._fetch_search_page, dict(params))
+            while pending:
+                try:
+                    videos, continuation_token = pending.result()
+                except Exception as e:
+                    print(f"❌ Error searching: {e}")
                     break
 
-                data = result.get('data', {})
-                videos_dict = data.get('videos', {})
-
-                # Convert videos object to list
-                videos = list(videos_dict.values()) if isinstance(videos_dict, dict) else videos_dict
-
+                videos = videos[:max_videos - found]
                 if not videos:
                     break
+                found += len(videos)
+                print(f"   Found {found} videos so far...")
 
-                all_videos.extend(videos)
-                print(f"   Found {len(all_videos)} videos so far...")
-
-                continuation_token = data.get('continuationToken')
-                if not continuation_token:
-                    break
-
-            except Exception as e:
-                print(f"❌ Error searching: {e}")
-                break
-
-        result = all_videos[:max_videos]
-        print(f"✅ Retrieved {len(result)} videos\n")
-        return result
+                pending = None
+                if continuation_token and found < max_videos:
+                    pending = prefetch.submit(self._fetch_search_page, {**params, 'continuationToken': continuation_token})
+                yield videos
 
     def get_video_details(self, video_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -124,11 +158,10 @@ class YouTubeStockResearch:
         Returns:
             Video details dictionary or None if error
         """
-        url = f"{BASE_URL}/video"
         params = {'url': video_url}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.client.get(VIDEO_ENDPOINT, params=params, timeout=(DEFAULT_CONNECT_TIMEOUT, DETAIL_TIMEOUT))
             response.raise_for_status()
             result = response.json()
 
@@ -141,58 +174,50 @@ class YouTubeStockResearch:
             print(f"⚠️  Error getting details for {video_url}: {e}")
             return None
 
-    def analyze_video_sentiment(self, video: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_sentiment(self, videos: List[Dict[str, Any]]) -> None:
         """
-        Analyze sentiment in video title, description, and transcript
+        Add 'sentiment_analysis' for each video's title, description and
+        transcript, scoring the whole list in one batch (see scripts/sentiment.py).
 
         Args:
-            video: Video details dictionary
-
-        Returns:
-            Sentiment analysis results
+            videos: Video details dictionaries, updated in place
         """
-        # Keywords for sentiment analysis
-        bullish_keywords = [
-            'buy', 'bull', 'bullish', 'long', 'growth', 'profit', 'gain',
-            'opportunity', 'breakout', 'rally', 'surge', 'moon', 'rocket',
-            'upgrade', 'beat', 'outperform', 'strong', 'positive'
-        ]
-
-        bearish_keywords = [
-            'sell', 'bear', 'bearish', 'short', 'decline', 'loss', 'crash',
-            'risk', 'warning', 'downgrade', 'miss', 'weak', 'negative',
-            'overvalued', 'bubble', 'correction', 'downturn'
-        ]
-
-        # Combine all text for analysis
-        title = (video.get('title') or '').lower()
-        description = (video.get('description') or '').lower()
-        transcript = (video.get('transcript_only_text') or '').lower()
-
-        all_text = f"{title} {description} {transcript}"
-
-        # Count sentiment keywords
-        bullish_count = sum(1 for keyword in bullish_keywords if keyword in all_text)
-        bearish_count = sum(1 for keyword in bearish_keywords if keyword in all_text)
-
-        # Determine sentiment
-        if bullish_count > bearish_count:
-            sentiment = "bullish"
-            confidence = bullish_count / (bullish_count + bearish_count) if (bullish_count + bearish_count) > 0 else 0
-        elif bearish_count > bullish_count:
-            sentiment = "bearish"
-            confidence = bearish_count / (bullish_count + bearish_count) if (bullish_count + bearish_count) > 0 else 0
-        else:
-            sentiment = "neutral"
-            confidence = 0.5
+        texts, has_transcript = [], []
+        for video in videos:
+            transcript = video.get('transcript_only_text') or ''
+            texts.append(f"{video.get('title') or ''} {video.get('description') or ''} {transcript}")
+            has_transcript.append(bool(transcript))
+        for video, sentiment in zip(videos, get_scorer().score_batch(texts, has_transcript)):
+            video['sentiment_analysis'] = sentiment
+
+    def _tag_tickers(self, videos: List[Dict[str, Any]], ticker: str) -> int:
+        """
+        Record the tickers each video mentions (ticker universe matcher) and
+        return how many mention `ticker` itself.
+        """
+        universe = load_universe()
+        count = 0
+        for video in videos:
+            video['mentioned_tickers'] = sorted(universe.find(f"{video.get('title') or ''} {video.get('description') or ''} {video.get('transcript_only_text') or ''}"))
+            count += ticker.upper() in video['mentioned_tickers']
+        return count
+
+    def _enrich_video(self, video: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Search result merged with its details. A failed or timed-out details
+        fetch keeps the search result; None if the video has no URL.
+        """
+        video_url = video.get('url')
+        if not video_url:
+            return None
 
-        return {
-            'sentiment': sentiment,
-            'confidence': round(confidence, 2),
-            'bullish_signals': bullish_count,
-            'bearish_signals': bearish_count,
-            'has_transcript': len(transcript) > 0
-        }
+        details = self.get_video_details(video_url)
+        if not details:
+            # Keep original if details fetch failed
+            return video
+
+        # Merge search result with detailed info
+        return {**video, **details}
 
     def research_stock(
         self,
@@ -222,63 +247,59 @@ class YouTubeStockResearch:
             # Search for multiple formats: ticker, $ticker, ticker stock
             query = f"{ticker} stock"
 
-        # Search for videos
-        videos = self.search_videos(
-            query=query,
-            upload_date=time_period if time_period != "all_time" else None,
-            max_videos=max_videos
-        )
-
-        if not videos:
-            print(f"❌ No videos found for '{query}'")
-            return {
-                'ticker': ticker,
-                'query': query,
-                'time_period': time_period,
-                'timestamp': datetime.now().isoformat(),
-                'videos': [],
-                'summary': {'total_videos': 0}
-            }
-
-        # Enrich with video details if requested
-        enriched_videos = []
-
-        if include_details:
-            print(f"📹 Fetching details for {len(videos)} videos...")
-            for i, video in enumerate(videos, 1):
-                video_url = video.get('url')
-                if not video_url:
-                    continue
-
-                print(f"   [{i}/{len(videos)}] {video.get('title', 'Unknown')[:60]}...")
-
-                details = self.get_video_details(video_url)
-                if details:
-                    # Merge search result with detailed info
-                    enriched = {**video, **details}
-
-                    # Add sentiment analysis
-                    sentiment = self.analyze_video_sentiment(enriched)
-                    enriched['sentiment_analysis'] = sentiment
-
-                    enriched_videos.append(enriched)
-                else:
-                    # Keep original if details fetch failed
-                    enriched_videos.append(video)
-        else:
-            enriched_videos = videos
+        # Search for videos, queueing detail fetches page by page
+        videos, futures = [], []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for page in self.iter_search_pages(
+                query=query,
+                upload_date=time_period if time_period != "all_time" else None,
+                max_videos=max_videos
+            ):
+                videos.extend(page)
+                if include_details:
+                    futures.extend(pool.submit(self._enrich_video, video) for video in page)
+            print(f"✅ Retrieved {len(videos)} videos\n")
+
+            if not videos:
+                print(f"❌ No videos found for '{query}'")
+                return {
+                    'ticker': ticker,
+                    'query': query,
+                    'time_period': time_period,
+                    'timestamp': datetime.now().isoformat(),
+                    'videos': [],
+                    'summary': {'total_videos': 0}
+                }
+
+            # Enrich with video details if requested; results keep search
+            # order and videos without a URL are dropped
+            if include_details:
+                print(f"📹 Fetching details for {len(videos)} videos ({self.workers} in parallel)...")
+                results = [future.result() for future in futures]
+                enriched_videos = [video for video in results if video is not None]
+                detailed = [enriched for video, enriched in zip(videos, results)
+                            if enriched is not None and enriched is not video]
+                if len(detailed) < len(enriched_videos):
+                    print(f"   ⚠️  {len(enriched_videos) - len(detailed)} videos kept without details")
+                # Score sentiment once for the whole list rather than per fetch
+                self.analyze_sentiment(detailed)
+            else:
+                enriched_videos = videos
 
         # Generate summary statistics
         summary = self._generate_summary(enriched_videos, include_details)
+        summary['videos_mentioning_ticker'] = self._tag_tickers(enriched_videos, ticker)
 
         print(f"\n✅ Research complete!")
         print(f"   Total videos: {summary['total_videos']}")
         print(f"   Total views: {summary['total_views']:,}")
+        print(f"   Mentioning ${ticker}: {summary['videos_mentioning_ticker']}")
         if include_details:
             print(f"   Sentiment: {summary['sentiment_breakdown']}")
 
         return {
             'ticker': ticker,
+            'company_name': load_universe().company_name(ticker),
             'query': query,
             'time_period': time_period,
             'timestamp': datetime.now().isoformat(),
@@ -343,12 +364,14 @@ Examples:
     )
     parser.add_argument('--max-videos', type=int, default=20, help='Maximum videos to fetch (default: 20)')
     parser.add_argument('--no-details', action='store_true', help='Skip fetching video details and transcripts')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Video details to fetch in parallel (default: {DEFAULT_WORKERS})')
     parser.add_argument('--output', help='Output file path (default: data/youtube/{ticker}_{timestamp}.json)')
 
     args = parser.parse_args()
 
     # Initialize researcher
-    researcher = YouTubeStockResearch(API_KEY)
+    researcher = YouTubeStockResearch(API_KEY, workers=args.workers)
 
     # Run research
     results = researcher.research_stock(
@@ -378,13 +401,9 @@ Examples:
     print(f"\n📊 Top 5 Videos by Views:")
     print("─" * 100)
 
-    sorted_videos = sorted(
-        results['videos'],
-        key=lambda v: v.get('viewCountInt', 0),
-        reverse=True
-    )
+    top_videos = top_n(results['videos'], 5, key=lambda v: v.get('viewCountInt', 0))
 
-    for i, video in enumerate(sorted_videos[:5], 1):
+    for i, video in enumerate(top_videos, 1):
         title = video.get('title', 'Unknown')
         views = video.get('viewCountInt', 0)
         likes = video.get('likeCountInt', 0)
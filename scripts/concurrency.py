@@ -0,0 +1,130 @@
+"""
+AIMD adaptive concurrency for SociaVault calls.
+
+Each endpoint family (tiktok, reddit, twitter, youtube, threads) has its own
+limit on requests in flight. The limit grows by one per window of healthy
+responses (fast, not failing) and halves on a 429, 503 or timeout, the same
+additive-increase / multiplicative-decrease rule TCP uses. Scripts can then
+ask for generous --workers without either underusing the API or tripping
+its rate limits; callers beyond the current limit simply wait for a slot.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 32
+
+# A response slower than this multiple of the family's best smoothed latency
+# is "unhealthy": the limit stops growing until latency recovers.
+LATENCY_TOLERANCE = 2.0
+EWMA_WEIGHT = 0.2
+
+FAMILIES = ["tiktok", "reddit", "twitter", "youtube", "threads"]
+
+BACKOFF_STATUSES = (429, 503)
+
+
+def endpoint_family(endpoint):
+    """'scrape/tiktok/search/keyword' -> 'tiktok'; endpoints outside a family share 'other'."""
+    for part in endpoint.strip("/").split("/")[:2]:
+        if part in FAMILIES:
+            return part
+    return "other"
+
+
+class _Family:
+    def __init__(self, limit):
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.latency = None  # EWMA of healthy response times, seconds
+        self.best_latency = None
+        self.last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+
+class AIMDController:
+    """Per-family concurrency limits adjusted by AIMD; thread-safe."""
+
+    def __init__(self, initial=DEFAULT_INITIAL_LIMIT, minimum=DEFAULT_MIN_LIMIT, maximum=DEFAULT_MAX_LIMIT):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self._families = {}
+        self._cond = threading.Condition()
+
+    def _family(self, name):
+        if name not in self._families:
+            self._families[name] = _Family(self.initial)
+        return self._families[name]
+
+    @contextmanager
+    def slot(self, endpoint):
+        """
+        Hold one in-flight slot for `endpoint`'s family. The body must call
+        the yielded `done(status, latency)` (status None for a timeout or
+        connection error) so the limit can adapt.
+        """
+        name = endpoint_family(endpoint)
+        with self._cond:
+            family = self._family(name)
+            while family.in_flight >= int(family.limit):
+                self._cond.wait()
+            family.in_flight += 1
+        started = time.time()
+
+        def done(status, latency):
+            with self._cond:
+                self._adapt(family, status, latency, started)
+
+        try:
+            yield done
+        finally:
+            with self._cond:
+                family.in_flight -= 1
+                self._cond.notify_all()
+
+    def _adapt(self, family, status, latency, started):
+        if status is None or status in BACKOFF_STATUSES:
+            # Requests already in flight when we last backed off report the
+            # same congestion; count it once.
+            if started >= family.last_decrease:
+                family.limit = max(self.minimum, family.limit / 2)
+                family.last_decrease = time.time()
+                family.decreases += 1
+            return
+        if status >= 500:
+            return  # Server trouble: hold the limit steady
+
+        family.latency = latency if family.latency is None else (
+            EWMA_WEIGHT * latency + (1 - EWMA_WEIGHT) * family.latency
+        )
+        family.best_latency = family.latency if family.best_latency is None else min(family.best_latency, family.latency)
+        if latency <= LATENCY_TOLERANCE * family.best_latency:
+            # +1 per window of `limit` healthy responses
+            before = int(family.limit)
+            family.limit = min(self.maximum, family.limit + 1 / family.limit)
+            if int(family.limit) > before:
+                family.increases += 1
+                self._cond.notify_all()
+
+    def limit(self, endpoint):
+        with self._cond:
+            return int(self._family(endpoint_family(endpoint)).limit)
+
+    def snapshot(self):
+        """Current state per family, for metrics and reports."""
+        with self._cond:
+            return {
+                name: {
+                    "limit": int(f.limit),
+                    "in_flight": f.in_flight,
+                    "latency_ms": round(f.latency * 1000, 1) if f.latency is not None else None,
+                    "increases": f.increases,
+                    "decreases": f.decreases,
+                }
+                for name, f in self._families.items()
+            }
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Credit-aware planner and dry-run cost estimator for batches of SociaVault calls.
+
+A batch is a JSON Lines file with one intended call per line:
+    {"kind": "search", "query": "TSLA stock", "pages": 3, "priority": 2}
+    {"kind": "transcripts", "input": "data/tiktok_search_tsla_stock.ndjson", "use_ai": true}
+    {"kind": "subreddit", "subreddit": "stocks", "timeframe": "week"}
+
+Each call is estimated (requests, credits, wall time) before anything is
+spent. Responses still fresh in the local cache and videos in the negative
+transcript cache cost nothing and are planned first. The remaining requests
+are ordered by priority per credit, so under --budget the batch covers as
+many calls as possible instead of exhausting credits on one deep search.
+
+Usage:
+    python3 scripts/credit_planner.py batch.jsonl [--budget 50] [--workers 4] [--plan-out plan.json]
+"""
+
+import argparse
+import json
+import math
+import shlex
+import sys
+
+from request_ledger import endpoint_latencies
+from sociavault_client import get_client
+from tiktok_video_search import SEARCH_ENDPOINT
+from tiktok_video_transcript import TRANSCRIPT_ENDPOINT, load_video_urls, skip_reason, transcript_params, video_key
+
+# Credits per request and rough seconds per request for each kind of call;
+# measured p50 latencies from the request ledger replace the guesses when
+# available. page_size converts pages into --max-results for the search script.
+CALL_KINDS = {
+    "search": {"endpoint": SEARCH_ENDPOINT, "credits": 1, "latency": 4.0, "page_size": 30},
+    "video-info": {"endpoint": "scrape/tiktok/video-info", "credits": 1, "latency": 3.0},
+    "transcript": {"endpoint": TRANSCRIPT_ENDPOINT, "credits": 1, "latency": 5.0, "ai_credits": 10, "ai_latency": 20.0},
+    "popular-hashtags": {"endpoint": "scrape/tiktok/hashtags/popular", "credits": 1, "latency": 2.0},
+    "popular-videos": {"endpoint": "scrape/tiktok/videos/popular", "credits": 1, "latency": 2.0},
+    "subreddit": {"endpoint": "scrape/reddit/subreddit", "credits": 1, "latency": 3.0},
+    # 1 credit per 48 comments, minimum 1
+    "comments": {"endpoint": "scrape/reddit/post/comments/simple", "credits": 1, "latency": 3.0, "per_credit": 48},
+    "user-tweets": {"endpoint": "scrape/twitter/user-tweets", "credits": 1, "latency": 3.0},
+    "youtube-search": {"endpoint": "scrape/youtube/search", "credits": 1, "latency": 4.0},
+}
+
+
+def load_batch(path):
+    """Read a batch file, expanding "transcripts" entries into one call per unique video."""
+    calls = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            call = json.loads(line)
+            kind = call.get("kind")
+            if kind == "transcripts":
+                seen = set()
+                for url in load_video_urls(call["input"]):
+                    if video_key(url) not in seen:
+                        seen.add(video_key(url))
+                        calls.append({**call, "kind": "transcript", "url": url})
+            elif kind in CALL_KINDS:
+                calls.append(call)
+            else:
+                raise ValueError(f"{path}:{line_number}: unknown kind {kind!r} (expected one of {', '.join(CALL_KINDS)})")
+    return calls
+
+
+def cache_params(call):
+    """Params the scripts send for the first request of a call, for cache lookups."""
+    kind = call["kind"]
+    if kind == "search":
+        return {
+            "query": call["query"],
+            "date_posted": call.get("date_posted", "yesterday"),
+            "sort_by": call.get("sort_by", "most-liked"),
+            "region": call.get("region", "US"),
+            "trim": True
+        }
+    if kind == "video-info":
+        return {"url": call["url"], "get_transcript": True, "trim": True}
+    if kind == "transcript":
+        return transcript_params(call["url"], call.get("use_ai", False))
+    return None
+
+
+def estimate_call(call, cache=None, latencies=None):
+    """
+    Estimate one call: requests it will make, worst-case credits and seconds
+    per request, plus a note when the caches make it free. `latencies` maps
+    endpoints to measured seconds per request.
+    """
+    kind = call["kind"]
+    spec = CALL_KINDS[kind]
+    requests_needed = max(1, int(call.get("pages", 1)))
+    credits = spec["credits"]
+    latency = (latencies or {}).get(spec["endpoint"], spec["latency"])
+    cached = 0
+    note = ""
+
+    if kind == "comments":
+        credits = max(1, math.ceil(call.get("amount", 5) / spec["per_credit"]))
+    if kind == "transcript":
+        reason = skip_reason(cache, video_key(call["url"]), call.get("use_ai", False))
+        if reason:
+            return {"requests": 0, "cached": 0, "credits": 0, "latency": 0.0, "note": f"skip: {reason}"}
+        if call.get("use_ai"):
+            # Worst case: the native tier misses and the AI fallback runs
+            credits, latency = spec["ai_credits"], spec["ai_latency"]
+
+    params = cache_params(call)
+    if cache and params is not None and cache.contains(spec["endpoint"], params):
+        # Only the first page is cached; later pages carry a cursor
+        requests_needed -= 1
+        cached = 1
+        note = "page 1 cached" if requests_needed else "cached"
+
+    return {"requests": requests_needed, "cached": cached, "credits": credits, "latency": latency, "note": note}
+
+
+def call_label(call):
+    return call.get("query") or call.get("url") or call.get("subreddit") or call.get("handle") or "-"
+
+
+def call_command(call, pages):
+    """Command line that runs the planned part of a call, or None if no script covers it."""
+    kind = call["kind"]
+    if kind == "search":
+        args = ["python3", "scripts/tiktok_video_search.py", call["query"]]
+        for flag, key in (("--date", "date_posted"), ("--sort", "sort_by"), ("--region", "region")):
+            if key in call:
+                args += [flag, call[key]]
+        if pages > 1:
+            args += ["--max-results", str(pages * CALL_KINDS["search"]["page_size"])]
+    elif kind == "video-info":
+        args = ["python3", "scripts/tiktok_video_info.py", call["url"]]
+    elif kind == "transcript":
+        args = ["python3", "scripts/tiktok_video_transcript.py", call["url"]] + (["--use-ai"] if call.get("use_ai") else [])
+    elif kind in ("popular-hashtags", "popular-videos"):
+        args = ["python3", f"scripts/tiktok_{kind.replace('-', '_')}.py", "--pages", str(pages)]
+    elif kind == "subreddit":
+        args = ["python3", "archive/scripts/fetch_reddit_posts.py", "--subreddit", call["subreddit"],
+                "--timeframe", call.get("timeframe", "month")]
+    elif kind == "comments":
+        args = ["python3", "archive/scripts/fetch_reddit_comments.py", "--url", call["url"],
+                "--amount", str(call.get("amount", 5))]
+    else:
+        return None
+    return shlex.join(args)
+
+
+def plan_batch(calls, budget=None, cache=None, latencies=None):
+    """
+    Order a batch for maximum coverage under `budget` credits.
+
+    Every request becomes a unit worth priority / page (the first page of a
+    call matters most). Free units go first, then units by value per credit;
+    units that would overrun the budget are deferred. Returns
+    (estimates, scheduled, deferred), where scheduled/deferred list
+    {"call", "pages", "requests", "credits", "seconds"} in execution order.
+    """
+    estimates = [estimate_call(call, cache, latencies) for call in calls]
+
+    units = []
+    for index, (call, estimate) in enumerate(zip(calls, estimates)):
+        priority = float(call.get("priority", 1))
+        for page in range(1, estimate["requests"] + 1):
+            units.append({
+                "call": index,
+                "credits": estimate["credits"],
+                "seconds": estimate["latency"],
+                "value": priority / page,
+            })
+    units.sort(key=lambda u: (u["credits"] > 0, -u["value"] / u["credits"] if u["credits"] else 0, u["call"]))
+
+    # Calls the caches make entirely free come first, with no requests
+    scheduled = {index: {"call": index, "pages": 0, "requests": 0, "credits": 0, "seconds": 0.0}
+                 for index, estimate in enumerate(estimates) if estimate["requests"] == 0}
+    deferred, spent = {}, 0
+    for unit in units:
+        fits = budget is None or spent + unit["credits"] <= budget
+        target = scheduled if fits else deferred
+        if fits:
+            spent += unit["credits"]
+        entry = target.setdefault(unit["call"], {"call": unit["call"], "pages": 0, "requests": 0, "credits": 0, "seconds": 0.0})
+        entry["pages"] += 1
+        entry["requests"] += 1
+        entry["credits"] += unit["credits"]
+        entry["seconds"] += unit["seconds"]
+
+    return estimates, list(scheduled.values()), list(deferred.values())
+
+
+def wall_time(entries, workers):
+    """Expected wall time with `workers` calls in flight (pages of one call run in order)."""
+    if not entries:
+        return 0.0
+    total = sum(e["seconds"] for e in entries)
+    return max(total / max(1, workers), max(e["seconds"] for e in entries))
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def print_plan(calls, estimates, scheduled, deferred, budget, workers):
+    total_requests = sum(e["requests"] for e in estimates)
+    total_credits = sum(e["requests"] * e["credits"] for e in estimates)
+    all_entries = scheduled + deferred
+    print(f"Dry run: {len(calls)} calls, {total_requests} requests, up to {total_credits} credits, "
+          f"~{format_seconds(wall_time(all_entries, workers))} with {workers} worker(s)")
+
+    print(f"\n{'#':<4} {'Kind':<17} {'Target':<45} {'Req':>4} {'Credits':>8} {'Time':>7}  Note")
+    print("-" * 100)
+    for position, entry in enumerate(scheduled, 1):
+        call = calls[entry["call"]]
+        label = call_label(call)
+        label = label if len(label) <= 45 else label[:42] + "..."
+        note = estimates[entry["call"]]["note"]
+        print(f"{position:<4} {call['kind']:<17} {label:<45} {entry['requests']:>4} {entry['credits']:>8} "
+              f"{format_seconds(entry['seconds']):>7}  {note}")
+
+    spent = sum(e["credits"] for e in scheduled)
+    print("-" * 100)
+    print(f"Planned: {sum(e['requests'] for e in scheduled)} requests, {spent} credits, "
+          f"~{format_seconds(wall_time(scheduled, workers))}"
+          + (f" (budget {budget})" if budget is not None else ""))
+
+    if deferred:
+        print(f"\nDeferred over budget: {sum(e['requests'] for e in deferred)} requests, "
+              f"{sum(e['credits'] for e in deferred)} credits")
+        for entry in deferred:
+            call = calls[entry["call"]]
+            print(f"  - {call['kind']} {call_label(call)} ({entry['pages']} request(s))")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate and order a batch of SociaVault calls before spending credits.")
+    parser.add_argument("batch", help="JSON Lines file with one intended call per line")
+    parser.add_argument("--budget", type=int, help="Maximum credits to plan for")
+    parser.add_argument("--check-balance", action="store_true", help="Cap the budget at the account balance (free request)")
+    parser.add_argument("--workers", type=int, default=1, help="Calls run in parallel, for the wall-time estimate (default: 1)")
+    parser.add_argument("--plan-out", help="Write the ordered plan (with the command for each call) to this JSON file")
+
+    args = parser.parse_args()
+
+    try:
+        calls = load_batch(args.batch)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: could not read batch: {e}")
+        sys.exit(1)
+
+    client = get_client()
+    budget = args.budget
+    if args.check_balance:
+        balance = client.check_credits()
+        if isinstance(balance, (int, float)):
+            print(f"Available credits: {balance}")
+            budget = int(balance) if budget is None else min(budget, int(balance))
+        else:
+            print("Warning: Could not check credits")
+
+    latencies = endpoint_latencies(client.ledger.path) if client.ledger else None
+    estimates, scheduled, deferred = plan_batch(calls, budget, client.cache, latencies)
+    print_plan(calls, estimates, scheduled, deferred, budget, args.workers)
+
+    if args.plan_out:
+        plan = []
+        for entry in scheduled:
+            call = calls[entry["call"]]
+            pages = entry["pages"] + estimates[entry["call"]]["cached"]
+            plan.append({
+                **call,
+                "requests": entry["requests"],
+                "credits": entry["credits"],
+                "command": call_command(call, pages) if pages else None,
+            })
+        with open(args.plan_out, "w") as f:
+            json.dump(plan, f, indent=2)
+        print(f"\nPlan saved to {args.plan_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Composable record filters evaluated in one streaming pass.
+
+The stock fetchers used to build a new list per filter (ticker, date,
+engagement), then sort everything and slice to --max-results. A
+FilterPipeline instead checks each record against every predicate as it
+streams past and keeps only the best N in a bounded heap:
+
+    filters = (FilterPipeline()
+               .where("date", is_recent, cost=COST_TIMESTAMP)
+               .where("engagement", is_popular)
+               .where("ticker", mentions_ticker, cost=COST_TEXT))
+    posts, stats = filters.run(all_posts, top=50, key=score)
+
+Predicates start in order of cost, so cheap numeric checks run before text
+matching, and are re-ordered as the pass goes by how often each one
+rejects (cost per rejection), so the most selective cheap filter runs first.
+
+A stage can also carry request params that apply the same filter on the
+API side (sort order, time window); `filters.params` merges them so the
+fetch asks for less in the first place.
+"""
+
+import heapq
+from itertools import islice
+
+# Relative cost of evaluating a predicate once
+COST_NUMERIC = 1  # Field lookups and comparisons
+COST_TIMESTAMP = 2  # Timestamp parsing (cached, see timestamps.py)
+COST_TEXT = 20  # Ticker/company matching over titles, bodies, transcripts
+
+# Records between re-orderings of the predicates
+REORDER_EVERY = 256
+
+
+class _Stage:
+    __slots__ = ("name", "predicate", "cost", "seen", "rejected")
+
+    def __init__(self, name, predicate, cost):
+        self.name = name
+        self.predicate = predicate
+        self.cost = cost
+        self.seen = 0
+        self.rejected = 0
+
+    def rank(self):
+        """Expected cost per record rejected; the lowest runs first."""
+        rejection_rate = (self.rejected + 1) / (self.seen + 2)
+        return self.cost / rejection_rate
+
+
+class FilterPipeline:
+    """Predicates and pushed-down request params; where() returns a new pipeline."""
+
+    def __init__(self, stages=(), params=None):
+        self.stages = list(stages)  # (name, predicate, cost)
+        self.params = dict(params or {})
+
+    def where(self, name, predicate, cost=COST_NUMERIC, params=None):
+        """
+        Pipeline with `predicate` added. `params` are request params that
+        apply the same filter server-side (merged into .params).
+        """
+        merged = dict(self.params)
+        merged.update(params or {})
+        return FilterPipeline(self.stages + [(name, predicate, cost)], merged)
+
+    def run(self, records, top=None, key=None):
+        """
+        Filter `records` in one pass.
+
+        Args:
+            records: Any iterable (a generator is consumed lazily)
+            top: Keep only the `top` records with the highest key(record);
+                 without a key, the first `top` passing records in input
+                 order, and reading stops once they are found
+            key: Ranking key; without `top` the kept records are sorted by it
+
+        Returns:
+            (kept records, {"scanned": n, "passed": n, "kept": n,
+                            "rejected": {stage name: n}})
+            "passed" counts records matching every predicate, before `top`.
+            Each rejected record is counted against the first stage that
+            failed it.
+        """
+        stages = sorted((_Stage(*stage) for stage in self.stages), key=lambda s: s.cost)
+        counter = {"scanned": 0, "passed": 0}
+
+        def passing():
+            order = list(stages)
+            scanned = passed = 0
+            try:
+                for record in records:
+                    scanned += 1
+                    for stage in order:
+                        stage.seen += 1
+                        if not stage.predicate(record):
+                            stage.rejected += 1
+                            break
+                    else:
+                        passed += 1
+                        yield record
+                    if scanned % REORDER_EVERY == 0:
+                        order.sort(key=_Stage.rank)
+            finally:
+                # Also runs when a first-N pass closes the generator early
+                counter["scanned"], counter["passed"] = scanned, passed
+
+        if top is not None and key is None:
+            # Records are dicts and can't be compared, so without a key keep the first N
+            stream = passing()
+            kept = list(islice(stream, top))
+            stream.close()
+        elif top is not None:
+            kept = heapq.nlargest(top, passing(), key=key)
+        elif key is not None:
+            kept = sorted(passing(), key=key, reverse=True)
+        else:
+            kept = list(passing())
+
+        stats = {
+            "scanned": counter["scanned"],
+            "passed": counter["passed"],
+            "kept": len(kept),
+            "rejected": {stage.name: stage.rejected for stage in stages},
+        }
+        return kept, stats
+
+
+def top_n(records, n, key):
+    """The `n` records with the highest key, best first, without sorting them all."""
+    return heapq.nlargest(n, records, key=key)
+
+
+def describe(stats, noun="records"):
+    """One-line summary of FilterPipeline.run stats."""
+    rejected = ", ".join(f"{name} {count}" for name, count in stats["rejected"].items() if count)
+    line = f"{stats['passed']} of {stats['scanned']} {noun} passed the filters"
+    if stats["kept"] < stats["passed"]:
+        line += f", kept top {stats['kept']}"
+    return f"{line} (rejected by {rejected})" if rejected else line
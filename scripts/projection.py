@@ -0,0 +1,102 @@
+"""
+Field projection for stored TikTok records.
+
+Each aweme record carries 150+ keys (anchors, commerce_info, geofencing, ...)
+of which we read maybe 15. The field lists below declare what is kept when a
+script runs with --project; projected records keep the original nesting, so
+code reading `video['statistics']['play_count']` works on either form.
+
+Paths use dots for nested dicts and `[]` for lists of dicts, e.g.
+"author.unique_id" or "text_extra[].hashtag_name".
+"""
+
+AWEME_FIELDS = [
+    "aweme_id",
+    "desc",
+    "desc_language",
+    "create_time",
+    "region",
+    "share_url",
+    "is_ad",
+    "author.uid",
+    "author.unique_id",
+    "author.nickname",
+    "author.follower_count",
+    "statistics.play_count",
+    "statistics.digg_count",
+    "statistics.comment_count",
+    "statistics.share_count",
+    "statistics.collect_count",
+    "video.duration",
+    "music.title",
+    "text_extra[].hashtag_name",
+]
+
+POPULAR_VIDEO_FIELDS = [
+    "id",
+    "title",
+    "duration",
+    "item_url",
+    "region",
+    "country_code",
+]
+
+
+def _project_path(source, parts, target):
+    key = parts[0]
+    is_list = key.endswith("[]")
+    if is_list:
+        key = key[:-2]
+    if not isinstance(source, dict) or key not in source:
+        return
+
+    value = source[key]
+    rest = parts[1:]
+
+    if not rest:
+        target[key] = value
+    elif is_list:
+        if not isinstance(value, list):
+            return
+        existing = target.setdefault(key, [{} for _ in value])
+        for item, projected in zip(value, existing):
+            _project_path(item, rest, projected)
+    elif isinstance(value, dict):
+        _project_path(value, rest, target.setdefault(key, {}))
+
+
+def project(record, fields):
+    """Return a copy of `record` containing only the declared field paths."""
+    projected = {}
+    for field in fields:
+        _project_path(record, field.split("."), projected)
+    return projected
+
+
+def project_search_item(item, fields=AWEME_FIELDS):
+    """Project one search_item_list entry ({"aweme_info": {...}})."""
+    return {"aweme_info": project(item.get("aweme_info", {}), fields)}
+
+
+def project_search_response(data, items, fields=AWEME_FIELDS):
+    """
+    Rebuild a keyword search response with projected items, keeping the
+    envelope (success, cursor, has_more, credits_used, ...) intact.
+    """
+    inner = {k: v for k, v in data.get("data", {}).items() if k != "search_item_list"}
+    inner["search_item_list"] = [project_search_item(item, fields) for item in items]
+    return {**data, "data": inner}
+
+
+def project_video_info_response(data, fields=AWEME_FIELDS):
+    """Project aweme_detail in a video-info response, keeping the transcript."""
+    inner = dict(data.get("data", {}))
+    if isinstance(inner.get("aweme_detail"), dict):
+        inner["aweme_detail"] = project(inner["aweme_detail"], fields)
+    return {**data, "data": inner}
+
+
+def cold_path(path):
+    """Where the untouched raw response is kept alongside a projected file."""
+    directory, _, filename = path.rpartition("/")
+    return f"{directory}/raw/{filename}" if directory else f"raw/{filename}"
@@ -0,0 +1,131 @@
+"""
+Token-bucket rate limiter shared by every SociaVault call on this host.
+
+The bucket state lives in a small JSON file guarded by an exclusive file
+lock, so the threads of one script and separate scripts running at the same
+time draw from one budget. Requests go out as fast as the bucket allows, with
+no fixed sleeps between them. A 429's Retry-After pauses the whole bucket,
+so every caller backs off together instead of each retrying into a 429 storm.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bucket is shared between threads only
+    fcntl = None
+
+DEFAULT_STATE_PATH = "data/cache/ratelimit.json"
+DEFAULT_RATE = 5.0  # requests per second, sustained
+DEFAULT_BURST = 10  # requests allowed back to back after an idle spell
+
+# Waits are stretched by up to this fraction so callers don't wake in lockstep.
+JITTER = 0.1
+
+# Backoff for retryable responses without a usable Retry-After header.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (delta seconds or HTTP date); None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def jittered(seconds):
+    """Stretch a wait by up to JITTER so callers don't wake in lockstep."""
+    return seconds * (1 + random.uniform(0, JITTER))
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+class TokenBucket:
+    """Token bucket whose state is shared through a lock file (or kept in memory if path is None)."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, path=DEFAULT_STATE_PATH):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory = self._fresh_state()
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def _fresh_state(self):
+        return {"tokens": self.burst, "updated": time.time(), "paused_until": 0.0}
+
+    @contextmanager
+    def _state(self):
+        """Locked read-modify-write of the bucket state."""
+        with self._lock:
+            if not self.path:
+                yield self._memory
+                return
+            with open(self.path, "a+") as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = {**self._fresh_state(), **json.loads(f.read() or "{}")}
+                    except ValueError:
+                        state = self._fresh_state()
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _refill(self, state, now):
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * self.rate)
+        state["updated"] = now
+
+    def acquire(self):
+        """Block until a token is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                now = time.time()
+                self._refill(state, now)
+                if now < state["paused_until"]:
+                    wait = state["paused_until"] - now
+                elif state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return waited
+                else:
+                    wait = (1 - state["tokens"]) / self.rate
+            wait = jittered(wait)
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        """Stop handing out tokens for `seconds` (e.g. a Retry-After) for every sharer."""
+        with self._state() as state:
+            now = time.time()
+            self._refill(state, now)
+            state["tokens"] = 0.0
+            state["paused_until"] = max(state["paused_until"], now + seconds)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Credit and latency ledger for SociaVault API calls.
+
+The shared client appends one JSON line per call: timestamp, run id, script,
+endpoint, params hash, status, latency, bytes and the credits_used reported
+in the response body, plus the endpoint family and its adaptive concurrency
+limit at the time (see concurrency.py). Cache hits are logged too, with no
+credits, so the report shows how much the cache saves.
+
+Usage:
+    python3 scripts/request_ledger.py report [--days 7] [--by endpoint|family|run|day]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+
+from response_cache import make_key
+
+DEFAULT_LEDGER_PATH = "data/ledger/requests.jsonl"
+
+# credits_used / creditsUsed at any depth; read from the raw bytes so the
+# body isn't parsed a second time on every call.
+_CREDITS_RE = re.compile(rb'"credits_?[uU]sed"\s*:\s*(\d+(?:\.\d+)?)')
+
+# One id per process, so a report can group calls by pipeline run.
+RUN_ID = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def credits_from_body(body):
+    match = _CREDITS_RE.search(body or b"")
+    if not match:
+        return None
+    value = float(match.group(1))
+    return int(value) if value.is_integer() else value
+
+
+class RequestLedger:
+    """Append-only JSONL log of API calls, safe to share between threads and processes."""
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.script = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, endpoint, params, status, latency, body=None, from_cache=False, error=None, extra=None):
+        entry = {
+            "ts": round(time.time(), 3),
+            "run": RUN_ID,
+            "script": self.script,
+            "endpoint": endpoint.strip("/"),
+            "params_hash": make_key(endpoint, params)[:16],
+            "status": status,
+            "latency_ms": round(latency * 1000, 1),
+            "bytes": len(body) if body is not None else 0,
+            "credits_used": 0 if from_cache else credits_from_body(body),
+            "from_cache": from_cache,
+        }
+        if error:
+            entry["error"] = error
+        if extra:
+            entry.update(extra)
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        # One short O_APPEND write per line keeps concurrent writers from interleaving
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+
+
+def read_ledger(path=DEFAULT_LEDGER_PATH, since=None):
+    """Yield ledger entries, optionally only those at or after the `since` timestamp."""
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # A line cut short by a crash
+            if since is None or entry.get("ts", 0) >= since:
+                yield entry
+
+
+def endpoint_latencies(path=DEFAULT_LEDGER_PATH, pct=50):
+    """Measured latency in seconds per endpoint (live calls only), for planning."""
+    latencies = {}
+    for entry in read_ledger(path):
+        if not entry.get("from_cache") and entry.get("status") == 200:
+            latencies.setdefault(entry["endpoint"], []).append(entry["latency_ms"] / 1000)
+    return {endpoint: percentile(values, pct) for endpoint, values in latencies.items()}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(entries, key):
+    """Aggregate entries by key(entry): counts, latency percentiles, bytes, credits, span."""
+    groups = {}
+    for entry in entries:
+        group = groups.setdefault(key(entry), {
+            "calls": 0, "cached": 0, "errors": 0, "latencies": [], "bytes": 0, "credits": 0,
+            "first": entry["ts"], "last": entry["ts"], "limit": None,
+        })
+        group["calls"] += 1
+        group["bytes"] += entry.get("bytes") or 0
+        group["credits"] += entry.get("credits_used") or 0
+        group["first"] = min(group["first"], entry["ts"])
+        if entry["ts"] >= group["last"] and entry.get("concurrency"):
+            group["limit"] = entry["concurrency"]  # Most recent concurrency limit
+        group["last"] = max(group["last"], entry["ts"])
+        if entry.get("from_cache"):
+            group["cached"] += 1
+        else:
+            group["latencies"].append(entry.get("latency_ms") or 0)
+        if entry.get("error") or not entry.get("status") or entry["status"] >= 400:
+            group["errors"] += 1
+    return groups
+
+
+def _fmt_ms(value):
+    return "-" if value is None else f"{value:,.0f}"
+
+
+def print_report(entries, by="endpoint"):
+    if not entries:
+        print("No ledger entries.")
+        return
+
+    width = 34 if by == "endpoint" else 12
+    if by == "endpoint":
+        groups = summarize(entries, lambda e: e["endpoint"])
+        print(f"{'Endpoint':<34} {'Calls':>6} {'Cached':>7} {'Err':>4} {'p50 ms':>8} {'p95 ms':>8} {'MB':>7} {'Credits':>8} {'Limit':>6}")
+        rows = sorted(groups.items(), key=lambda kv: -kv[1]["credits"])
+    elif by == "run":
+        groups = summarize(entries, lambda e: (e["run"], e.get("script") or "-"))
+        print(f"{'Run':<22} {'Script':<30} {'Calls':>6} {'Credits':>8} {'Wall s':>7} {'Req/s':>6} {'p95 ms':>8}")
+        rows = sorted(groups.items(), key=lambda kv: kv[1]["first"])
+    elif by == "family":
+        groups = summarize(entries, lambda e: e.get("family") or "-")
+        print(f"{'Family':<12} {'Calls':>6} {'Cached':>7} {'Err':>4} {'p50 ms':>8} {'p95 ms':>8} {'MB':>7} {'Credits':>8} {'Limit':>6}")
+        rows = sorted(groups.items(), key=lambda kv: -kv[1]["credits"])
+    else:
+        groups = summarize(entries, lambda e: datetime.fromtimestamp(e["ts"]).strftime("%Y-%m-%d"))
+        print(f"{'Day':<12} {'Calls':>6} {'Cached':>7} {'Err':>4} {'p50 ms':>8} {'p95 ms':>8} {'MB':>7} {'Credits':>8}")
+        rows = sorted(groups.items())
+    print("-" * 100)
+
+    for name, g in rows:
+        p50, p95 = percentile(g["latencies"], 50), percentile(g["latencies"], 95)
+        if by == "run":
+            run, script = name
+            # Wall time from the first call's start to the last call's end
+            wall = g["last"] - g["first"] + (max(g["latencies"]) / 1000 if g["latencies"] else 0)
+            rate = g["calls"] / wall if wall > 0 else 0
+            print(f"{run:<22} {script[:30]:<30} {g['calls']:>6} {g['credits']:>8} {wall:>7.1f} {rate:>6.2f} {_fmt_ms(p95):>8}")
+        else:
+            limit = f" {g['limit'] or '-':>6}" if by in ("endpoint", "family") else ""
+            print(f"{name[:width]:<{width}} {g['calls']:>6} {g['cached']:>7} {g['errors']:>4} {_fmt_ms(p50):>8} {_fmt_ms(p95):>8} "
+                  f"{g['bytes'] / 1e6:>7.1f} {g['credits']:>8}{limit}")
+
+    total = summarize(entries, lambda e: "all")["all"]
+    print("-" * 100)
+    print(f"Total: {total['calls']} calls ({total['cached']} from cache, {total['errors']} errors), "
+          f"{total['credits']} credits, {total['bytes'] / 1e6:.1f} MB, "
+          f"p50 {_fmt_ms(percentile(total['latencies'], 50))} ms, p95 {_fmt_ms(percentile(total['latencies'], 95))} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on the SociaVault request ledger.")
+    parser.add_argument("--ledger", default=os.environ.get("SOCIAVAULT_LEDGER") or DEFAULT_LEDGER_PATH,
+                        help=f"Ledger file (default: $SOCIAVAULT_LEDGER or {DEFAULT_LEDGER_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report = subparsers.add_parser("report", help="Latency, throughput and credit burn")
+    report.add_argument("--by", default="endpoint", choices=["endpoint", "family", "run", "day"],
+                        help="Grouping (default: endpoint)")
+    report.add_argument("--days", type=float, help="Only calls from the last N days")
+    report.add_argument("--run", help="Only calls from this run id")
+    report.add_argument("--script", help="Only calls made by this script")
+
+    args = parser.parse_args()
+    since = time.time() - args.days * 86400 if args.days else None
+    entries = [
+        e for e in read_ledger(args.ledger, since)
+        if (not args.run or e.get("run") == args.run) and (not args.script or e.get("script") == args.script)
+    ]
+    print_report(entries, args.by)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Persistent on-disk cache for SociaVault API responses.
+
+Entries are keyed by endpoint plus normalized query params and stored in a
+single SQLite file. Each endpoint has its own TTL (transcripts never expire,
+popular lists expire in minutes) and the least recently used entries are
+evicted once the cache grows past its size cap. Transcript responses are only
+cached when they hold a transcript.
+
+The same file also holds a negative cache of videos that had no transcript,
+so bulk runs can skip them or go straight to the AI fallback tier.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = "data/cache/sociavault.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Seconds an entry stays fresh, per endpoint. None means never expires;
+# endpoints not listed here are not cached at all.
+CACHE_TTLS = {
+    "scrape/tiktok/transcript": None,
+    "scrape/tiktok/video-info": 7 * 24 * 3600,
+    "scrape/tiktok/search/keyword": 3600,
+    "scrape/tiktok/hashtags/popular": 10 * 60,
+    "scrape/tiktok/videos/popular": 10 * 60,
+}
+
+
+def _has_transcript(body):
+    try:
+        return bool((json.loads(body).get("data") or {}).get("transcript"))
+    except (ValueError, AttributeError):
+        return False
+
+
+# Per-endpoint check that a 200 body is worth keeping. Empty transcripts are
+# left out so they are re-requested once NO_TRANSCRIPT_TTL has passed.
+CACHE_CONDITIONS = {
+    "scrape/tiktok/transcript": _has_transcript,
+}
+
+# How long a "no transcript" result is trusted before the video is retried;
+# TikTok sometimes adds auto-captions to a video after it is posted.
+NO_TRANSCRIPT_TTL = 30 * 24 * 3600
+TRANSCRIPT_TIERS = ["native", "ai"]
+
+
+def _normalize_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        text = value.strip()
+        return text.lower() if text.lower() in ("true", "false") else text
+    return str(value)
+
+
+def make_key(endpoint, params=None):
+    """Stable hash of an endpoint and its params (order and bool spelling insensitive)."""
+    normalized = sorted(
+        (str(k), _normalize_value(v)) for k, v in (params or {}).items() if v is not None
+    )
+    raw = json.dumps([endpoint.strip("/"), normalized], separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with per-endpoint TTL and LRU eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, ttls=None, conditions=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self.conditions = CACHE_CONDITIONS if conditions is None else conditions
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS missing_transcripts (
+                video_id TEXT PRIMARY KEY,
+                tier TEXT NOT NULL,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def is_cacheable(self, endpoint):
+        return endpoint.strip("/") in self.ttls
+
+    def accepts(self, endpoint, body):
+        """Whether a 200 body from `endpoint` passes its CACHE_CONDITIONS check."""
+        condition = self.conditions.get(endpoint.strip("/"))
+        return condition is None or condition(body)
+
+    def get(self, endpoint, params=None):
+        """Return the cached body bytes, or None on a miss or expired entry."""
+        if not self.is_cacheable(endpoint):
+            return None
+        key = make_key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            # Entries stored before a condition existed (e.g. empty transcripts) are dropped too
+            if (expires_at is not None and expires_at <= now) or not self.accepts(endpoint, body):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return bytes(body)
+
+    def contains(self, endpoint, params=None):
+        """
+        Whether get() would return a body, without touching the entry: no
+        access time update and no removal of expired or rejected rows.
+        """
+        if not self.is_cacheable(endpoint):
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (make_key(endpoint, params),)
+            ).fetchone()
+        if row is None:
+            return False
+        body, expires_at = row
+        return (expires_at is None or expires_at > time.time()) and self.accepts(endpoint, body)
+
+    def put(self, endpoint, params, body):
+        """
+        Store a response body and evict LRU entries if over the size cap.
+        Bodies failing the endpoint's CACHE_CONDITIONS check are not stored.
+        """
+        endpoint = endpoint.strip("/")
+        if endpoint not in self.ttls or not self.accepts(endpoint, body):
+            return
+        ttl = self.ttls[endpoint]
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, size, created_at, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (make_key(endpoint, params), endpoint, sqlite3.Binary(body), len(body), now, now, expires_at),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop expired entries first, then least recently used until under the cap
+        self._conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def missing_transcript(self, video_id):
+        """
+        Highest tier ("native" or "ai") at which video_id recently had no
+        transcript, or None if it is unknown or the entry is stale.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tier, checked_at FROM missing_transcripts WHERE video_id = ?", (str(video_id),)
+            ).fetchone()
+        if row is None or row[1] + NO_TRANSCRIPT_TTL <= time.time():
+            return None
+        return row[0]
+
+    def mark_missing_transcript(self, video_id, tier="native"):
+        """Record that video_id had no transcript at `tier`; never downgrades ai to native."""
+        if self.missing_transcript(video_id) == "ai" and tier != "ai":
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO missing_transcripts (video_id, tier, checked_at) VALUES (?, ?, ?)",
+                (str(video_id), tier, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,69 @@
+"""
+Writers for saving SociaVault responses under data/.
+
+The default "raw" format writes the response body to disk exactly as the API
+sent it (already compact JSON), skipping the parse + pretty-print round trip.
+"gzip" compresses the same bytes, and "pretty" keeps the old indented output.
+"""
+
+import gzip
+import json
+import os
+
+FORMATS = ["raw", "gzip", "pretty"]
+DEFAULT_FORMAT = "raw"
+
+
+def output_path(path, fmt):
+    """Append .gz for the gzip format so readers can tell files apart."""
+    return f"{path}.gz" if fmt == "gzip" and not path.endswith(".gz") else path
+
+
+def save_response(response, path, fmt=DEFAULT_FORMAT):
+    """
+    Write a requests.Response body to `path` without re-serializing it.
+    Returns the path actually written.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    path = output_path(path, fmt)
+
+    if fmt == "pretty":
+        with open(path, "w") as f:
+            json.dump(response.json(), f, indent=2)
+        return path
+
+    # Requests are not streamed, so the body (live or cached) is already in memory
+    opener = gzip.open if fmt == "gzip" else open
+    with opener(path, "wb") as f:
+        f.write(response.content)
+    return path
+
+
+def save_json(obj, path, fmt=DEFAULT_FORMAT):
+    """
+    Write an in-memory object (e.g. a list aggregated across pages).
+    "raw" uses compact separators since there is no single response body.
+    Returns the path actually written.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    path = output_path(path, fmt)
+
+    if fmt == "pretty":
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+    else:
+        opener = gzip.open if fmt == "gzip" else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            json.dump(obj, f, separators=(",", ":"), ensure_ascii=False)
+    return path
+
+
+def load_json(path):
+    """Load a file written by either writer, transparently handling .gz."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Lexicon sentiment scorer for video descriptions, titles and transcripts.
+
+The research scripts used to test each of ~35 keywords with a substring
+`in` over the text, which also matched inside other words ("long" in
+"belong", "gain" in "against", "bear" in "beard"). Here texts are split
+into whole words and intersected with the compiled lexicon (every
+inflection mapped to its term), with the splitting and set work done in C
+on the UTF-8 bytes of the whole batch.
+
+A signal is a distinct lexicon term present in the text, as before:
+"buy", "buying" and "bought" together are one bullish signal.
+
+Negation: a term within NEGATION_WINDOW words after a negator ("not",
+"don't", "never", ...) in the same clause counts for the other side
+("don't buy" is bearish, "not a bubble" is bullish). Only texts holding
+both a term and a negator have their negators' windows checked.
+
+Results are deterministic: the same texts always give the same counts,
+whether scored one at a time or in a batch.
+
+Usage:
+    python3 scripts/sentiment.py score "Not a bubble, I'm buying more"
+    python3 scripts/sentiment.py bench [PATH ...] [--repeat 5]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from itertools import compress
+
+# Term -> inflections matched for it (the term itself included)
+BULLISH_TERMS = {
+    "buy": ["buy", "buys", "buying", "bought"],
+    "bull": ["bull", "bulls"],
+    "bullish": ["bullish"],
+    "long": ["long"],
+    "growth": ["growth", "growing"],
+    "profit": ["profit", "profits", "profitable"],
+    "gain": ["gain", "gains", "gained"],
+    "opportunity": ["opportunity", "opportunities"],
+    "breakout": ["breakout", "breakouts"],
+    "rally": ["rally", "rallies", "rallied", "rallying"],
+    "surge": ["surge", "surges", "surged", "surging"],
+    "moon": ["moon", "mooning"],
+    "rocket": ["rocket", "rockets", "rocketing"],
+    "upgrade": ["upgrade", "upgrades", "upgraded"],
+    "beat": ["beat", "beats"],
+    "outperform": ["outperform", "outperforms", "outperformed", "outperforming"],
+    "strong": ["strong", "stronger", "strongest"],
+    "positive": ["positive"],
+}
+
+BEARISH_TERMS = {
+    "sell": ["sell", "sells", "selling", "sold"],
+    "bear": ["bear", "bears"],
+    "bearish": ["bearish"],
+    "short": ["short", "shorts", "shorting"],
+    "decline": ["decline", "declines", "declined", "declining"],
+    "loss": ["loss", "losses"],
+    "crash": ["crash", "crashes", "crashed", "crashing"],
+    "risk": ["risk", "risks", "risky"],
+    "warning": ["warning", "warnings"],
+    "downgrade": ["downgrade", "downgrades", "downgraded"],
+    "miss": ["miss", "misses", "missed"],
+    "weak": ["weak", "weaker", "weakness"],
+    "negative": ["negative"],
+    "overvalued": ["overvalued"],
+    "bubble": ["bubble"],
+    "correction": ["correction"],
+    "downturn": ["downturn"],
+}
+
+NEGATORS = [
+    "not", "no", "never", "nothing", "without", "hardly", "neither", "nor", "cannot",
+    "don't", "dont", "doesn't", "doesnt", "didn't", "didnt", "isn't", "isnt", "aren't", "arent",
+    "wasn't", "wasnt", "won't", "wont", "can't", "cant", "shouldn't", "wouldn't",
+]
+
+# Words after a negator that it still applies to
+NEGATION_WINDOW = 3
+
+# Separates documents in a batch
+_DOC_SEPARATOR = b"\x1e"
+
+# Clause punctuation, which ends a negation's scope
+_CLAUSE_END = b".,!?;:"
+
+# Multi-byte punctuation that would otherwise stick to words ("“bullish”")
+_UNICODE_PUNCTUATION = ["“", "”", "‘", "—", "–", "…", "\u00a0"]
+
+
+def _byte_table(keep):
+    """bytes.translate table turning ASCII other than letters, digits and `keep` into spaces."""
+    table = bytearray(range(256))
+    for byte in range(128):
+        char = chr(byte)
+        if not (char.isalnum() or char in keep):
+            table[byte] = ord(" ")
+    return bytes(table)
+
+
+# Words, with clause punctuation as words of its own (spaced out first).
+# Bytes >= 0x80 are kept, so "isn’t" stays one word.
+_WORDS = _byte_table("'\x1e" + _CLAUSE_END.decode())
+
+
+def _tokenize_batch(texts):
+    """Per text, its lowercased UTF-8 words and clause punctuation, split in C over the whole batch."""
+    batch = "\x1e".join((text or "").replace("\x1e", " ") for text in texts).lower()
+    for mark in _UNICODE_PUNCTUATION:
+        batch = batch.replace(mark, " ")
+    data = batch.encode("utf-8")
+    for mark in _CLAUSE_END:
+        data = data.replace(bytes([mark]), b" " + bytes([mark]) + b" ")
+    return [doc.split() for doc in data.translate(_WORDS).split(_DOC_SEPARATOR)]
+
+
+class SentimentScorer:
+    """Compiled bullish/bearish lexicon with negation; build once, score many texts."""
+
+    def __init__(self, bullish=BULLISH_TERMS, bearish=BEARISH_TERMS, negators=NEGATORS,
+                 negation_window=NEGATION_WINDOW):
+        # Encoded inflection -> (term, +1 bullish / -1 bearish), and back
+        self.lexicon = {}
+        self.forms = {}
+        for terms, sign in ((bullish, 1), (bearish, -1)):
+            for term, forms in terms.items():
+                self.forms[term] = [form.encode("utf-8") for form in forms]
+                for form in self.forms[term]:
+                    self.lexicon[form] = (term, sign)
+        self.words = frozenset(self.lexicon)
+        self.negators = frozenset(
+            n.encode("utf-8") for negator in negators for n in (negator, negator.replace("'", "’"))
+        )
+        self.negation_window = negation_window
+
+    def counts(self, text):
+        """(bullish, bearish) signal counts for one text."""
+        return self.counts_batch([text])[0]
+
+    def counts_batch(self, texts):
+        """[(bullish, bearish), ...] for many texts, in order."""
+        if not texts:
+            return []
+        words, negators = self.words, self.negators
+        results = []
+        for tokens in _tokenize_batch(texts):
+            hits = words.intersection(tokens)
+            if not hits:
+                results.append((0, 0))
+                continue
+            signals = {self.lexicon[word] for word in hits}
+            if not negators.isdisjoint(tokens):
+                signals = self._apply_negation(tokens, hits, signals)
+            bullish = sum(1 for _, sign in signals if sign > 0)
+            results.append((bullish, len(signals) - bullish))
+        return results
+
+    def _apply_negation(self, tokens, hits, signals):
+        """
+        Signals of a text holding negators: a term negated at every
+        occurrence counts only for the other side, one also used plainly
+        counts for both.
+        """
+        lexicon, window = self.lexicon, self.negation_window
+        negated = {}  # Word -> occurrences inside a negator's window
+        for i in compress(range(len(tokens)), map(self.negators.__contains__, tokens)):
+            for token in tokens[i + 1:i + 1 + window]:
+                if token in lexicon:
+                    negated[token] = negated.get(token, 0) + 1
+                elif len(token) == 1 and token in _CLAUSE_END:
+                    break
+        if not negated:
+            return signals
+
+        signals = set(signals)
+        for term, sign in {lexicon[word] for word in negated}:
+            signals.add((term, -sign))
+            if not any(tokens.count(form) > negated.get(form, 0) for form in self.forms[term] if form in hits):
+                signals.discard((term, sign))
+        return signals
+
+    def score(self, text, has_transcript=False):
+        return classify(*self.counts(text), has_transcript=has_transcript)
+
+    def score_batch(self, texts, has_transcript=None):
+        """Sentiment results for many texts; has_transcript is an optional parallel list of flags."""
+        flags = [False] * len(texts) if has_transcript is None else has_transcript
+        if len(flags) != len(texts):
+            raise ValueError(f"has_transcript has {len(flags)} flags for {len(texts)} texts")
+        return [classify(b, s, has_transcript=f) for (b, s), f in zip(self.counts_batch(texts), flags)]
+
+
+def classify(bullish, bearish, has_transcript=False):
+    """Sentiment result in the shape the research scripts save."""
+    total = bullish + bearish
+    if bullish > bearish:
+        sentiment, confidence = "bullish", bullish / total
+    elif bearish > bullish:
+        sentiment, confidence = "bearish", bearish / total
+    else:
+        sentiment, confidence = "neutral", 0.5
+    return {
+        "sentiment": sentiment,
+        "confidence": round(confidence, 2),
+        "bullish_signals": bullish,
+        "bearish_signals": bearish,
+        "has_transcript": has_transcript,
+    }
+
+
+_scorer = None
+
+
+def get_scorer():
+    """The default scorer for this process (built once and shared)."""
+    global _scorer
+    if _scorer is None:
+        _scorer = SentimentScorer()
+    return _scorer
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+# Fields holding text worth scoring, per record in the saved API responses
+TEXT_FIELDS = ("title", "desc", "description", "selftext", "full_text", "transcript_text",
+               "transcript_only_text", "transcript")
+
+
+def load_documents(paths):
+    """Texts of every record with a text field in the JSON files under `paths`, in a fixed order."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += glob.glob(os.path.join(path, "**", "*.json"), recursive=True)
+        elif path.endswith(".json"):
+            files.append(path)
+
+    documents = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            parts = [node[f] for f in TEXT_FIELDS if isinstance(node.get(f), str) and node[f].strip()]
+            if parts:
+                documents.append("\n".join(parts))
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for file in sorted(set(files)):
+        try:
+            with open(file, encoding="utf-8") as f:
+                walk(json.load(f))
+        except (ValueError, OSError):
+            continue
+    return documents
+
+
+def legacy_counts(text):
+    """The substring test the research scripts used before, for comparison."""
+    text = text.lower()
+    bullish = ["buy", "bull", "bullish", "long", "growth", "profit", "gain", "opportunity", "breakout",
+               "rally", "surge", "moon", "rocket", "upgrade", "beat", "outperform", "strong", "positive"]
+    bearish = ["sell", "bear", "bearish", "short", "decline", "loss", "crash", "risk", "warning",
+               "downgrade", "miss", "weak", "negative", "overvalued", "bubble", "correction", "downturn"]
+    return sum(1 for k in bullish if k in text), sum(1 for k in bearish if k in text)
+
+
+def benchmark(paths, repeat=5):
+    documents = load_documents(paths)
+    size_mb = sum(len(d.encode("utf-8")) for d in documents) / 1e6
+    scorer = get_scorer()
+
+    def best_of(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    runs = {
+        "legacy substring": lambda: [legacy_counts(d) for d in documents],
+        "lexicon, per document": lambda: [scorer.counts(d) for d in documents],
+        "lexicon, batch": lambda: scorer.counts_batch(documents),
+    }
+    print(f"{len(documents)} documents, {size_mb:.2f} MB from {', '.join(paths)} (best of {repeat})")
+    results = {}
+    for name, fn in runs.items():
+        elapsed, results[name] = best_of(fn)
+        print(f"  {name:<24} {elapsed:7.3f}s  {len(documents) / elapsed:10,.0f} docs/s  {size_mb / elapsed:6.1f} MB/s")
+
+    lexicon = results["lexicon, batch"]
+    assert lexicon == results["lexicon, per document"], "batch and per-document scores differ"
+    labels = [classify(b, s)["sentiment"] for b, s in lexicon]
+    old_labels = [classify(b, s)["sentiment"] for b, s in results["legacy substring"]]
+    changed = sum(1 for a, b in zip(labels, old_labels) if a != b)
+    digest = hashlib.sha256(json.dumps(lexicon).encode()).hexdigest()[:16]
+    print(f"  labels: {labels.count('bullish')} bullish, {labels.count('bearish')} bearish, "
+          f"{labels.count('neutral')} neutral ({changed} differ from the substring test)")
+    print(f"  result digest: {digest} (identical across runs for the same files)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score text sentiment or benchmark the scorer.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score = subparsers.add_parser("score", help="Score one text")
+    score.add_argument("text", help="Text to score")
+
+    bench = subparsers.add_parser("bench", help="Throughput on the saved API responses")
+    bench.add_argument("paths", nargs="*", default=["data", "archive/data"],
+                       help="JSON files or directories (default: data archive/data)")
+    bench.add_argument("--repeat", type=int, default=5, help="Timed runs per method, best kept (default: 5)")
+
+    args = parser.parse_args()
+    if args.command == "score":
+        print(json.dumps(get_scorer().score(args.text), indent=2))
+    else:
+        benchmark(args.paths, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Local SQLite store for fetched social data.
+
+Upserts TikTok videos/hashtags/transcripts, Reddit posts/comments, tweets and
+YouTube videos into one database with indexes on id, author, create time and
+query, so questions like "top TSLA videos this week" are indexed lookups
+instead of re-scanning every JSON file under data/.
+
+Usage:
+    python3 scripts/social_store.py ingest data/*.json archive/data/reddit/*.json
+    python3 scripts/social_store.py top --platform tiktok --query TSLA --days 7
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+
+from response_writer import load_json
+from sociavault_client import normalize_list
+from timestamps import to_epoch
+
+DEFAULT_DB_PATH = "data/social.sqlite3"
+
+# Common columns every record table carries; `raw` holds the source record.
+_RECORD_COLUMNS = "id TEXT PRIMARY KEY, author TEXT, create_time INTEGER, raw TEXT, fetched_at REAL NOT NULL"
+
+TABLES = {
+    "tiktok_videos": "description TEXT, play_count INTEGER, like_count INTEGER, comment_count INTEGER, share_count INTEGER",
+    "tiktok_hashtags": "name TEXT, country TEXT, rank INTEGER, video_views INTEGER, publish_count INTEGER, industry TEXT",
+    "tiktok_transcripts": "url TEXT, transcript TEXT",
+    "reddit_posts": "subreddit TEXT, title TEXT, body TEXT, score INTEGER, num_comments INTEGER, permalink TEXT",
+    "reddit_comments": "post_id TEXT, body TEXT, score INTEGER",
+    "tweets": "text TEXT, like_count INTEGER, retweet_count INTEGER",
+    "youtube_videos": "title TEXT, description TEXT, channel TEXT, view_count INTEGER, like_count INTEGER, url TEXT",
+}
+
+# Which table and engagement column `top` ranks by, per platform.
+PLATFORMS = {
+    "tiktok": ("tiktok_videos", "play_count"),
+    "reddit": ("reddit_posts", "score"),
+    "twitter": ("tweets", "like_count"),
+    "youtube": ("youtube_videos", "view_count"),
+}
+
+
+def _dumps(record):
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+def _first(*values):
+    """First value that is not None, so a real 0 count is kept."""
+    return next((v for v in values if v is not None), None)
+
+
+class SocialStore:
+    """SQLite-backed store with one table per record type plus a query index."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        for table, columns in TABLES.items():
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({_RECORD_COLUMNS}, {columns})")
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_author ON {table} (author)")
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_create_time ON {table} (create_time)")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_items (
+                platform TEXT NOT NULL,
+                query TEXT NOT NULL,
+                item_id TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (platform, query, item_id)
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_query_items_query ON query_items (query, platform)")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Upserts
+    # ------------------------------------------------------------------
+
+    def _upsert(self, table, rows):
+        """Insert or update rows (dicts); known values are never overwritten with NULL."""
+        rows = [r for r in rows if r.get("id")]
+        if not rows:
+            return 0
+        now = time.time()
+        columns = list(rows[0].keys()) + ["fetched_at"]
+        updates = ", ".join(
+            f"{c} = COALESCE(excluded.{c}, {table}.{c})" for c in columns if c != "id"
+        )
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+        self.conn.executemany(sql, [[str(r["id"])] + [r[c] for c in columns[1:-1]] + [now] for r in rows])
+        self.conn.commit()
+        return len(rows)
+
+    def _record_query(self, platform, query, ids):
+        if not query:
+            return
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO query_items (platform, query, item_id, fetched_at) VALUES (?, ?, ?, ?)",
+            [(platform, query.strip().lower(), str(i), now) for i in ids if i],
+        )
+        self.conn.commit()
+
+    def known_ids(self, platform, query):
+        """Ids already stored for a query; the high-water mark for incremental searches."""
+        rows = self.conn.execute(
+            "SELECT item_id FROM query_items WHERE platform = ? AND query = ?",
+            (platform, query.strip().lower()),
+        )
+        return {row[0] for row in rows}
+
+    def upsert_tiktok_videos(self, videos, query=None):
+        """Upsert aweme records (search results, video-info details) or popular-list entries."""
+        rows = []
+        for v in videos:
+            stats = v.get("statistics") or {}
+            rows.append({
+                "id": v.get("aweme_id") or v.get("item_id") or v.get("id"),
+                "author": (v.get("author") or {}).get("unique_id") if isinstance(v.get("author"), dict) else None,
+                "create_time": to_epoch(v.get("create_time")),
+                "raw": _dumps(v),
+                "description": v.get("desc") or v.get("title"),
+                "play_count": stats.get("play_count"),
+                "like_count": stats.get("digg_count"),
+                "comment_count": stats.get("comment_count"),
+                "share_count": stats.get("share_count"),
+            })
+        self._record_query("tiktok", query, [r["id"] for r in rows])
+        return self._upsert("tiktok_videos", rows)
+
+    def upsert_tiktok_hashtags(self, hashtags):
+        rows = [{
+            "id": h.get("hashtag_id"),
+            "author": None,
+            "create_time": None,
+            "raw": _dumps(h),
+            "name": h.get("hashtag_name"),
+            "country": (h.get("country_info") or {}).get("id"),
+            "rank": h.get("rank"),
+            "video_views": h.get("video_views"),
+            "publish_count": h.get("publish_cnt"),
+            "industry": (h.get("industry_info") or {}).get("value"),
+        } for h in hashtags]
+        return self._upsert("tiktok_hashtags", rows)
+
+    def upsert_tiktok_transcript(self, video_id, url, transcript):
+        return self._upsert("tiktok_transcripts", [{
+            "id": video_id,
+            "author": None,
+            "create_time": None,
+            "raw": None,
+            "url": url,
+            "transcript": transcript,
+        }])
+
+    def upsert_reddit_posts(self, posts, query=None):
+        rows = [{
+            "id": p.get("id"),
+            "author": p.get("author"),
+            "create_time": to_epoch(p.get("created_utc")),
+            "raw": _dumps(p),
+            "subreddit": p.get("subreddit"),
+            "title": p.get("title"),
+            "body": p.get("selftext"),
+            "score": p.get("score"),
+            "num_comments": p.get("num_comments"),
+            "permalink": p.get("permalink"),
+        } for p in posts]
+        self._record_query("reddit", query, [r["id"] for r in rows])
+        return self._upsert("reddit_posts", rows)
+
+    def upsert_reddit_comments(self, comments, post_id=None):
+        rows = [{
+            "id": c.get("id"),
+            "author": c.get("author"),
+            "create_time": to_epoch(c.get("created_utc")),
+            "raw": _dumps(c),
+            "post_id": post_id or (c.get("link_id") or "").replace("t3_", "") or None,
+            "body": c.get("body"),
+            "score": c.get("score"),
+        } for c in comments if isinstance(c, dict)]
+        return self._upsert("reddit_comments", rows)
+
+    def upsert_tweets(self, tweets, query=None):
+        rows = []
+        for t in tweets:
+            legacy = t.get("legacy") or {}
+            user_legacy = (t.get("user") or {}).get("legacy") or {}
+            rows.append({
+                "id": t.get("rest_id") or t.get("id_str") or legacy.get("id_str") or t.get("id"),
+                "author": user_legacy.get("screen_name") or t.get("username"),
+                "create_time": to_epoch(legacy.get("created_at") or t.get("created_at")),
+                "raw": _dumps(t),
+                "text": legacy.get("full_text") or t.get("text") or t.get("full_text"),
+                "like_count": _first(legacy.get("favorite_count"), t.get("favorite_count")),
+                "retweet_count": _first(legacy.get("retweet_count"), t.get("retweet_count")),
+            })
+        self._record_query("twitter", query, [r["id"] for r in rows])
+        return self._upsert("tweets", rows)
+
+    def upsert_youtube_videos(self, videos, query=None):
+        rows = []
+        for v in videos:
+            channel = v.get("channel") or {}
+            rows.append({
+                "id": v.get("id"),
+                "author": channel.get("handle") or channel.get("id"),
+                "create_time": to_epoch(v.get("publishedTime") or v.get("publishDate")),
+                "raw": _dumps(v),
+                "title": v.get("title"),
+                "description": v.get("description"),
+                "channel": channel.get("title"),
+                "view_count": v.get("viewCountInt"),
+                "like_count": v.get("likeCountInt"),
+                "url": v.get("url"),
+            })
+        self._record_query("youtube", query, [r["id"] for r in rows])
+        return self._upsert("youtube_videos", rows)
+
+    # ------------------------------------------------------------------
+    # File ingest
+    # ------------------------------------------------------------------
+
+    def ingest_file(self, path, query=None):
+        """
+        Detect the shape of a saved data file and upsert its records.
+        Returns (kind, count); kind is None for files that aren't recognised.
+        """
+        name = os.path.basename(path)
+        slug = re.match(r"tiktok_search_(.+?)\.(nd)?json", name)
+        if query is None and slug:
+            query = slug.group(1).replace("_", " ")
+
+        if ".ndjson" in name:
+            with open(path) as f:
+                items = [json.loads(line) for line in f if line.strip()]
+            videos = [i.get("aweme_info") for i in items if i.get("aweme_info")]
+            return "tiktok_videos", self.upsert_tiktok_videos(videos, query)
+
+        data = load_json(path)
+
+        if isinstance(data, list):
+            if data and "hashtag_name" in data[0]:
+                return "tiktok_hashtags", self.upsert_tiktok_hashtags(data)
+            if data and ("item_id" in data[0] or "item_url" in data[0]):
+                return "tiktok_videos", self.upsert_tiktok_videos(data, query)
+            return None, 0
+
+        if not isinstance(data, dict):
+            return None, 0
+
+        # Stock research / ticker files written by the archive scripts
+        if "ticker" in data:
+            # Without a ticker or query the records are still stored, untagged
+            queries = {q for q in (data.get("ticker"), data.get("query")) if q} or {query}
+            if "posts" in data:
+                return "reddit_posts", max(self.upsert_reddit_posts(data["posts"], q) for q in queries)
+            if "tweets" in data:
+                return "tweets", max(self.upsert_tweets(data["tweets"], q) for q in queries)
+            videos = data.get("videos") or []
+            if videos and "aweme_id" in videos[0]:
+                return "tiktok_videos", max(self.upsert_tiktok_videos(videos, q) for q in queries)
+            if videos:
+                return "youtube_videos", max(self.upsert_youtube_videos(videos, q) for q in queries)
+            return "videos", 0
+
+        if "comments" in data and "metadata" in data:
+            comments = data["comments"]
+            if isinstance(comments, dict):
+                comments = normalize_list(comments.get("data", comments))
+            return "reddit_comments", self.upsert_reddit_comments(comments, data["metadata"].get("post_id"))
+
+        inner = data.get("data") if isinstance(data.get("data"), dict) else {}
+
+        if "search_item_list" in inner:
+            items = normalize_list(inner["search_item_list"])
+            videos = [i.get("aweme_info") for i in items if i.get("aweme_info")]
+            return "tiktok_videos", self.upsert_tiktok_videos(videos, query)
+
+        if "aweme_detail" in inner:
+            detail = inner.get("aweme_detail") or {}
+            count = self.upsert_tiktok_videos([detail], query)
+            if inner.get("transcript") and detail.get("aweme_id"):
+                self.upsert_tiktok_transcript(detail["aweme_id"], None, inner["transcript"])
+            return "tiktok_videos", count
+
+        if "transcript" in inner and inner.get("id"):
+            return "tiktok_transcripts", self.upsert_tiktok_transcript(inner["id"], inner.get("url"), inner.get("transcript"))
+
+        if "posts" in inner:
+            return "reddit_posts", self.upsert_reddit_posts(normalize_list(inner["posts"]), query)
+
+        if "tweets" in inner:
+            return "tweets", self.upsert_tweets(normalize_list(inner["tweets"]), query)
+
+        return None, 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def top(self, platform, query=None, days=None, author=None, limit=10):
+        """Top records by engagement, optionally restricted by query, recency and author."""
+        table, score = PLATFORMS[platform]
+        sql = f"SELECT t.* FROM {table} t"
+        clauses, params = [], []
+        if query:
+            sql += " JOIN query_items q ON q.item_id = t.id AND q.platform = ? AND q.query = ?"
+            params += [platform, query.strip().lower()]
+        if days:
+            clauses.append("t.create_time >= ?")
+            params.append(int(time.time() - days * 86400))
+        if author:
+            clauses.append("t.author = ?")
+            params.append(author)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY t.{score} DESC LIMIT ?"
+        params.append(limit)
+
+        cursor = self.conn.execute(sql, params)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def store_file(db_path, path, query=None):
+    """Ingest one saved file into the database at db_path. Returns (kind, count)."""
+    store = SocialStore(db_path)
+    try:
+        return store.ingest_file(path, query)
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SQLite store for fetched social data.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"Database path (default: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser("ingest", help="Upsert records from saved JSON/NDJSON files")
+    ingest.add_argument("paths", nargs="+", help="Files or glob patterns")
+    ingest.add_argument("--query", help="Query to associate with the records (default: from filename/ticker)")
+
+    top = subparsers.add_parser("top", help="Show top records by engagement")
+    top.add_argument("--platform", default="tiktok", choices=sorted(PLATFORMS), help="Platform (default: tiktok)")
+    top.add_argument("--query", help="Only records fetched for this query or ticker")
+    top.add_argument("--days", type=int, help="Only records created in the last N days")
+    top.add_argument("--author", help="Only records by this author/handle")
+    top.add_argument("--limit", type=int, default=10, help="Number of rows (default: 10)")
+
+    args = parser.parse_args()
+    store = SocialStore(args.db)
+
+    if args.command == "ingest":
+        paths = sorted({p for pattern in args.paths for p in (glob.glob(pattern, recursive=True) or [pattern])})
+        for path in paths:
+            try:
+                kind, count = store.ingest_file(path, args.query)
+            except (OSError, ValueError) as e:
+                print(f"Skipped {path}: {e}")
+                continue
+            if kind:
+                print(f"{path}: {count} {kind}")
+            else:
+                print(f"Skipped {path}: unrecognised format")
+    else:
+        table, score = PLATFORMS[args.platform]
+        rows = store.top(args.platform, args.query, args.days, args.author, args.limit)
+        if not rows:
+            print("No matching records.")
+        for i, row in enumerate(rows, 1):
+            label = row.get("title") or row.get("description") or row.get("text") or ""
+            label = label.strip().replace("\n", " ")[:60]
+            when = datetime.fromtimestamp(row["create_time"]).strftime("%Y-%m-%d") if row.get("create_time") else "-"
+            print(f"{i:<3} {(row.get(score) or 0):>12,}  {when}  @{row.get('author') or '-':<20} {label}")
+
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
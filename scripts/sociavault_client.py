@@ -0,0 +1,305 @@
+"""
+Shared SociaVault HTTP client used by every script in scripts/.
+
+Keeps one pooled keep-alive session per process so multi-page pulls reuse
+the same TCP+TLS connection instead of handshaking on every request.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from concurrency import DEFAULT_INITIAL_LIMIT, DEFAULT_MAX_LIMIT, AIMDController, endpoint_family
+from rate_limiter import (DEFAULT_BURST, DEFAULT_RATE, DEFAULT_STATE_PATH, TokenBucket, backoff_delay, jittered,
+                          retry_after_seconds)
+from request_ledger import DEFAULT_LEDGER_PATH, RequestLedger
+from response_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, ResponseCache
+
+BASE_URL = "https://api.sociavault.com/v1"
+
+# (connect, read) timeouts in seconds; override with SOCIAVAULT_CONNECT_TIMEOUT
+# and SOCIAVAULT_READ_TIMEOUT.
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 60
+
+# Upper bound on open connections kept alive to the API host.
+DEFAULT_POOL_SIZE = 10
+
+# Responses retried after honouring Retry-After (or backing off), and how often.
+RETRY_STATUSES = (429, 503)
+DEFAULT_MAX_RETRIES = 3
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    try:
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+def default_cache():
+    """
+    Build the response cache from the environment. SOCIAVAULT_CACHE sets the
+    cache file path ("off" disables caching) and SOCIAVAULT_CACHE_MAX_MB its
+    size cap.
+    """
+    path = os.environ.get("SOCIAVAULT_CACHE", DEFAULT_CACHE_PATH)
+    if path.lower() in ("off", "0", "false", "none", ""):
+        return None
+    max_bytes = int(_env_float("SOCIAVAULT_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)) * 1024 * 1024)
+    return ResponseCache(path, max_bytes=max_bytes)
+
+
+def default_ledger():
+    """Build the request ledger from SOCIAVAULT_LEDGER (a JSONL path, or "off")."""
+    path = os.environ.get("SOCIAVAULT_LEDGER", DEFAULT_LEDGER_PATH)
+    if path.lower() in ("off", "0", "false", "none", ""):
+        return None
+    return RequestLedger(path)
+
+
+def default_limiter():
+    """
+    Build the shared rate limiter from the environment. SOCIAVAULT_RATE_LIMIT
+    sets requests per second ("off" disables limiting) and
+    SOCIAVAULT_RATE_BURST how many may go back to back.
+    """
+    rate = os.environ.get("SOCIAVAULT_RATE_LIMIT", "")
+    if rate.lower() in ("off", "0", "false", "none"):
+        return None
+    return TokenBucket(
+        rate=_env_float("SOCIAVAULT_RATE_LIMIT", DEFAULT_RATE),
+        burst=_env_float("SOCIAVAULT_RATE_BURST", DEFAULT_BURST),
+        path=DEFAULT_STATE_PATH,
+    )
+
+
+def default_concurrency():
+    """
+    Build the adaptive concurrency controller from the environment.
+    SOCIAVAULT_MAX_CONCURRENCY caps requests in flight per endpoint family
+    ("off" disables the controller); SOCIAVAULT_INITIAL_CONCURRENCY is the
+    starting limit.
+    """
+    maximum = os.environ.get("SOCIAVAULT_MAX_CONCURRENCY", "")
+    if maximum.lower() in ("off", "0", "false", "none"):
+        return None
+    return AIMDController(
+        initial=int(_env_float("SOCIAVAULT_INITIAL_CONCURRENCY", DEFAULT_INITIAL_LIMIT)),
+        maximum=int(_env_float("SOCIAVAULT_MAX_CONCURRENCY", DEFAULT_MAX_LIMIT)),
+    )
+
+
+@contextmanager
+def _unlimited_slot():
+    yield lambda status, latency: None
+
+
+def _cached_response(url, body):
+    """Wrap cached bytes in a requests.Response so callers can't tell the difference."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    # Body is already in memory, so iter_content/iter_lines replay it like a read live response
+    response._content_consumed = True
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response.from_cache = True
+    return response
+
+
+class SociaVaultClient:
+    """Thin wrapper around a pooled requests.Session for the SociaVault API."""
+
+    def __init__(self, api_key=None, base_url=None, timeout=None, pool_size=DEFAULT_POOL_SIZE, cache=None, ledger=None,
+                 limiter=None, max_retries=DEFAULT_MAX_RETRIES, concurrency=None):
+        self.api_key = api_key or os.environ.get("SOCIAVAULT_API_KEY")
+        self.base_url = (base_url or os.environ.get("SOCIAVAULT_BASE_URL") or BASE_URL).rstrip("/")
+        self.timeout = timeout or (
+            _env_float("SOCIAVAULT_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT),
+            _env_float("SOCIAVAULT_READ_TIMEOUT", DEFAULT_READ_TIMEOUT),
+        )
+
+        self.cache = cache
+        self.ledger = ledger
+        self.limiter = limiter
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if self.api_key:
+            self.session.headers["X-API-Key"] = self.api_key
+
+    def url_for(self, endpoint):
+        """Build a full URL from an endpoint path like 'scrape/tiktok/transcript'."""
+        if endpoint.startswith("http://") or endpoint.startswith("https://"):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def get(self, endpoint, params=None, timeout=None, use_cache=True, **kwargs):
+        """
+        Issue a GET against the API and return the raw requests.Response.
+
+        Cacheable endpoints are served from the response cache when fresh;
+        responses carry `from_cache` so callers can report it. Every call,
+        cached or not, is appended to the request ledger when one is set.
+
+        Live requests wait for a slot from the adaptive concurrency controller
+        and a token from the shared rate limiter first. A 429 or 503 pauses
+        the limiter for its Retry-After (or a jittered backoff) and is
+        retried up to max_retries times; the last response is returned.
+        """
+        url = self.url_for(endpoint)
+        cache = self.cache if use_cache and self.cache and self.cache.is_cacheable(endpoint) else None
+        start = time.perf_counter()
+
+        if cache:
+            body = cache.get(endpoint, params)
+            if body is not None:
+                if self.ledger:
+                    self.ledger.record(endpoint, params, 200, time.perf_counter() - start, body, from_cache=True)
+                return _cached_response(url, body)
+
+        for attempt in range(self.max_retries + 1):
+            with (self.concurrency.slot(endpoint) if self.concurrency else _unlimited_slot()) as done:
+                if self.limiter:
+                    self.limiter.acquire()
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        timeout=timeout or self.timeout,
+                        **kwargs
+                    )
+                except requests.RequestException as e:
+                    done(None, time.perf_counter() - start)
+                    if self.ledger:
+                        self.ledger.record(endpoint, params, None, time.perf_counter() - start,
+                                           error=type(e).__name__, extra=self._metrics(endpoint))
+                    raise
+                latency = time.perf_counter() - start
+                done(response.status_code, latency)
+            response.from_cache = False
+            if self.ledger:
+                self.ledger.record(endpoint, params, response.status_code, latency, response.content,
+                                   extra=self._metrics(endpoint))
+
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                break
+            delay = retry_after_seconds(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if self.limiter:
+                self.limiter.pause(delay)
+            else:
+                time.sleep(jittered(delay))
+
+        if cache and response.status_code == 200:
+            cache.put(endpoint, params, response.content)
+        return response
+
+    def _metrics(self, endpoint):
+        """Concurrency state recorded alongside each ledger entry."""
+        if not self.concurrency:
+            return None
+        return {"family": endpoint_family(endpoint), "concurrency": self.concurrency.limit(endpoint)}
+
+    def check_credits(self):
+        """Return the account's credit balance (this endpoint costs 0 credits), or None on failure."""
+        response = self.get("credits", use_cache=False)
+        if response.status_code != 200:
+            return None
+        return response.json().get("credits")
+
+    def close(self):
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def normalize_list(value):
+    """
+    Convert the API's "dict with numeric string keys" shape into a list.
+
+    Several endpoints return arrays as {"0": {...}, "1": {...}}; keys are
+    sorted numerically so the original order is preserved. Lists pass through
+    unchanged and anything else becomes an empty list.
+    """
+    if isinstance(value, dict):
+        sorted_keys = sorted(value.keys(), key=lambda x: (0, int(x)) if str(x).isdigit() else (1, str(x)))
+        return [value[k] for k in sorted_keys]
+    if isinstance(value, list):
+        return value
+    return []
+
+
+def fetch_pages(fetch_page, pages, workers=1):
+    """
+    Fetch numbered pages 1..pages with up to `workers` requests in flight.
+
+    `fetch_page(page)` must return `(items, has_more)`. Results are yielded in
+    page order as `(page, items, has_more)`. As soon as any page comes back
+    empty or with has_more false, no later pages are requested, and pages
+    already queued past it are cancelled and never yielded. Exceptions raised
+    by `fetch_page` propagate when their page is reached.
+    """
+    workers = max(1, min(workers, pages)) if pages > 0 else 1
+    lock = threading.Lock()
+    state = {"last_page": pages}
+
+    def run(page):
+        items, has_more = fetch_page(page)
+        if not items or not has_more:
+            with lock:
+                state["last_page"] = min(state["last_page"], page)
+        return items, has_more
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending = {}
+    next_page = 1
+    try:
+        for page in range(1, pages + 1):
+            # Keep the window full, but never past the known last page.
+            while next_page <= state["last_page"] and len(pending) < workers:
+                pending[next_page] = pool.submit(run, next_page)
+                next_page += 1
+            if page > state["last_page"]:
+                break
+
+            items, has_more = pending.pop(page).result()
+            yield page, items, has_more
+            if not items or not has_more:
+                break
+    finally:
+        for future in pending.values():
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_client = None
+
+
+def get_client(api_key=None):
+    """Return the process-wide shared client, creating it on first use."""
+    global _client
+    if _client is None or (api_key and _client.api_key != api_key):
+        _client = SociaVaultClient(api_key, cache=default_cache(), ledger=default_ledger(),
+                                   limiter=default_limiter(), concurrency=default_concurrency())
+    return _client
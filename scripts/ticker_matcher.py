@@ -0,0 +1,155 @@
+"""
+Multi-pattern ticker matcher for posts, tweets and video text.
+
+Company names and aliases are compiled into one Aho-Corasick automaton over
+lowercased word tokens; symbols are looked up in a hash table from the few
+tokens that can be a symbol mention (cashtags and words in capitals). A
+text is scanned once however many tickers are watched, and every ticker it
+mentions comes back from that single pass. Matching on whole tokens gives
+word boundaries for free ("meta" doesn't match "metadata", "AMD" doesn't
+match "AMDOCS").
+
+Matching rules:
+    - $TSLA / #tsla (cashtag or hashtag): any case, any symbol.
+    - TSLA (bare symbol): must be written in capitals, and symbols that are
+      also everyday words (AI, ON, IT, ...) need the cashtag.
+    - Company names and aliases: case-insensitive, whole words.
+"""
+
+import re
+
+# Word tokens, keeping "." and "&" inside symbols and names (BRK.B, S&P).
+WORD_RE = re.compile(r"[^\W_]+(?:[.&][^\W_]+)*")
+
+# Possible symbol mentions: a cashtag/hashtag in any case (group 1) or a
+# whole word written in capitals (group 2).
+SYMBOL_RE = re.compile(
+    r"(?<![^\W_])(?:[$#]([^\W_]+(?:[.&][^\W_]+)*)|([A-Z][A-Z0-9]*(?:[.&][A-Z0-9]+)*))(?![^\W_])"
+)
+
+# Symbols that read as ordinary words or jargon when written bare; only a
+# cashtag, hashtag or the company name counts as a mention.
+AMBIGUOUS_SYMBOLS = {
+    "A", "AI", "ALL", "AM", "ARE", "AT", "BE", "BIG", "CAN", "CEO", "DD", "EV", "FOR", "GO", "HAS",
+    "IT", "NOW", "ON", "ONE", "OR", "OUT", "SO", "TV", "UK", "US", "USA", "YOLO",
+}
+
+class TickerMatcher:
+    """
+    Symbol table plus an Aho-Corasick automaton of company names.
+
+    Build it once from {ticker: name or [names]} and reuse it for every text.
+    """
+
+    def __init__(self, mapping=None, ambiguous=AMBIGUOUS_SYMBOLS):
+        self.ambiguous = {s.upper() for s in ambiguous}
+        self._symbols = {}  # Normalized symbol -> ticker
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]  # Per state: tickers whose name ends here
+        self._built = False
+        for ticker, names in (mapping or {}).items():
+            self.add(ticker, names)
+
+    def add(self, ticker, names=()):
+        """Watch `ticker`, plus any company names/aliases for it."""
+        if isinstance(names, str):
+            names = [names]
+        ticker = ticker.upper()
+        self._symbols[ticker.lstrip("$#")] = ticker
+        for name in names or ():
+            if name:
+                self._add_name(ticker, name)
+        self._built = False
+
+    def _add_name(self, ticker, name):
+        tokens = WORD_RE.findall(name.lower())
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        if ticker not in self._out[state]:
+            self._out[state].append(ticker)
+
+    def _build(self):
+        """Breadth-first failure links; each state inherits its fail state's outputs."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        i = 0
+        while i < len(queue):
+            state = queue[i]
+            i += 1
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._built = True
+
+    def compile(self):
+        """Build the failure links now rather than on the first find(); returns self."""
+        if not self._built:
+            self._build()
+        return self
+
+    @property
+    def tickers(self):
+        return set(self._symbols.values())
+
+    def find(self, text):
+        """Set of tickers mentioned in `text`."""
+        if not self._built:
+            self._build()
+        if not text:
+            return set()
+
+        found = set()
+        symbols = self._symbols
+        for cashtag, bare in SYMBOL_RE.findall(text):
+            if cashtag:
+                ticker = symbols.get(cashtag.upper())
+            elif len(bare) > 1 and bare not in self.ambiguous:
+                ticker = symbols.get(bare)
+            else:
+                continue
+            if ticker:
+                found.add(ticker)
+
+        goto, fail, out, root = self._goto, self._fail, self._out, self._goto[0]
+        if not root:
+            return found
+        state = 0
+        for key in WORD_RE.findall(text.lower()):
+            if state == 0:
+                state = root.get(key, 0)
+            else:
+                while state and key not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(key, 0)
+            if state and out[state]:
+                found.update(out[state])
+        return found
+
+    def tag(self, records, text_of):
+        """Tickers mentioned by each record, in order: [set, ...]."""
+        return [self.find(text_of(record)) for record in records]
+
+    def group(self, records, text_of):
+        """{ticker: [records mentioning it]} for every watched ticker found, in record order."""
+        groups = {}
+        for record in records:
+            for ticker in self.find(text_of(record)):
+                groups.setdefault(ticker, []).append(record)
+        return groups
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Ticker universe: symbols, company names and aliases for the listed market.
+
+Source files in data/tickers/ (any mix, all merged):
+    - NASDAQ Trader symbol directory files (nasdaqlisted.txt, otherlisted.txt),
+      pipe-delimited, as downloaded from nasdaqtrader.com
+    - CSV files with a header of symbol,name[,aliases]; aliases separated by ";"
+
+The built-in SEED_TICKERS are always included, so the research scripts keep
+working with no source files at all.
+
+Parsing thousands of rows and compiling the matcher takes a while, so the
+compiled universe is pickled to data/cache/ticker_universe.pickle and
+reused until a source file changes; loading it takes milliseconds.
+
+Usage:
+    python3 scripts/ticker_universe.py build
+    python3 scripts/ticker_universe.py find "Is $NVDA or Advanced Micro Devices the better buy?"
+"""
+
+import argparse
+import csv
+import glob
+import os
+import pickle
+import re
+import time
+
+from ticker_matcher import TickerMatcher
+
+DEFAULT_UNIVERSE_DIR = "data/tickers"
+DEFAULT_CACHE_PATH = "data/cache/ticker_universe.pickle"
+
+# Bump when the pickled layout or the name rules change
+CACHE_VERSION = 1
+
+# Symbols, names and aliases every universe starts from.
+SEED_TICKERS = {
+    "TSLA": ["Tesla"],
+    "AAPL": ["Apple"],
+    "NVDA": ["NVIDIA"],
+    "MSFT": ["Microsoft"],
+    "AMZN": ["Amazon"],
+    "GOOGL": ["Google", "Alphabet"],
+    "META": ["Meta", "Meta Platforms", "Facebook"],
+    "AMD": ["AMD", "Advanced Micro Devices"],
+    "PLTR": ["Palantir"],
+    "GME": ["GameStop"],
+    "SPY": ["S&P 500"],
+    "QQQ": ["NASDAQ"],
+    "VOO": ["Vanguard S&P 500"],
+}
+
+# Listing descriptions after the company name: "Apple Inc. - Common Stock",
+# "Alphabet Inc. Class A Common Stock", "Toyota Motor Corp ADS".
+_SECURITY_RE = re.compile(
+    r"\s+(?:-\s+.*|(?:Class|Series)\s+[A-Z]\b.*|(?:Common|Ordinary|Capital|Preferred)\s+(?:Stock|Shares).*"
+    r"|American Depositary.*|ADS\b.*|ETF\b.*|Units?\b.*|Warrants?\b.*)$",
+    re.IGNORECASE,
+)
+# Legal suffixes dropped for the short form of a name: "Advanced Micro Devices, Inc."
+_LEGAL_RE = re.compile(
+    r",?\s+(?:Inc|Incorporated|Corp|Corporation|Co|Company|Ltd|Limited|plc|N\.?V|S\.?A|AG|SE|L\.?P|LLC"
+    r"|Holdings?|Group|Trust)\.?$",
+    re.IGNORECASE,
+)
+
+
+def clean_names(security_name):
+    """
+    Names to match for a listing's security name.
+
+    The full company name ("Target Corporation") is always kept. The short
+    form without legal suffixes is added only when it is still more than one
+    word ("Advanced Micro Devices"): single words like "Target" or "Block"
+    are too often ordinary English, so those need an explicit alias.
+    """
+    name = _SECURITY_RE.sub("", security_name or "").strip(" ,")
+    if not name:
+        return []
+    names = [name]
+    short = name
+    while True:
+        stripped = _LEGAL_RE.sub("", short).strip(" ,")
+        if stripped == short:
+            break
+        short = stripped
+    if short != name and len(short.split()) > 1:
+        names.append(short)
+    return names
+
+
+def normalize_symbol(symbol):
+    """BRK-B, BRK/B and BRK.B are the same listing; the matcher uses the dotted form."""
+    return re.sub(r"[-/]", ".", (symbol or "").strip().upper())
+
+
+def read_source(path):
+    """Yield (symbol, [names]) from a NASDAQ Trader file or a symbol,name[,aliases] CSV."""
+    with open(path, newline="", encoding="utf-8") as f:
+        first = f.readline()
+        f.seek(0)
+        if "|" in first:
+            for row in csv.DictReader(f, delimiter="|"):
+                symbol = row.get("Symbol") or row.get("ACT Symbol") or row.get("NASDAQ Symbol")
+                # The directory files end with a "File Creation Time" row
+                if not symbol or symbol.startswith("File Creation Time") or row.get("Test Issue") == "Y":
+                    continue
+                yield normalize_symbol(symbol), clean_names(row.get("Security Name"))
+        else:
+            for row in csv.DictReader(f):
+                row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+                if not row.get("symbol"):
+                    continue
+                names = clean_names(row.get("name")) if row.get("name") else []
+                names += [alias.strip() for alias in row.get("aliases", "").split(";") if alias.strip()]
+                yield normalize_symbol(row["symbol"]), names
+
+
+def source_files(source_dir=DEFAULT_UNIVERSE_DIR):
+    """Listing files first, then alias CSVs, so official names come before aliases."""
+    return sorted(glob.glob(os.path.join(source_dir, "*.txt"))) + sorted(glob.glob(os.path.join(source_dir, "*.csv")))
+
+
+class TickerUniverse:
+    """Company names per ticker plus one compiled TickerMatcher over the whole universe."""
+
+    def __init__(self, names=None):
+        self.names = {}  # Ticker -> list of names, display name first
+        for ticker, ticker_names in (names or {}).items():
+            self.add(ticker, ticker_names)
+        self._matcher = None
+
+    def add(self, ticker, names=()):
+        known = self.names.setdefault(normalize_symbol(ticker), [])
+        for name in names:
+            if name and name not in known:
+                known.append(name)
+        self._matcher = None
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = TickerMatcher(self.names).compile()
+        return self._matcher
+
+    def matcher_for(self, tickers):
+        """
+        A matcher covering `tickers`: the shared universe matcher when they
+        are all known, else a small one with their names plus the unknown
+        symbols (matched as bare/cashtag symbols only).
+        """
+        tickers = [normalize_symbol(t) for t in tickers]
+        if all(t in self.names for t in tickers):
+            return self.matcher
+        return TickerMatcher({t: self.names.get(t, []) for t in tickers}).compile()
+
+    def company_name(self, ticker):
+        """Display name for a ticker ("" if unknown)."""
+        names = self.names.get(normalize_symbol(ticker))
+        return names[0] if names else ""
+
+    def find(self, text):
+        return self.matcher.find(text)
+
+    def __contains__(self, ticker):
+        return normalize_symbol(ticker) in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+
+def build_universe(paths):
+    """Universe from the given source files on top of SEED_TICKERS; seed names stay first."""
+    universe = TickerUniverse(SEED_TICKERS)
+    for path in paths:
+        for symbol, names in read_source(path):
+            universe.add(symbol, names)
+    universe.matcher  # Compile now so the pickle holds the finished automaton
+    return universe
+
+
+def _signature(paths):
+    return [CACHE_VERSION] + [(os.path.abspath(p), os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths]
+
+
+_universe = None
+
+
+def load_universe(source_dir=DEFAULT_UNIVERSE_DIR, cache_path=DEFAULT_CACHE_PATH, rebuild=False):
+    """
+    The ticker universe for this process (loaded once and shared).
+
+    Served from the pickle at cache_path while its recorded source files are
+    unchanged; otherwise rebuilt from source_dir and re-pickled.
+    """
+    global _universe
+    if _universe is not None and not rebuild:
+        return _universe
+
+    paths = source_files(source_dir)
+    signature = _signature(paths)
+    if cache_path and os.path.exists(cache_path) and not rebuild:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_signature, names, matcher = pickle.load(f)
+            if cached_signature == signature:
+                _universe = TickerUniverse()
+                _universe.names, _universe._matcher = names, matcher
+                return _universe
+        except Exception:
+            pass  # Unreadable or from another version: rebuild
+
+    universe = build_universe(paths)
+    if cache_path:
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(cache_path + ".tmp", "wb") as f:
+            # Plain dicts and the matcher only, so the pickle doesn't depend on
+            # whether this module ran as a script or was imported
+            pickle.dump((signature, universe.names, universe.matcher), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + ".tmp", cache_path)
+    _universe = universe
+    return universe
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the ticker universe.")
+    parser.add_argument("--dir", default=DEFAULT_UNIVERSE_DIR, help=f"Source file directory (default: {DEFAULT_UNIVERSE_DIR})")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help=f"Compiled universe (default: {DEFAULT_CACHE_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("build", help="Rebuild the compiled universe from the source files")
+    find = subparsers.add_parser("find", help="List the tickers a piece of text mentions")
+    find.add_argument("text", help="Text to scan")
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+    universe = load_universe(args.dir, args.cache, rebuild=args.command == "build")
+    elapsed = time.perf_counter() - start
+
+    if args.command == "build":
+        print(f"Built {len(universe)} tickers from {len(source_files(args.dir))} source file(s) "
+              f"in {elapsed:.2f}s -> {args.cache}")
+    else:
+        for ticker in sorted(universe.find(args.text)):
+            print(f"{ticker:<8} {universe.company_name(ticker)}")
+        print(f"(universe of {len(universe)} tickers loaded in {elapsed * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 import os
-import json
-import requests
 import argparse
 import sys
 
-def get_popular_hashtags(period=7, pages=5, country="US", new_only=False):
+from response_writer import DEFAULT_FORMAT, FORMATS, save_json
+from social_store import store_file
+from sociavault_client import fetch_pages, get_client, normalize_list
+
+def get_popular_hashtags(period=7, pages=5, country="US", new_only=False, workers=1, fmt=DEFAULT_FORMAT, db_path=None):
     """
     Fetches the list of popular hashtags from TikTok via SociaVault.
     Saves the full list to the 'data' folder.
+
+    With workers > 1, up to that many pages are requested in parallel;
+    results are still collected in page order.
     """
     api_key = os.environ.get("SOCIAVAULT_API_KEY")
     if not api_key:
@@ -18,13 +23,13 @@ def get_popular_hashtags(period=7, pages=5, country="US", new_only=False):
     if new_only:
         print("Filtering for: Newly Trending only.")
     
+    client = get_client(api_key)
     all_hashtags = []
-    
-    for page in range(1, pages + 1):
+
+    def fetch_page(page):
         print(f"Requesting Page {page}...")
-        response = requests.get(
-            "https://api.sociavault.com/v1/scrape/tiktok/hashtags/popular",
-            headers={"X-API-Key": api_key},
+        response = client.get(
+            "scrape/tiktok/hashtags/popular",
             params={
                 "period": period,
                 "page": page,
@@ -32,43 +37,41 @@ def get_popular_hashtags(period=7, pages=5, country="US", new_only=False):
                 "newOnBoard": new_only
             }
         )
-        
-        if response.status_code == 200:
-            data = response.json()
-            # The API returns a dictionary where keys are strings "0", "1", etc.
-            list_data = data.get("data", {}).get("list", {})
-            
-            if isinstance(list_data, dict):
-                # Sort by numeric keys to maintain order
-                sorted_keys = sorted(list_data.keys(), key=lambda x: int(x) if x.isdigit() else x)
-                page_items = [list_data[k] for k in sorted_keys]
-            else:
-                page_items = list_data
 
-            if not page_items:
-                print("No more hashtags found.")
-                break
-                
-            all_hashtags.extend(page_items)
-            
-            # Check if there are more pages according to API metadata
-            pagination = data.get("data", {}).get("pagination", {})
-            if not pagination.get("has_more"):
-                print("End of results reached (has_more is false).")
-                break
-        else:
+        if response.status_code != 200:
             print(f"Error on page {page}: {response.status_code}")
             print(response.text)
+            return None, False
+
+        data = response.json()
+        # The API returns a dictionary where keys are strings "0", "1", etc.
+        page_items = normalize_list(data.get("data", {}).get("list", {}))
+        # Check if there are more pages according to API metadata
+        pagination = data.get("data", {}).get("pagination", {})
+        return page_items, pagination.get("has_more")
+
+    for page, page_items, has_more in fetch_pages(fetch_page, pages, workers):
+        if page_items is None:
+            break
+
+        if not page_items:
+            print("No more hashtags found.")
+            break
+
+        all_hashtags.extend(page_items)
+
+        if not has_more:
+            print("End of results reached (has_more is false).")
             break
 
     if all_hashtags:
         # Save to data folder
-        os.makedirs("data", exist_ok=True)
-        file_path = "data/tiktok_popular_hashtags.json"
-        with open(file_path, "w") as f:
-            json.dump(all_hashtags, f, indent=2)
+        file_path = save_json(all_hashtags, "data/tiktok_popular_hashtags.json", fmt)
             
         print(f"\nSuccess! Total {len(all_hashtags)} hashtags saved to {file_path}")
+        if db_path:
+            kind, count = store_file(db_path, file_path)
+            print(f"Indexed {count} {kind} in {db_path}")
         
         # Display Top 10 Summary
         print("\nTop 10 Popular Hashtags:")
@@ -89,6 +92,9 @@ if __name__ == "__main__":
     parser.add_argument("--pages", type=int, default=5, help="Number of pages to fetch (default: 5, ~100 hashtags)")
     parser.add_argument("--country", default="US", help="Country code (default: US)")
     parser.add_argument("--new", action="store_true", help="Show only newly trending hashtags")
+    parser.add_argument("--workers", type=int, default=1, help="Pages to fetch in parallel (default: 1)")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=FORMATS, help=f"Output format (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--db", help="Also upsert the saved records into this SQLite store (see social_store.py)")
     
     args = parser.parse_args()
-    get_popular_hashtags(period=args.period, pages=args.pages, country=args.country, new_only=args.new)
+    get_popular_hashtags(period=args.period, pages=args.pages, country=args.country, new_only=args.new, workers=args.workers, fmt=args.format, db_path=args.db)
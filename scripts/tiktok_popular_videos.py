@@ -1,13 +1,22 @@
 import os
-import json
-import requests
 import argparse
 import sys
 
-def get_popular_videos(period=7, pages=1, order_by="hot", country="US"):
+from projection import POPULAR_VIDEO_FIELDS, cold_path, project
+from response_writer import DEFAULT_FORMAT, FORMATS, save_json
+from social_store import store_file
+from sociavault_client import fetch_pages, get_client, normalize_list
+
+def get_popular_videos(period=7, pages=1, order_by="hot", country="US", workers=1, fmt=DEFAULT_FORMAT,
+                       project_fields=False, keep_raw=False, db_path=None):
     """
     Fetches the list of popular videos from TikTok via SociaVault.
     Saves the full list to the 'data' folder.
+
+    With workers > 1, up to that many pages are requested in parallel;
+    results are still collected in page order. With project_fields, only
+    projection.POPULAR_VIDEO_FIELDS are stored; keep_raw additionally keeps
+    the full list under data/raw/.
     """
     api_key = os.environ.get("SOCIAVAULT_API_KEY")
     if not api_key:
@@ -16,13 +25,13 @@ def get_popular_videos(period=7, pages=1, order_by="hot", country="US"):
 
     print(f"Fetching popular videos for {country} (Period: {period} days, Sort: {order_by})...")
     
+    client = get_client(api_key)
     all_videos = []
-    
-    for page in range(1, pages + 1):
+
+    def fetch_page(page):
         print(f"Requesting Page {page}...")
-        response = requests.get(
-            "https://api.sociavault.com/v1/scrape/tiktok/videos/popular",
-            headers={"X-API-Key": api_key},
+        response = client.get(
+            "scrape/tiktok/videos/popular",
             params={
                 "period": period,
                 "page": page,
@@ -30,41 +39,46 @@ def get_popular_videos(period=7, pages=1, order_by="hot", country="US"):
                 "countryCode": country
             }
         )
-        
-        if response.status_code == 200:
-            data = response.json()
-            # API returns videos as a dict with numeric keys "0", "1", etc.
-            raw_videos = data.get("data", {}).get("videos", {})
-            
-            if isinstance(raw_videos, dict):
-                sorted_keys = sorted(raw_videos.keys(), key=lambda x: int(x) if x.isdigit() else x)
-                page_items = [raw_videos[k] for k in sorted_keys]
-            else:
-                page_items = raw_videos
 
-            if not page_items:
-                print("No more videos found.")
-                break
-                
-            all_videos.extend(page_items)
-            
-            pagination = data.get("data", {}).get("pagination", {})
-            if not pagination.get("has_more"):
-                print("End of results reached (has_more is false).")
-                break
-        else:
+        if response.status_code != 200:
             print(f"Error on page {page}: {response.status_code}")
             print(response.text)
+            return None, False
+
+        data = response.json()
+        # API returns videos as a dict with numeric keys "0", "1", etc.
+        page_items = normalize_list(data.get("data", {}).get("videos", {}))
+        pagination = data.get("data", {}).get("pagination", {})
+        return page_items, pagination.get("has_more")
+
+    for page, page_items, has_more in fetch_pages(fetch_page, pages, workers):
+        if page_items is None:
+            break
+
+        if not page_items:
+            print("No more videos found.")
+            break
+
+        all_videos.extend(page_items)
+
+        if not has_more:
+            print("End of results reached (has_more is false).")
             break
 
     if all_videos:
-        # Ensure data directory exists
-        os.makedirs("data", exist_ok=True)
-        file_path = "data/tiktok_popular_videos.json"
-        with open(file_path, "w") as f:
-            json.dump(all_videos, f, indent=2)
+        # Save to data folder
+        base_path = "data/tiktok_popular_videos.json"
+        if project_fields:
+            if keep_raw:
+                print(f"Full records kept in {save_json(all_videos, cold_path(base_path), 'gzip')}")
+            file_path = save_json([project(v, POPULAR_VIDEO_FIELDS) for v in all_videos], base_path, fmt)
+        else:
+            file_path = save_json(all_videos, base_path, fmt)
             
         print(f"\nSuccess! Total {len(all_videos)} videos saved to {file_path}")
+        if db_path:
+            kind, count = store_file(db_path, file_path)
+            print(f"Indexed {count} {kind} in {db_path}")
         
         # Display Summary
         print("\nTop Popular Videos:")
@@ -85,6 +99,12 @@ if __name__ == "__main__":
     parser.add_argument("--pages", type=int, default=1, help="Number of pages to fetch (default: 1, 10 videos per page)")
     parser.add_argument("--order", default="hot", choices=["like", "hot", "comment", "repost"], help="Sort order (default: hot/views)")
     parser.add_argument("--country", default="US", help="Country code (default: US)")
+    parser.add_argument("--workers", type=int, default=1, help="Pages to fetch in parallel (default: 1)")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=FORMATS, help=f"Output format (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--project", action="store_true", help="Store only the fields listed in projection.py")
+    parser.add_argument("--keep-raw", action="store_true", help="With --project, also keep the full list under data/raw/")
+    parser.add_argument("--db", help="Also upsert the saved records into this SQLite store (see social_store.py)")
     
     args = parser.parse_args()
-    get_popular_videos(period=args.period, pages=args.pages, order_by=args.order, country=args.country)
+    get_popular_videos(period=args.period, pages=args.pages, order_by=args.order, country=args.country, workers=args.workers, fmt=args.format,
+                       project_fields=args.project, keep_raw=args.keep_raw, db_path=args.db)
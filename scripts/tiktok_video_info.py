@@ -1,12 +1,19 @@
 import os
-import json
-import requests
-import sys
+import argparse
 
-def get_tiktok_video_info(url):
+from projection import cold_path, project_video_info_response
+from response_writer import DEFAULT_FORMAT, FORMATS, save_json, save_response
+from social_store import store_file
+from sociavault_client import get_client
+from tiktok_video_transcript import video_key
+
+def get_tiktok_video_info(url, fmt=DEFAULT_FORMAT, project_fields=False, keep_raw=False, db_path=None):
     """
     Fetches TikTok video information using the SociaVault API.
     Saves the full JSON response to the 'data' folder.
+
+    With project_fields, aweme_detail is reduced to projection.AWEME_FIELDS;
+    keep_raw additionally keeps the full response under data/raw/.
     """
     api_key = os.environ.get("SOCIAVAULT_API_KEY")
     if not api_key:
@@ -15,9 +22,9 @@ def get_tiktok_video_info(url):
 
     print(f"Fetching info (including transcript) for: {url}")
     
-    response = requests.get(
-        "https://api.sociavault.com/v1/scrape/tiktok/video-info",
-        headers={"X-API-Key": api_key},
+    client = get_client(api_key)
+    response = client.get(
+        "scrape/tiktok/video-info",
         params={
             "url": url,
             "get_transcript": True,  # Enabled to fetch the video text
@@ -26,17 +33,24 @@ def get_tiktok_video_info(url):
     )
 
     if response.status_code == 200:
-        data = response.json()
+        if response.from_cache:
+            print("Served from local cache (no credits used).")
         
-        # Ensure 'data' directory exists for storage
-        os.makedirs("data", exist_ok=True)
-        
-        # Save structured output to data folder
-        file_path = "data/tiktok_video_info.json"
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        base_path = "data/tiktok_video_info.json"
+        data = response.json()
+
+        if project_fields:
+            file_path = save_json(project_video_info_response(data), base_path, fmt)
+            if keep_raw:
+                print(f"Full response kept in {save_response(response, cold_path(base_path), 'gzip')}")
+        else:
+            # Save the response body as received instead of parse + re-dump
+            file_path = save_response(response, base_path, fmt)
             
         print(f"Success! Data saved to {file_path}")
+        if db_path:
+            kind, count = store_file(db_path, file_path)
+            print(f"Indexed {count} {kind} in {db_path}")
         
         # Display key summary info
         if 'data' in data and 'aweme_detail' in data['data']:
@@ -46,17 +60,24 @@ def get_tiktok_video_info(url):
         if 'data' in data and data['data'].get('transcript'):
             print("Transcript retrieved successfully.")
         else:
+            # Remember it so bulk transcript runs don't pay for the native tier again
+            if client.cache:
+                detail = (data.get('data') or {}).get('aweme_detail') or {}
+                for video_id in {video_key(url), detail.get('aweme_id')} - {None}:
+                    client.cache.mark_missing_transcript(video_id, "native")
             print("Note: Transcript was not available for this video.")
     else:
         print(f"Error: {response.status_code}")
         print(response.text)
 
 if __name__ == "__main__":
-    # URL is mandatory as the first argument
-    if len(sys.argv) < 2:
-        print("Usage: python3 tiktok_video_info.py <TIKTOK_URL>")
-        print("Example: python3 tiktok_video_info.py https://www.tiktok.com/t/ZP8bbhvaG/")
-        sys.exit(1)
-        
-    video_url = sys.argv[1]
-    get_tiktok_video_info(video_url)
+    parser = argparse.ArgumentParser(description="Fetch TikTok video info (including transcript).")
+    # URL is mandatory in the format: https://www.tiktok.com/t/ZP8bbhvaG/
+    parser.add_argument("url", help="The TikTok video URL")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=FORMATS, help=f"Output format (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--project", action="store_true", help="Store only the fields listed in projection.py")
+    parser.add_argument("--keep-raw", action="store_true", help="With --project, also keep the full response under data/raw/")
+    parser.add_argument("--db", help="Also upsert the saved records into this SQLite store (see social_store.py)")
+
+    args = parser.parse_args()
+    get_tiktok_video_info(args.url, fmt=args.format, project_fields=args.project, keep_raw=args.keep_raw, db_path=args.db)
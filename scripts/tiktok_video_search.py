@@ -1,14 +1,173 @@
 import os
 import json
-import requests
 import argparse
 import sys
 import re
+import gzip
+
+import requests
+
+from projection import cold_path, project_search_item, project_search_response
+from response_writer import DEFAULT_FORMAT, FORMATS, save_json, save_response
+from social_store import DEFAULT_DB_PATH, SocialStore, store_file
+from sociavault_client import get_client, normalize_list
+
+SEARCH_ENDPOINT = "scrape/tiktok/search/keyword"
+
+
+def query_slug(query):
+    """Create a filename-safe slug from the query."""
+    slug = re.sub(r'[^\w\s-]', '', query).strip().lower()
+    return re.sub(r'[-\s]+', '_', slug)
+
+
+def load_known_ids(db_path, query):
+    """aweme_ids already stored for this query in the social store."""
+    store = SocialStore(db_path)
+    try:
+        known_ids = store.known_ids("tiktok", query)
+    finally:
+        store.close()
+    print(f"Incremental: {len(known_ids)} videos already stored for this query")
+    return known_ids
+
+
+def aweme_id(item):
+    return (item.get('aweme_info') or {}).get('aweme_id')
+
+
+def iter_search_items(client, query, date_posted="yesterday", sort_by="most-liked", region="US", max_results=None,
+                      known_ids=None):
+    """
+    Yields search items one page at a time, following the API cursor until
+    has_more is false or max_results items have been read.
+    Raises requests.HTTPError if a page request fails.
 
-def search_tiktok_videos(query, date_posted="yesterday", sort_by="most-liked", region="US"):
+    With known_ids, items already seen for this query are skipped but still
+    count toward max_results, so an incremental run never requests more
+    pages than a plain one. Under date-posted sort, paging also stops at the
+    first page made up entirely of known items, since every later page is
+    older still.
+    """
+    params = {
+        "query": query,
+        "date_posted": date_posted,
+        "sort_by": sort_by,
+        "region": region,
+        "trim": True
+    }
+    scanned = 0
+    page = 1
+
+    while True:
+        response = client.get(SEARCH_ENDPOINT, params=params)
+        response.raise_for_status()
+        data = response.json().get('data', {})
+
+        items = normalize_list(data.get('search_item_list', []))
+        if not items:
+            return
+
+        if known_ids is not None and sort_by == "date-posted" and all(aweme_id(item) in known_ids for item in items):
+            print("Page contains only known videos, stopping.")
+            return
+
+        for item in items:
+            if known_ids is None or aweme_id(item) not in known_ids:
+                yield item
+            scanned += 1
+            if max_results and scanned >= max_results:
+                return
+
+        cursor = data.get('cursor')
+        if not data.get('has_more') or cursor is None:
+            return
+
+        page += 1
+        print(f"Requesting page {page} (cursor={cursor})...")
+        params["cursor"] = cursor
+
+
+def stream_tiktok_search(query, max_results, date_posted="yesterday", sort_by="most-liked", region="US",
+                         project_fields=False, keep_raw=False, db_path=None, incremental=False):
+    """
+    Streams up to max_results search items to an NDJSON file (one item per
+    line), writing each page as it arrives instead of holding the full
+    result set in memory.
+
+    With project_fields, only the fields in projection.AWEME_FIELDS are
+    written; keep_raw additionally streams the full items to a gzipped cold
+    file under data/raw/. With incremental, only videos not yet in the
+    social store at db_path are written (see iter_search_items).
+    """
+    api_key = os.environ.get("SOCIAVAULT_API_KEY")
+    if not api_key:
+        print("Error: SOCIAVAULT_API_KEY environment variable not set.")
+        return
+
+    print(f"Streaming search for: '{query}' (up to {max_results} results)")
+    print(f"Parameters: date_posted={date_posted}, sort_by={sort_by}, region={region}")
+    known_ids = load_known_ids(db_path, query) if incremental else None
+
+    os.makedirs("data", exist_ok=True)
+    file_path = f"data/tiktok_search_{query_slug(query)}.ndjson"
+
+    raw_file = None
+    if project_fields and keep_raw:
+        raw_path = cold_path(file_path) + ".gz"
+        os.makedirs(os.path.dirname(raw_path), exist_ok=True)
+        raw_file = gzip.open(raw_path, "wt", encoding="utf-8")
+
+    count = 0
+    first_item = None
+    # Line-buffered so each record is on disk as soon as it is written
+    with open(file_path, "w", buffering=1) as f:
+        try:
+            for item in iter_search_items(get_client(api_key), query, date_posted, sort_by, region, max_results,
+                                          known_ids):
+                if raw_file:
+                    raw_file.write(json.dumps(item, separators=(",", ":")) + "\n")
+                if project_fields:
+                    item = project_search_item(item)
+                f.write(json.dumps(item, separators=(",", ":")) + "\n")
+                count += 1
+                if first_item is None:
+                    first_item = item.get('aweme_info', {})
+        except requests.HTTPError as e:
+            print(f"Error: {e.response.status_code}")
+            print(e.response.text)
+        except requests.RequestException as e:
+            # Connection errors and timeouts mid-stream: keep what was written so far
+            print(f"Error: {type(e).__name__}: {e}")
+        finally:
+            if raw_file:
+                raw_file.close()
+
+    print(f"Saved {count} {'new ' if incremental else ''}videos to {file_path}")
+    if db_path:
+        kind, count = store_file(db_path, file_path, query)
+        print(f"Indexed {count} {kind} in {db_path}")
+    if raw_file:
+        print(f"Full records kept in {raw_path}")
+
+    if first_item:
+        print("\nTop Result:")
+        print(f"- Description: {first_item.get('desc')}")
+        print(f"- Author: {first_item.get('author', {}).get('unique_id')}")
+        print(f"- Views: {first_item.get('statistics', {}).get('play_count')}")
+
+
+def search_tiktok_videos(query, date_posted="yesterday", sort_by="most-liked", region="US", fmt=DEFAULT_FORMAT,
+                         project_fields=False, keep_raw=False, db_path=None, incremental=False):
     """
     Searches for TikTok videos by keyword using the SociaVault API.
     Saves the JSON response to the 'data' folder.
+
+    With project_fields, each aweme_info is reduced to the fields in
+    projection.AWEME_FIELDS before saving; keep_raw additionally keeps the
+    untouched response as a gzipped cold file under data/raw/. With
+    incremental, reports which results are new relative to the social store
+    at db_path.
     """
     api_key = os.environ.get("SOCIAVAULT_API_KEY")
     if not api_key:
@@ -17,10 +176,10 @@ def search_tiktok_videos(query, date_posted="yesterday", sort_by="most-liked", r
 
     print(f"Searching for: '{query}'")
     print(f"Parameters: date_posted={date_posted}, sort_by={sort_by}, region={region}")
-    
-    response = requests.get(
-        "https://api.sociavault.com/v1/scrape/tiktok/search/keyword",
-        headers={"X-API-Key": api_key},
+    known_ids = load_known_ids(db_path, query) if incremental else None
+
+    response = get_client(api_key).get(
+        SEARCH_ENDPOINT,
         params={
             "query": query,
             "date_posted": date_posted,
@@ -31,32 +190,30 @@ def search_tiktok_videos(query, date_posted="yesterday", sort_by="most-liked", r
     )
 
     if response.status_code == 200:
+        base_path = f"data/tiktok_search_{query_slug(query)}.json"
         data = response.json()
-        
-        # Ensure data directory exists
-        os.makedirs("data", exist_ok=True)
-        
-        # Create a filename-safe slug from the query
-        slug = re.sub(r'[^\w\s-]', '', query).strip().lower()
-        slug = re.sub(r'[-\s]+', '_', slug)
-        
-        file_path = f"data/tiktok_search_{slug}.json"
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # The API can return search_item_list as a list or a dict with numeric keys
+        items = normalize_list(data.get('data', {}).get('search_item_list', []))
+
+        if project_fields:
+            file_path = save_json(project_search_response(data, items), base_path, fmt)
+            if keep_raw:
+                print(f"Full response kept in {save_response(response, cold_path(base_path), 'gzip')}")
+        else:
+            # Save the response body as received instead of parse + re-dump
+            file_path = save_response(response, base_path, fmt)
             
         print(f"Success! Search results saved to {file_path}")
+        if db_path:
+            kind, count = store_file(db_path, file_path, query)
+            print(f"Indexed {count} {kind} in {db_path}")
         
         # Summary of results
-        # The API can return search_item_list as a list or a dict with numeric keys
-        raw_items = data.get('data', {}).get('search_item_list', [])
-        if isinstance(raw_items, dict):
-            # Sort by keys if they are numeric strings to maintain order
-            sorted_keys = sorted(raw_items.keys(), key=lambda x: int(x) if x.isdigit() else x)
-            items = [raw_items[k] for k in sorted_keys]
-        else:
-            items = raw_items
 
         print(f"Found {len(items)} videos.")
+        if known_ids is not None:
+            new_count = sum(1 for item in items if aweme_id(item) not in known_ids)
+            print(f"{new_count} new since the last run ({len(items) - new_count} already stored).")
         
         if items:
             print("\nTop Result:")
@@ -74,6 +231,21 @@ if __name__ == "__main__":
     parser.add_argument("--date", default="yesterday", choices=["yesterday", "this-week", "this-month", "last-3-months", "last-6-months", "all-time"], help="Time frame (default: yesterday)")
     parser.add_argument("--sort", default="most-liked", choices=["relevance", "most-liked", "date-posted"], help="Sort order (default: most-liked)")
     parser.add_argument("--region", default="US", help="Region code (default: US)")
+    parser.add_argument("--max-results", type=int, help="Follow pagination up to N results and stream them to an NDJSON file")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=FORMATS, help=f"Output format for single-page mode (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--project", action="store_true", help="Store only the fields listed in projection.py")
+    parser.add_argument("--keep-raw", action="store_true", help="With --project, also keep the full response under data/raw/")
+    parser.add_argument("--db", help="Also upsert the saved records into this SQLite store (see social_store.py)")
+    parser.add_argument("--incremental", action="store_true", help="Skip videos already stored for this query (they still count toward --max-results); with --sort date-posted, stop paging at the first fully known page")
     
     args = parser.parse_args()
-    search_tiktok_videos(args.query, date_posted=args.date, sort_by=args.sort, region=args.region)
+    if args.incremental and not args.db:
+        args.db = DEFAULT_DB_PATH
+    if args.max_results:
+        stream_tiktok_search(args.query, args.max_results, date_posted=args.date, sort_by=args.sort, region=args.region,
+                             project_fields=args.project, keep_raw=args.keep_raw, db_path=args.db,
+                             incremental=args.incremental)
+    else:
+        search_tiktok_videos(args.query, date_posted=args.date, sort_by=args.sort, region=args.region, fmt=args.format,
+                             project_fields=args.project, keep_raw=args.keep_raw, db_path=args.db,
+                             incremental=args.incremental)
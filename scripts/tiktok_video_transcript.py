@@ -1,13 +1,54 @@
 import os
-import json
-import requests
 import argparse
+import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from response_cache import NO_TRANSCRIPT_TTL
+from response_writer import DEFAULT_FORMAT, FORMATS, load_json, output_path, save_response
+from social_store import store_file
+from sociavault_client import get_client, normalize_list
+
+TRANSCRIPT_ENDPOINT = "scrape/tiktok/transcript"
+TRANSCRIPTS_DIR = "data/transcripts"
+
+
+def transcript_params(url, use_ai=False):
+    return {
+        "url": url,
+        "language": "en",
+        "use_ai_as_fallback": use_ai
+    }
+
+def skip_reason(cache, key, use_ai):
+    """
+    Why a video needn't be requested, from the negative transcript cache:
+    it had no native transcript and AI is off, or even the AI tier found none.
+    """
+    missing = cache.missing_transcript(key) if cache else None
+    if missing == "ai":
+        return "no transcript, even with AI fallback"
+    if missing == "native" and not use_ai:
+        return "no native transcript (use --use-ai)"
+    return None
+
+
+def record_missing_transcript(cache, url, data, use_ai):
+    """Negative-cache a video whose transcript came back empty, by URL key and video id."""
+    if cache is None:
+        return
+    for video_id in {video_key(url), (data.get('data') or {}).get('id')} - {None}:
+        cache.mark_missing_transcript(video_id, "ai" if use_ai else "native")
+
 
-def get_tiktok_transcript(url, use_ai=False):
+def get_tiktok_transcript(url, use_ai=False, fmt=DEFAULT_FORMAT, db_path=None):
     """
     Fetches the transcript for a TikTok video using the SociaVault API.
     Saves the JSON response to the 'data' folder.
+
+    Videos recently found to have no transcript at the requested tier are
+    skipped without a request (see response_cache.NO_TRANSCRIPT_TTL).
     """
     api_key = os.environ.get("SOCIAVAULT_API_KEY")
     if not api_key:
@@ -16,45 +57,169 @@ def get_tiktok_transcript(url, use_ai=False):
 
     print(f"Fetching transcript for: {url}")
     print(f"AI Fallback: {'Enabled (10 credits)' if use_ai else 'Disabled (1 credit)'}")
-    
-    response = requests.get(
-        "https://api.sociavault.com/v1/scrape/tiktok/transcript",
-        headers={"X-API-Key": api_key},
-        params={
-            "url": url,
-            "language": "en",
-            "use_ai_as_fallback": use_ai
-        }
-    )
+
+    client = get_client(api_key)
+    reason = skip_reason(client.cache, video_key(url), use_ai)
+    if reason:
+        print(f"Skipped: {reason}, checked within the last {NO_TRANSCRIPT_TTL // 86400} days.")
+        return
+
+    response = client.get(TRANSCRIPT_ENDPOINT, params=transcript_params(url, use_ai))
 
     if response.status_code == 200:
-        data = response.json()
-        
-        # Ensure data directory exists
-        os.makedirs("data", exist_ok=True)
+        if response.from_cache:
+            print("Served from local cache (no credits used).")
         
-        # Save to data folder
-        file_path = "data/tiktok_transcript.json"
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Save the response body as received
+        file_path = save_response(response, "data/tiktok_transcript.json", fmt)
             
         print(f"Success! Transcript saved to {file_path}")
+        if db_path:
+            kind, count = store_file(db_path, file_path)
+            print(f"Indexed {count} {kind} in {db_path}")
         
+        data = response.json()
         if 'data' in data and data['data'].get('transcript'):
             print("\nTranscript Preview:")
             # Show first 200 chars
             print(data['data']['transcript'][:200] + "...")
         else:
+            record_missing_transcript(client.cache, url, data, use_ai)
             print("Note: Transcript data was empty.")
     else:
         print(f"Error: {response.status_code}")
         print(response.text)
 
+def video_key(url):
+    """Video id from a full TikTok URL; short links fall back to a slug of the URL."""
+    match = re.search(r"/video/(\d+)", url)
+    if match:
+        return match.group(1)
+    return re.sub(r"\W+", "_", url.split("://")[-1]).strip("_")
+
+
+def record_url(record):
+    """Canonical video URL for a search item, aweme record or popular-video entry."""
+    aweme = record.get("aweme_info", record)
+    author = (aweme.get("author") or {}).get("unique_id")
+    if aweme.get("aweme_id") and author:
+        return f"https://www.tiktok.com/@{author}/video/{aweme['aweme_id']}"
+    return aweme.get("share_url") or aweme.get("item_url")
+
+
+def load_video_urls(path):
+    """
+    Read video URLs from a text file (one per line, # comments allowed) or a
+    saved result file: keyword search (.json/.json.gz/.ndjson), popular
+    videos, or a stock research file with a "videos" list.
+    """
+    if ".ndjson" in path:
+        with open(path) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    elif path.endswith((".json", ".json.gz")):
+        data = load_json(path)
+        if isinstance(data, dict):
+            data = data.get("videos") or normalize_list(data.get("data", {}).get("search_item_list", []))
+        records = data
+    else:
+        with open(path) as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return [url for url in map(record_url, records) if url]
+
+
+def bulk_fetch_transcripts(urls, use_ai=False, workers=4, fmt=DEFAULT_FORMAT, out_dir=TRANSCRIPTS_DIR, db_path=None):
+    """
+    Fetches transcripts for many videos with up to `workers` requests in flight.
+
+    URLs are deduplicated by video id and each response is saved to
+    out_dir/<video_id>.json. A file only appears once its response is fully
+    written, so re-running after a crash skips every video already on disk.
+
+    Videos in the negative transcript cache go straight to the right tier:
+    skipped without AI, or refetched with AI even if an empty record exists.
+    """
+    api_key = os.environ.get("SOCIAVAULT_API_KEY")
+    if not api_key:
+        print("Error: SOCIAVAULT_API_KEY environment variable not set.")
+        return
+
+    targets = {}
+    for url in urls:
+        targets.setdefault(video_key(url), url)
+
+    client = get_client(api_key)
+    cache = client.cache
+
+    todo, skipped = {}, 0
+    for key, url in targets.items():
+        if skip_reason(cache, key, use_ai):
+            skipped += 1
+        elif not os.path.exists(output_path(f"{out_dir}/{key}.json", fmt)):
+            todo[key] = url
+        elif use_ai and cache and cache.missing_transcript(key) == "native":
+            # Existing record is an empty native result; upgrade it with AI
+            todo[key] = url
+    print(f"{len(urls)} URLs, {len(targets)} unique videos, {len(targets) - len(todo) - skipped} already fetched, "
+          f"{skipped} known to have no transcript.")
+    print(f"AI Fallback: {'Enabled (10 credits)' if use_ai else 'Disabled (1 credit)'}")
+    if not todo:
+        return
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    def fetch(key, url):
+        response = client.get(TRANSCRIPT_ENDPOINT, params=transcript_params(url, use_ai))
+        if response.status_code != 200:
+            return None, f"error {response.status_code}"
+        # Write to a temporary name first so a crash never leaves a partial record
+        final_path = output_path(f"{out_dir}/{key}.json", fmt)
+        part_path = output_path(f"{out_dir}/{key}.json.part", fmt)
+        try:
+            os.replace(save_response(response, part_path, fmt), final_path)
+        finally:
+            # A failed write leaves nothing behind; the body stays cached for the re-run
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        data = response.json()
+        if (data.get('data') or {}).get('transcript'):
+            return final_path, "ok"
+        record_missing_transcript(cache, url, data, use_ai)
+        return final_path, "empty transcript"
+
+    counts = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch, key, url): key for key, url in todo.items()}
+        for i, future in enumerate(as_completed(futures), 1):
+            key = futures[future]
+            try:
+                file_path, status = future.result()
+            except Exception as e:
+                file_path, status = None, f"error {e}"
+            counts[status.split(" ")[0]] = counts.get(status.split(" ")[0], 0) + 1
+            print(f"[{i}/{len(todo)}] {key}: {status}")
+            if file_path and db_path:
+                store_file(db_path, file_path)
+
+    print(f"\nDone. Saved to {out_dir}/: {counts.get('ok', 0)} with transcript, "
+          f"{counts.get('empty', 0)} empty, {counts.get('error', 0)} failed (re-run to retry).")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch TikTok transcript.")
     # URL is mandatory in the format: https://www.tiktok.com/t/ZP8bbhvaG/
-    parser.add_argument("url", help="The TikTok video URL")
+    parser.add_argument("url", nargs="?", help="The TikTok video URL")
+    parser.add_argument("--input", help="Bulk mode: file of URLs (one per line) or a saved search/popular/research result file")
     parser.add_argument("--use-ai", action="store_true", help="Enable AI fallback (costs 10 credits instead of 1)")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=FORMATS, help=f"Output format (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--db", help="Also upsert the saved records into this SQLite store (see social_store.py)")
+    parser.add_argument("--workers", type=int, default=4, help="Bulk mode: transcripts to fetch in parallel (default: 4)")
+    parser.add_argument("--out-dir", default=TRANSCRIPTS_DIR, help=f"Bulk mode: output directory (default: {TRANSCRIPTS_DIR})")
     
     args = parser.parse_args()
-    get_tiktok_transcript(args.url, use_ai=args.use_ai)
+    if args.input:
+        bulk_fetch_transcripts(load_video_urls(args.input), use_ai=args.use_ai, workers=args.workers, fmt=args.format,
+                               out_dir=args.out_dir, db_path=args.db)
+    elif args.url:
+        get_tiktok_transcript(args.url, use_ai=args.use_ai, fmt=args.format, db_path=args.db)
+    else:
+        parser.error("either a URL or --input is required")
@@ -0,0 +1,182 @@
+"""
+Timestamp parsing and date-window filtering for API records.
+
+Every platform dates its records differently: Reddit sends epoch floats
+(created_utc), Threads epoch ints (taken_at), Twitter its legacy
+"Wed Oct 10 20:19:24 +0000 2018" strings or ISO 8601, YouTube ISO dates.
+to_epoch() turns any of them into epoch seconds, picking the parser from
+the shape of the value instead of trying formats under try/except, and
+caches parsed strings so a timeline filtered once per ticker is parsed once.
+
+Filtering a window:
+    - since(records, cutoff, key) keeps the records at or after the cutoff.
+      With newest_first=True (account timelines, "new" listings) it stops
+      reading once the stream has passed the cutoff, so the tail of a long
+      timeline is never parsed.
+    - TimeColumn(records, key) parses a list once into a numeric column
+      for repeated window queries; when the column is in time order a
+      query is a binary search.
+"""
+
+import calendar
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1)}
+
+# Epoch values above this are in milliseconds (year 5138 in seconds)
+_MILLISECONDS = 10 ** 11
+
+# Out-of-window records in a row before a newest-first stream is considered
+# past the cutoff; tolerates a pinned tweet or sticky post at the top.
+DEFAULT_PATIENCE = 3
+
+
+def _parse_twitter(text):
+    """Twitter legacy format, parsed by hand: strptime is ~10x slower."""
+    parts = text.split()
+    if len(parts) != 6 or parts[1] not in _MONTHS:
+        return None
+    _, month, day, clock, offset, year = parts
+    try:
+        hour, minute, second = clock.split(":")
+        seconds = calendar.timegm((int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second)))
+        shift = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60
+    except ValueError:
+        return None
+    return seconds - shift if offset[0] == "+" else seconds + shift
+
+
+@lru_cache(maxsize=65536)
+def _parse_text(text):
+    text = text.strip()
+    if not text:
+        return None
+    if text[0].isalpha():
+        return _parse_twitter(text)
+    if text.replace(".", "", 1).isdigit():
+        return _from_number(float(text))
+    try:
+        return int(datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return None
+
+
+def _from_number(value):
+    if value <= 0:
+        return None
+    return int(value / 1000 if value > _MILLISECONDS else value)
+
+
+def to_epoch(value):
+    """Epoch seconds for an epoch (s or ms), ISO 8601 or Twitter legacy timestamp; None if unparseable."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return _from_number(value)
+    if isinstance(value, str):
+        return _parse_text(value)
+    return None
+
+
+def field_getter(*fields):
+    """Key function reading the first non-empty of `fields`; "a.b" reads a nested field."""
+    paths = [field.split(".") for field in fields]
+
+    def get(record):
+        for path in paths:
+            value = record
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            if value:
+                return value
+        return None
+    return get
+
+
+def cutoff_days(days, now=None):
+    """Epoch seconds `days` before now (local time, like the fetch scripts' --days)."""
+    return ((now or datetime.now()) - timedelta(days=days)).timestamp()
+
+
+def since(records, cutoff, key, newest_first=False, patience=DEFAULT_PATIENCE):
+    """
+    Records dated at or after `cutoff` (epoch seconds), in their original order.
+
+    key(record) returns the raw timestamp. Undated records are dropped.
+    With newest_first=True reading stops after `patience` consecutive
+    records older than the cutoff.
+    """
+    kept = []
+    misses = 0
+    for record in records:
+        t = to_epoch(key(record))
+        if t is not None and t >= cutoff:
+            kept.append(record)
+            misses = 0
+        elif newest_first:
+            misses += 1
+            if misses >= patience:
+                break
+    return kept
+
+
+class TimeColumn:
+    """
+    Records with their timestamps parsed once into a numeric column.
+
+    Undated records are left out. If the column is in ascending or
+    descending time order (sorted listings, timelines) window queries are a
+    binary search; otherwise a scan over floats.
+    """
+
+    def __init__(self, records, key):
+        self.records = []
+        self.times = array("d")
+        for record in records:
+            t = to_epoch(key(record))
+            if t is not None:
+                self.records.append(record)
+                self.times.append(t)
+        times = self.times
+        if all(times[i] >= times[i + 1] for i in range(len(times) - 1)):
+            self.order = "desc"
+        elif all(times[i] <= times[i + 1] for i in range(len(times) - 1)):
+            self.order = "asc"
+        else:
+            self.order = None
+
+    def since(self, cutoff):
+        """Records dated at or after `cutoff`, in their original order."""
+        if self.order == "asc":
+            return self.records[bisect_left(self.times, cutoff):]
+        if self.order == "desc":
+            # bisect needs ascending keys: search a negated view of the column
+            return self.records[:bisect_right(_Negated(self.times), -cutoff)]
+        times = self.times
+        return [record for i, record in enumerate(self.records) if times[i] >= cutoff]
+
+    def range(self):
+        """(oldest, newest) epoch seconds, or None if nothing is dated."""
+        if not self.times:
+            return None
+        return min(self.times), max(self.times)
+
+    def __len__(self):
+        return len(self.records)
+
+
+class _Negated:
+    """Read-only negated view of a descending column, for bisect."""
+
+    def __init__(self, times):
+        self.times = times
+
+    def __getitem__(self, i):
+        return -self.times[i]
+
+    def __len__(self):
+        return len(self.times)